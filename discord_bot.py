@@ -1,42 +1,88 @@
 # discord_bot.py
 #
 ''' ----- imports ----- '''
+import sys
+import time
+import importlib.abc
+
+STARTUP_STARTED = time.perf_counter()
+STARTUP_TRACKED_IMPORTS = ("discord", "yt_dlp", "spotipy", "google.generativeai", "bs4", "flask")
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    # Times the first import of each tracked package, including everything it pulls in, wherever it happens
+    def __init__(self, names):
+        self.names = set(names)
+        self.timings = {}
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self.names or fullname in self.timings:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            exec_module = spec.loader.exec_module
+
+            def timed_exec_module(module):
+                start = time.perf_counter()
+                try:
+                    exec_module(module)
+                finally:
+                    self.timings[fullname] = time.perf_counter() - start
+
+            spec.loader.exec_module = timed_exec_module
+        return spec
+
+import_timer = ImportTimer(STARTUP_TRACKED_IMPORTS)
+sys.meta_path.insert(0, import_timer)
+
 import discord
 import os
 import asyncio
+import atexit
+import contextvars
+import contextlib
+import copy
+import cProfile
+import functools
+import hashlib
 import random
 import requests
 import pytz
 import re
 import logging
+import logging.handlers
+import pstats
 import html
 import json
 import io
 import uuid
 import string
-import yt_dlp
-from yt_dlp import YoutubeDL
+import traceback
+import types
+import tracemalloc
 import shutil
-import spotipy
+import sqlite3
 import threading
 import ssl
-import time
 import subprocess
-import google.generativeai as genai
 from discord import app_commands, Forbidden, HTTPException, NotFound
 from discord.ext import commands, tasks
 from discord.ext.commands import has_permissions, CheckFailure
 from discord.ui import Modal, TextInput, View, Button, Select
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone as pytz_timezone
-from flask import Flask, redirect, request, session, render_template, url_for, jsonify
-from spotipy import Spotify
-from spotipy.oauth2 import SpotifyClientCredentials
 from threading import Thread
 from asyncio import Lock
-from collections import deque
+from collections import deque, OrderedDict
+from queue import SimpleQueue
+from collections.abc import MutableMapping
 
 ''' ----- imports ----- '''
 #
@@ -50,8 +96,81 @@ intents = discord.Intents.all()
 
 bot = commands.Bot(command_prefix="$", intents=intents, application_id=os.getenv("DISCORD_CLIENT_ID"))
 genaitoken = os.getenv("GOOGLE_API_KEY")
-genai.configure(api_key=genaitoken)
-model = genai.GenerativeModel('gemini-1.5-flash-8b')
+GEMINI_MODEL = 'gemini-1.5-flash-8b'
+
+# Imported and configured on first $gemini, so startup neither pays for the SDK nor needs the key
+@functools.cache
+def gemini_model():
+    if not genaitoken:
+        raise RuntimeError("GOOGLE_API_KEY is not set")
+    import google.generativeai as genai
+    genai.configure(api_key=genaitoken)
+    return genai.GenerativeModel(GEMINI_MODEL)
+
+class StartupReport:
+    # Boot timeline: marks are seconds since the first import, phases are durations with the REST calls they made
+    def __init__(self, started):
+        self.started = started
+        self.marks = {}
+        self.phases = {}
+        self.completed = False
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def mark(self, name):
+        if not self.completed:
+            self.marks.setdefault(name, self.elapsed())
+
+    @staticmethod
+    def rest_calls(feature):
+        # Data phases run at import, before REST accounting exists
+        accounting = globals().get("rest_accounting")
+        return accounting.total_calls(feature) if accounting else 0
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if self.completed:
+            yield
+            return
+        # Phases run concurrently, so each one attributes its REST calls to its own feature instead of diffing the total
+        feature = f"startup:{name}"
+        token = rest_feature.set(feature) if "rest_feature" in globals() else None
+        start = time.perf_counter()
+        rest_before = self.rest_calls(feature)
+        try:
+            yield
+        finally:
+            self.phases[name] = {"seconds": time.perf_counter() - start, "rest_calls": self.rest_calls(feature) - rest_before}
+            if token is not None:
+                rest_feature.reset(token)
+
+    def as_dict(self):
+        return {
+            "boot": datetime.now().isoformat(timespec="seconds"),
+            "total_seconds": self.marks.get("startup_complete", self.elapsed()),
+            "imports": dict(import_timer.timings),
+            "marks": dict(self.marks),
+            "phases": dict(self.phases),
+            "guilds": len(bot.guilds),
+            "ticket_panels": len(ticket_embeds or {}),
+        }
+
+    def finish(self):
+        if self.completed:
+            return None
+        self.mark("startup_complete")
+        self.completed = True
+        report = self.as_dict()
+        logging.info(f"Startup report: {json.dumps(report)}")
+        try:
+            with open(STARTUP_REPORT_FILE, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=2)
+        except OSError as e:
+            logging.warning(f"Could not write startup report: {e}")
+        return report
+
+startup_report = StartupReport(STARTUP_STARTED)
 
 ''' ----- Bot Settings ----- '''
 #
@@ -59,25 +178,74 @@ model = genai.GenerativeModel('gemini-1.5-flash-8b')
 #
 ''' ----- Data ----- '''
 
-BOT_DATA_PATH = os.path.join("bot", "bot_data")
+BOT_DATA_PATH = os.getenv("BOT_DATA_PATH", os.path.join("bot", "bot_data"))
 CONSOLELOGS_PATH = os.path.join(BOT_DATA_PATH, "consolelogs")
 TICKETDATA = os.path.join(BOT_DATA_PATH, "ticketdata")
 DATAFILE_PATH = os.path.join(BOT_DATA_PATH, "datafile")
-LANGUAGE_GUILDS_SETTINGS_FILE = os.path.join("bot", "bot_data", "datafile", "language_guilds_settings.json")
+LANGUAGE_GUILDS_SETTINGS_FILE = os.path.join(DATAFILE_PATH, "language_guilds_settings.json")
 
 os.makedirs(CONSOLELOGS_PATH, exist_ok=True)
 os.makedirs(TICKETDATA, exist_ok=True)
 os.makedirs(DATAFILE_PATH, exist_ok=True)
 
-log_filename = datetime.now().strftime(os.path.join(CONSOLELOGS_PATH, "%Y-%m-%d_%H-%M-%S.txt"))
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_filename, encoding="utf-8"),
-        logging.StreamHandler()
-    ]
-)
+LOG_FILE = os.path.join(CONSOLELOGS_PATH, "bot.log")
+STARTUP_REPORT_FILE = os.path.join(CONSOLELOGS_PATH, "startup_report.json")
+LOG_ROTATION = os.getenv("LOG_ROTATION", "size")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 10 * 1024 * 1024))
+LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", "midnight")
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 14))
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+TEXT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+def build_log_file_handler(path=LOG_FILE):
+    if LOG_ROTATION == "time":
+        handler = logging.handlers.TimedRotatingFileHandler(path, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+    else:
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8")
+    handler.setFormatter(JsonLinesFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_LOG_FORMAT))
+    return handler
+
+def prune_legacy_console_logs(keep=LOG_BACKUP_COUNT):
+    # Older releases started a new timestamped .txt file on every boot; keep only the newest few.
+    legacy_logs = sorted(
+        (os.path.join(CONSOLELOGS_PATH, name) for name in os.listdir(CONSOLELOGS_PATH) if name.endswith(".txt")),
+        key=os.path.getmtime
+    )
+    for path in legacy_logs[:-keep] if keep else legacy_logs:
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Failed to remove old log file {path}: {e}")
+
+def setup_logging():
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+    log_queue = SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, build_log_file_handler(), stream_handler, respect_handler_level=True)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+prune_legacy_console_logs()
+log_listener = setup_logging()
 logger = logging.getLogger()
 
 EMBEDS_FILE = os.path.join(TICKETDATA, "ticket_embeds.json")
@@ -86,166 +254,818 @@ LOG_CHANNELS_FILE = os.path.join(DATAFILE_PATH, "logchannels.json")
 WORKSPACE = "workspace"
 
 ticket_embeds = {}
-welcome_messages = {}
-logging_channel_ids = {}
+ticket_panel_messages = {}
 invite_cache = {}
 
-def load_ticket_embeds():
-    global ticket_embeds
-    try:
-        if not os.path.exists(EMBEDS_FILE):
-            os.makedirs(TICKETDATA, exist_ok=True)
-            with open(EMBEDS_FILE, "w") as file:
-                json.dump({}, file, indent=4)
-            logging.info("Created a new empty ticket_embeds.json file.")
-            ticket_embeds = {}
+DATABASE_FILE = os.path.join(DATAFILE_PATH, "bot_data.db")
+
+class TicketPanel:
+    __slots__ = ("user_id", "guild_id", "channel_id", "message_id", "created_at", "title", "description", "button_label", "category_id")
+
+    def __init__(self, user_id=None, guild_id=None, channel_id=None, message_id=None, created_at=None,
+                 title=None, description=None, button_label=None, category_id=None):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.created_at = created_at
+        self.title = title
+        self.description = description
+        self.button_label = button_label
+        self.category_id = category_id
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+class LogChannelConfig:
+    __slots__ = ("channel_id", "user_id", "timestamp")
+
+    def __init__(self, channel_id=None, user_id=None, timestamp=None):
+        self.channel_id = channel_id
+        self.user_id = user_id
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+class WelcomeConfig:
+    __slots__ = ("channel_id", "user_id", "title", "desc", "message_type", "image_url", "color", "timestamp")
+
+    def __init__(self, channel_id=None, user_id=None, title=None, desc=None, message_type=None,
+                 image_url=None, color=None, timestamp=None):
+        self.channel_id = channel_id
+        self.user_id = user_id
+        self.title = title
+        self.desc = desc
+        self.message_type = message_type
+        self.image_url = image_url
+        self.color = color
+        self.timestamp = timestamp
+
+    @property
+    def has_message(self):
+        return self.message_type is not None or self.title is not None
+
+    def message_dict(self):
+        if not self.has_message:
+            return None
+        message = {"title": self.title, "desc": self.desc, "type": self.message_type, "image_url": self.image_url}
+        if self.color is not None:
+            message["color"] = self.color
+        return message
+
+    @classmethod
+    def from_dict(cls, data):
+        message = data.get("welcome_message") or {}
+        return cls(
+            channel_id=data.get("channel_id"),
+            user_id=data.get("user_id"),
+            title=message.get("title"),
+            desc=message.get("desc"),
+            message_type=message.get("type"),
+            image_url=message.get("image_url"),
+            color=message.get("color"),
+            timestamp=data.get("timestamp")
+        )
+
+    def to_dict(self):
+        data = {}
+        if self.channel_id is not None:
+            data["channel_id"] = self.channel_id
+        if self.user_id is not None:
+            data["user_id"] = self.user_id
+        message = self.message_dict()
+        if message is not None:
+            data["welcome_message"] = message
+        if self.timestamp is not None:
+            data["timestamp"] = self.timestamp
+        return data
+
+class BotStorage:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS ticket_embeds (
+            ticket_id TEXT PRIMARY KEY,
+            user_id INTEGER,
+            guild_id INTEGER,
+            channel_id INTEGER,
+            message_id INTEGER,
+            created_at TEXT,
+            title TEXT,
+            description TEXT,
+            button_label TEXT,
+            category_id INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS ticket_embeds_guild_id ON ticket_embeds (guild_id);
+        CREATE TABLE IF NOT EXISTS log_channels (
+            guild_id INTEGER PRIMARY KEY,
+            channel_id INTEGER,
+            user_id INTEGER,
+            timestamp TEXT
+        );
+        CREATE TABLE IF NOT EXISTS welcome_messages (
+            guild_id INTEGER PRIMARY KEY,
+            channel_id INTEGER,
+            user_id INTEGER,
+            welcome_message TEXT,
+            timestamp TEXT
+        );
+        CREATE TABLE IF NOT EXISTS guild_languages (
+            guild_id INTEGER PRIMARY KEY,
+            language TEXT NOT NULL
+        );
+    """
+    TICKET_COLUMNS = ("user_id", "guild_id", "channel_id", "message_id", "created_at", "title", "description", "button_label", "category_id")
+
+    def __init__(self, path):
+        self.path = path
+        # Reentrant so writes made inside transaction() can take it again on the same thread
+        self.lock = threading.RLock()
+        self.in_transaction = False
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(self.SCHEMA)
+
+    def execute(self, query, params=()):
+        with self.lock, self.writing():
+            return self.connection.execute(query, params).rowcount
+
+    def executemany(self, query, rows):
+        with self.lock, self.writing():
+            self.connection.executemany(query, rows)
+
+    def writing(self):
+        # Inside transaction() a write joins the open transaction instead of committing on its own
+        return contextlib.nullcontext() if self.in_transaction else self.connection
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.lock:
+            if self.in_transaction:
+                yield
+                return
+            self.in_transaction = True
+            try:
+                with self.connection:
+                    yield
+            finally:
+                self.in_transaction = False
+
+    def fetchall(self, query, params=()):
+        with self.lock:
+            return self.connection.execute(query, params).fetchall()
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def fetchall_in(self, query, ids, chunk=500):
+        # query has one {} for the placeholders; chunks stay under SQLite's bound variable limit
+        ids = [int(value) for value in ids]
+        rows = []
+        for index in range(0, len(ids), chunk):
+            part = ids[index:index + chunk]
+            rows += self.fetchall(query.format(", ".join("?" * len(part))), part)
+        return rows
+
+    def count(self, table):
+        return self.fetchall(f"SELECT COUNT(*) AS total FROM {table}")[0]["total"]
+
+    # meta
+    def get_meta(self, key):
+        rows = self.fetchall("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0]["value"] if rows else None
+
+    def set_meta(self, key, value):
+        self.execute("INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    # ticket embeds
+    def _ticket_row(self, ticket_id, panel):
+        return (ticket_id, *(getattr(panel, column) for column in self.TICKET_COLUMNS))
+
+    def load_ticket_embeds(self):
+        rows = self.fetchall(f"SELECT ticket_id, {', '.join(self.TICKET_COLUMNS)} FROM ticket_embeds")
+        return {row["ticket_id"]: TicketPanel(*(row[column] for column in self.TICKET_COLUMNS)) for row in rows}
+
+    def upsert_ticket_embeds(self, items):
+        placeholders = ", ".join("?" * (len(self.TICKET_COLUMNS) + 1))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in self.TICKET_COLUMNS)
+        self.executemany(
+            f"INSERT INTO ticket_embeds (ticket_id, {', '.join(self.TICKET_COLUMNS)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(ticket_id) DO UPDATE SET {updates}",
+            [self._ticket_row(ticket_id, panel) for ticket_id, panel in items]
+        )
+
+    def upsert_ticket_embed(self, ticket_id, panel):
+        self.upsert_ticket_embeds([(ticket_id, panel)])
+
+    def delete_ticket_embed(self, ticket_id):
+        return self.execute("DELETE FROM ticket_embeds WHERE ticket_id = ?", (ticket_id,)) > 0
+
+    # log channels
+    def upsert_log_channels(self, items):
+        self.executemany(
+            "INSERT INTO log_channels (guild_id, channel_id, user_id, timestamp) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET channel_id = excluded.channel_id, user_id = excluded.user_id, timestamp = excluded.timestamp",
+            [(int(guild_id), config.channel_id, config.user_id, config.timestamp) for guild_id, config in items]
+        )
+
+    def upsert_log_channel(self, guild_id, config):
+        self.upsert_log_channels([(guild_id, config)])
+
+    def get_log_channel(self, guild_id):
+        rows = self.fetchall("SELECT channel_id, user_id, timestamp FROM log_channels WHERE guild_id = ?", (int(guild_id),))
+        return LogChannelConfig(rows[0]["channel_id"], rows[0]["user_id"], rows[0]["timestamp"]) if rows else None
+
+    def get_log_channels(self, guild_ids):
+        rows = self.fetchall_in("SELECT guild_id, channel_id, user_id, timestamp FROM log_channels WHERE guild_id IN ({})", guild_ids)
+        return {row["guild_id"]: LogChannelConfig(row["channel_id"], row["user_id"], row["timestamp"]) for row in rows}
+
+    def delete_log_channel(self, guild_id):
+        return self.execute("DELETE FROM log_channels WHERE guild_id = ?", (int(guild_id),)) > 0
+
+    # welcome messages
+    def _welcome_record(self, row):
+        message = json.loads(row["welcome_message"]) if row["welcome_message"] is not None else None
+        return WelcomeConfig.from_dict({
+            "channel_id": row["channel_id"],
+            "user_id": row["user_id"],
+            "welcome_message": message,
+            "timestamp": row["timestamp"]
+        })
+
+    def get_welcome_message(self, guild_id):
+        rows = self.fetchall("SELECT channel_id, user_id, welcome_message, timestamp FROM welcome_messages WHERE guild_id = ?", (int(guild_id),))
+        return self._welcome_record(rows[0]) if rows else None
+
+    def get_welcome_messages(self, guild_ids):
+        rows = self.fetchall_in("SELECT guild_id, channel_id, user_id, welcome_message, timestamp FROM welcome_messages WHERE guild_id IN ({})", guild_ids)
+        return {row["guild_id"]: self._welcome_record(row) for row in rows}
+
+    def upsert_welcome_messages(self, items):
+        rows = []
+        for guild_id, config in items:
+            message = config.message_dict()
+            rows.append((
+                int(guild_id),
+                config.channel_id,
+                config.user_id,
+                json.dumps(message, ensure_ascii=False) if message is not None else None,
+                config.timestamp
+            ))
+        self.executemany(
+            "INSERT INTO welcome_messages (guild_id, channel_id, user_id, welcome_message, timestamp) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET channel_id = excluded.channel_id, user_id = excluded.user_id, "
+            "welcome_message = excluded.welcome_message, timestamp = excluded.timestamp",
+            rows
+        )
+
+    def upsert_welcome_message(self, guild_id, config):
+        self.upsert_welcome_messages([(guild_id, config)])
+
+    def delete_welcome_message(self, guild_id):
+        return self.execute("DELETE FROM welcome_messages WHERE guild_id = ?", (int(guild_id),)) > 0
+
+    # guild languages
+    def load_languages(self):
+        rows = self.fetchall("SELECT guild_id, language FROM guild_languages")
+        return {row["guild_id"]: row["language"] for row in rows}
+
+    def upsert_languages(self, items):
+        self.executemany(
+            "INSERT INTO guild_languages (guild_id, language) VALUES (?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET language = excluded.language",
+            [(int(guild_id), language) for guild_id, language in items]
+        )
+
+    def upsert_language(self, guild_id, language):
+        self.upsert_languages([(guild_id, language)])
+
+    def delete_language(self, guild_id):
+        return self.execute("DELETE FROM guild_languages WHERE guild_id = ?", (int(guild_id),)) > 0
+
+    # one-shot import of the legacy JSON data files
+    def import_json_files(self):
+        if self.get_meta("json_imported"):
+            return False
+
+        sources = [
+            (EMBEDS_FILE, self.upsert_ticket_embeds, TicketPanel.from_dict),
+            (LOG_CHANNELS_FILE, self.upsert_log_channels, LogChannelConfig.from_dict),
+            (WELCOME_MESSAGE_FILE, self.upsert_welcome_messages, WelcomeConfig.from_dict),
+            (LANGUAGE_GUILDS_SETTINGS_FILE, self.upsert_languages, str),
+        ]
+        for path, upsert, convert in sources:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict) and data:
+                    upsert([(key, convert(value)) for key, value in data.items()])
+                    logging.info(f"Imported {len(data)} records from {path}.")
+            except Exception as e:
+                logging.error(f"Failed to import {path}: {e}")
+
+        self.set_meta("json_imported", datetime.now().isoformat())
+        return True
+
+with startup_report.phase("storage_open"):
+    storage = BotStorage(DATABASE_FILE)
+    storage.import_json_files()
+
+WRITE_BEHIND_MAX_RETRY_SECONDS = 60
+
+class WriteBehindPersistence:
+    def __init__(self, delay=2.0, transaction=contextlib.nullcontext):
+        self.delay = delay
+        self.transaction = transaction
+        self.failures = 0
+        self.stores = {}
+        self.dirty = {}
+        self.inflight = {}
+        self.pending_mutations = 0
+        self.event = None
+        self.task = None
+        self.flush_lock = asyncio.Lock()
+        self.metrics = {
+            "mutations": 0,
+            "flushes": 0,
+            "rows_written": 0,
+            "coalesced_writes": 0,
+            "failed_flushes": 0,
+            "last_write_ms": 0.0,
+            "max_write_ms": 0.0,
+            "total_write_ms": 0.0,
+        }
+
+    def register(self, name, source, upsert, delete):
+        self.stores[name] = (source, upsert, delete)
+        self.dirty[name] = set()
+        self.inflight[name] = set()
+
+    def is_pending(self, name, key):
+        return key in self.dirty[name] or key in self.inflight[name]
+
+    def mark_dirty(self, name, key):
+        self.metrics["mutations"] += 1
+        self.pending_mutations += 1
+        self.dirty[name].add(key)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()
             return
+        if self.task is None or self.task.done():
+            self.event = asyncio.Event()
+            self.task = asyncio.create_task(self._run())
+        self.event.set()
 
-        with open(EMBEDS_FILE, "r") as file:
-            data = json.load(file)
-            if isinstance(data, dict):
-                ticket_embeds = data
-                logging.info("Successfully loaded ticket embeds.")
-            else:
-                ticket_embeds = {}
-                logging.warning("Invalid format in ticket_embeds.json. Using an empty dictionary.")
-    except json.JSONDecodeError as e:
-        ticket_embeds = {}
-        logging.warning("Failed to decode ticket_embeds.json. Using an empty dictionary.")
-        handle_exception(None, "load_ticket_embeds", "Failure", error=e)
-    except Exception as e:
-        ticket_embeds = {}
-        logging.error(f"Unexpected error while loading ticket_embeds.json: {e}")
-        handle_exception(None, "load_ticket_embeds", "Failure", error=e)
+    async def _run(self):
+        while True:
+            await self.event.wait()
+            # Back off while the disk keeps failing, so requeued rows are retried without hammering it
+            await asyncio.sleep(min(self.delay * 2 ** self.failures, WRITE_BEHIND_MAX_RETRY_SECONDS))
+            self.event.clear()
+            await self.flush()
+
+    def _take_batch(self):
+        batch = []
+        for name, keys in self.dirty.items():
+            if not keys:
+                continue
+            source, upsert, delete = self.stores[name]
+            data = source()
+            upserts = [(key, copy.deepcopy(data[key])) for key in keys if key in data]
+            deletes = [key for key in keys if key not in data]
+            batch.append((name, upsert, delete, upserts, deletes))
+            self.inflight[name] |= keys
+            self.dirty[name] = set()
+        mutations, self.pending_mutations = self.pending_mutations, 0
+        return batch, mutations
+
+    def _write_batch(self, batch):
+        start = time.perf_counter()
+        rows = 0
+        # Upserts and deletes of every store commit together, so a crash never leaves half a batch on disk
+        with self.transaction():
+            for name, upsert, delete, upserts, deletes in batch:
+                if upserts:
+                    upsert(upserts)
+                for key in deletes:
+                    delete(key)
+                rows += len(upserts) + len(deletes)
+        return rows, (time.perf_counter() - start) * 1000
+
+    def _record(self, mutations, rows, elapsed_ms):
+        self.metrics["flushes"] += 1
+        self.metrics["rows_written"] += rows
+        self.metrics["coalesced_writes"] += max(mutations - rows, 0)
+        self.metrics["last_write_ms"] = elapsed_ms
+        self.metrics["max_write_ms"] = max(self.metrics["max_write_ms"], elapsed_ms)
+        self.metrics["total_write_ms"] += elapsed_ms
+
+    def _release(self, batch):
+        for name, upsert, delete, upserts, deletes in batch:
+            self.inflight[name].difference_update(key for key, _ in upserts)
+            self.inflight[name].difference_update(deletes)
+
+    def _requeue(self, batch, mutations):
+        self.metrics["failed_flushes"] += 1
+        self.pending_mutations += mutations
+        for name, upsert, delete, upserts, deletes in batch:
+            self.dirty[name].update(key for key, _ in upserts)
+            self.dirty[name].update(deletes)
+
+    async def flush(self):
+        async with self.flush_lock:
+            batch, mutations = self._take_batch()
+            if not batch:
+                return
+            try:
+                rows, elapsed_ms = await asyncio.get_running_loop().run_in_executor(None, self._write_batch, batch)
+            except Exception as e:
+                self._requeue(batch, mutations)
+                self.failures += 1
+                logging.error(f"Failed to flush pending writes (attempt {self.failures}): {e}")
+                if self.event is not None:
+                    self.event.set()
+                return
+            finally:
+                self._release(batch)
+            self.failures = 0
+            self._record(mutations, rows, elapsed_ms)
+
+    def flush_sync(self):
+        batch, mutations = self._take_batch()
+        if not batch:
+            return
+        try:
+            rows, elapsed_ms = self._write_batch(batch)
+        except Exception as e:
+            self._requeue(batch, mutations)
+            logging.error(f"Failed to flush pending writes: {e}")
+            return
+        finally:
+            self._release(batch)
+        self._record(mutations, rows, elapsed_ms)
+
+persistence = WriteBehindPersistence(transaction=storage.transaction)
+persistence.register("welcome_messages", lambda: welcome_messages, storage.upsert_welcome_messages, storage.delete_welcome_message)
+persistence.register("log_channels", lambda: log_channels, storage.upsert_log_channels, storage.delete_log_channel)
+atexit.register(persistence.flush_sync)
+
+GUILD_SETTINGS_CACHE_SIZE = 1000
+GUILD_SETTINGS_IDLE_SECONDS = 30 * 60
+MISSING_RECORD = object()
+
+class LazyGuildSettings(MutableMapping):
+    def __init__(self, name, loader, counter, bulk_loader=None, maxsize=GUILD_SETTINGS_CACHE_SIZE, idle_seconds=GUILD_SETTINGS_IDLE_SECONDS, is_pinned=None):
+        self.name = name
+        self.loader = loader
+        self.bulk_loader = bulk_loader
+        self.counter = counter
+        self.maxsize = maxsize
+        self.idle_seconds = idle_seconds
+        self.is_pinned = is_pinned or (lambda guild_id: False)
+        self.records = OrderedDict()
+        self.last_access = {}
+        self.metrics = {"hits": 0, "loads": 0, "prewarmed": 0, "evictions": 0}
+
+    def _touch(self, guild_id):
+        self.records.move_to_end(guild_id)
+        self.last_access[guild_id] = time.monotonic()
+
+    def _lookup(self, guild_id):
+        guild_id = int(guild_id)
+        if guild_id in self.records:
+            self.metrics["hits"] += 1
+        else:
+            record = self.loader(guild_id)
+            self.records[guild_id] = MISSING_RECORD if record is None else record
+            self.metrics["loads"] += 1
+        self._touch(guild_id)
+        self._evict_overflow()
+        return self.records[guild_id]
+
+    def _evict(self, guild_id):
+        del self.records[guild_id]
+        self.last_access.pop(guild_id, None)
+        self.metrics["evictions"] += 1
+
+    def _evict_overflow(self):
+        overflow = len(self.records) - self.maxsize
+        if overflow <= 0:
+            return
+        for guild_id in list(self.records)[:-1]:
+            if overflow <= 0:
+                break
+            if not self.is_pinned(guild_id):
+                self._evict(guild_id)
+                overflow -= 1
+
+    async def prewarm(self, guild_ids):
+        # A miss reads SQLite on the event loop; one bulk read in the executor spares the first events from each guild that
+        guild_ids = [int(guild_id) for guild_id in guild_ids if int(guild_id) not in self.records][:max(self.maxsize - len(self.records), 0)]
+        if not guild_ids or self.bulk_loader is None:
+            return 0
+        loaded = await asyncio.get_running_loop().run_in_executor(None, self.bulk_loader, guild_ids)
+        for guild_id in guild_ids:
+            # Anything written or looked up while the read ran is newer than the snapshot
+            if guild_id not in self.records:
+                self.records[guild_id] = loaded.get(guild_id, MISSING_RECORD)
+                self._touch(guild_id)
+                self.metrics["prewarmed"] += 1
+        return len(guild_ids)
+
+    def evict_idle(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        evicted = 0
+        for guild_id in list(self.records):
+            if self.last_access.get(guild_id, 0) > cutoff:
+                break
+            if not self.is_pinned(guild_id):
+                self._evict(guild_id)
+                evicted += 1
+        return evicted
+
+    def __getitem__(self, guild_id):
+        record = self._lookup(guild_id)
+        if record is MISSING_RECORD:
+            raise KeyError(guild_id)
+        return record
+
+    def __contains__(self, guild_id):
+        return self._lookup(guild_id) is not MISSING_RECORD
+
+    def __setitem__(self, guild_id, record):
+        guild_id = int(guild_id)
+        self.records[guild_id] = record
+        self._touch(guild_id)
+        self._evict_overflow()
+
+    def __delitem__(self, guild_id):
+        if self._lookup(guild_id) is MISSING_RECORD:
+            raise KeyError(guild_id)
+        self.records[int(guild_id)] = MISSING_RECORD
+
+    def __iter__(self):
+        return iter([guild_id for guild_id, record in self.records.items() if record is not MISSING_RECORD])
+
+    def __len__(self):
+        return sum(1 for record in self.records.values() if record is not MISSING_RECORD)
+
+    def stats(self):
+        return {
+            "resident": len(self),
+            "resident_empty": len(self.records) - len(self),
+            "total": self.counter(),
+            **self.metrics
+        }
 
-def save_ticket_embeds():
+welcome_messages = LazyGuildSettings(
+    "welcome_messages",
+    storage.get_welcome_message,
+    lambda: storage.count("welcome_messages"),
+    storage.get_welcome_messages,
+    is_pinned=lambda guild_id: persistence.is_pending("welcome_messages", guild_id)
+)
+log_channels = LazyGuildSettings(
+    "log_channels",
+    storage.get_log_channel,
+    lambda: storage.count("log_channels"),
+    storage.get_log_channels,
+    is_pinned=lambda guild_id: persistence.is_pending("log_channels", guild_id)
+)
+GUILD_SETTINGS_STORES = [welcome_messages, log_channels]
+
+@tasks.loop(minutes=5)
+async def evict_idle_guild_settings():
+    for store in GUILD_SETTINGS_STORES:
+        evicted = store.evict_idle()
+        if evicted:
+            logging.info(f"Evicted {evicted} idle guild records from {store.name}.")
+
+TICKET_JOURNAL_FILE = os.path.join(TICKETDATA, "ticket_panels.ndjson")
+
+class TicketJournal:
+    def __init__(self, path):
+        self.path = path
+        self.compacting_path = f"{path}.compacting"
+        self.lock = threading.Lock()
+        self.file = None
+        self.records = 0
+        self.metrics = {
+            "appended": 0,
+            "compactions": 0,
+            "compacted_records": 0,
+            "last_replay_records": 0,
+            "last_replay_ms": 0.0,
+        }
+
+    def append(self, op, ticket_id, data=None):
+        record = {"op": op, "id": ticket_id}
+        if data is not None:
+            record["data"] = data
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(line + "\n")
+            self.file.flush()
+            self.records += 1
+        self.metrics["appended"] += 1
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    @staticmethod
+    def read_records(path):
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Skipping corrupt ticket journal record in {path}.")
+
+    def replay(self, panels):
+        start = time.perf_counter()
+        count = 0
+        for path in (self.compacting_path, self.path):
+            for record in self.read_records(path):
+                if record["op"] == "create":
+                    panels[record["id"]] = TicketPanel.from_dict(record["data"])
+                elif record["op"] == "delete":
+                    panels.pop(record["id"], None)
+                count += 1
+        with self.lock:
+            self.records = count
+        self.metrics["last_replay_records"] = count
+        self.metrics["last_replay_ms"] = (time.perf_counter() - start) * 1000
+        return count
+
+    def compact(self, snapshot):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            if os.path.exists(self.path) and not os.path.exists(self.compacting_path):
+                os.replace(self.path, self.compacting_path)
+                self.records = 0
+
+        if not os.path.exists(self.compacting_path):
+            return 0
+
+        creates, deletes, count = {}, set(), 0
+        for record in self.read_records(self.compacting_path):
+            if record["op"] == "create":
+                creates[record["id"]] = TicketPanel.from_dict(record["data"])
+                deletes.discard(record["id"])
+            elif record["op"] == "delete":
+                creates.pop(record["id"], None)
+                deletes.add(record["id"])
+            count += 1
+
+        if creates:
+            snapshot.upsert_ticket_embeds(list(creates.items()))
+        for ticket_id in deletes:
+            snapshot.delete_ticket_embed(ticket_id)
+        os.remove(self.compacting_path)
+
+        self.metrics["compactions"] += 1
+        self.metrics["compacted_records"] += count
+        logging.info(f"Compacted {count} ticket journal records into the snapshot.")
+        return count
+
+ticket_journal = TicketJournal(TICKET_JOURNAL_FILE)
+atexit.register(ticket_journal.close)
+
+@tasks.loop(minutes=10)
+async def compact_ticket_journal():
     try:
-        with open(EMBEDS_FILE, "w") as file:
-            json.dump(ticket_embeds, file, indent=4)
+        await bot.loop.run_in_executor(None, ticket_journal.compact, storage)
     except Exception as e:
-        logging.error(f"Failed to save ticket_embeds.json: {e}")
-        handle_exception(None, "save_ticket_embeds", "Failure", error=e)
+        logging.error(f"Failed to compact ticket journal: {e}")
 
-def load_log_channels():
+def load_ticket_embeds():
+    global ticket_embeds
     try:
-        if not os.path.exists(LOG_CHANNELS_FILE):
-            os.makedirs(os.path.dirname(LOG_CHANNELS_FILE), exist_ok=True)
-            with open(LOG_CHANNELS_FILE, "w") as f:
-                json.dump({}, f)
-            return {}
-
-        with open(LOG_CHANNELS_FILE, "r") as f:
-            data = json.load(f)
-        return data
-    except json.JSONDecodeError as e:
-        logging.warning("Failed to decode logchannels.json. Using an empty dictionary.")
-        handle_exception(None, "load_log_channels", "Failure", error=e)
-        return {}
+        ticket_embeds = storage.load_ticket_embeds()
+        replayed = ticket_journal.replay(ticket_embeds)
+        index_ticket_panels()
+        logging.info(f"Successfully loaded ticket embeds ({replayed} journal records replayed).")
+    except Exception as e:
+        ticket_embeds = {}
+        ticket_panel_messages.clear()
+        logging.error(f"Unexpected error while loading ticket embeds: {e}")
+        schedule_exception_report("load_ticket_embeds", e)
+    return ticket_embeds
+
+def index_ticket_panels():
+    ticket_panel_messages.clear()
+    for ticket_embed_id, panel in ticket_embeds.items():
+        if panel.message_id:
+            ticket_panel_messages[panel.message_id] = ticket_embed_id
+
+def save_ticket_embed(ticket_embed_id):
+    try:
+        panel = ticket_embeds[ticket_embed_id]
+        if panel.message_id:
+            ticket_panel_messages[panel.message_id] = ticket_embed_id
+        ticket_journal.append("create", ticket_embed_id, panel.to_dict())
     except Exception as e:
-        logging.error(f"Unexpected error while loading logchannels.json: {e}")
-        handle_exception(None, "load_log_channels", "Failure", error=e)
-        return {}
+        logging.error(f"Failed to save ticket embed {ticket_embed_id}: {e}")
+        schedule_exception_report("save_ticket_embed", e)
 
-def save_log_channels(data):
+def remove_ticket_embed(ticket_embed_id):
     try:
-        with open(LOG_CHANNELS_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        panel = ticket_embeds.pop(ticket_embed_id, None)
+        if panel is not None:
+            ticket_panel_messages.pop(panel.message_id, None)
+            ticket_journal.append("delete", ticket_embed_id)
+            return True
+        return False
     except Exception as e:
-        logging.error(f"Failed to save logchannels.json: {e}")
-        handle_exception(None, "save_log_channels", "Failure", error=e)
+        logging.error(f"Failed to remove ticket embed {ticket_embed_id}: {e}")
+        schedule_exception_report("remove_ticket_embed", e)
+        return False
 
 def save_or_update_log_channel(guild_id, channel_id, user_id, timestamp):
     try:
-        data = load_log_channels()
-        data[str(guild_id)] = {
-            "channel_id": channel_id,
-            "user_id": user_id,
-            "timestamp": timestamp
-        }
-        save_log_channels(data)
+        log_channels[int(guild_id)] = LogChannelConfig(channel_id, user_id, timestamp)
+        persistence.mark_dirty("log_channels", int(guild_id))
     except Exception as e:
         logging.error(f"Failed to save or update log channel for guild {guild_id}: {e}")
-        handle_exception(None, "save_or_update_log_channel", "Failure", error=e)
+        schedule_exception_report("save_or_update_log_channel", e)
 
 def remove_log_channel(guild_id):
     try:
-        data = load_log_channels()
-        if str(guild_id) in data:
-            del data[str(guild_id)]
-            save_log_channels(data)
+        if int(guild_id) in log_channels:
+            del log_channels[int(guild_id)]
+            persistence.mark_dirty("log_channels", int(guild_id))
             return True
         return False
     except Exception as e:
         logging.error(f"Failed to remove log channel for guild {guild_id}: {e}")
-        handle_exception(None, "remove_log_channel", "Failure", error=e)
+        schedule_exception_report("remove_log_channel", e)
         return False
 
-def load_welcome_messages():
-    try:
-        os.makedirs(os.path.dirname(WELCOME_MESSAGE_FILE), exist_ok=True)
-
-        if not os.path.exists(WELCOME_MESSAGE_FILE):
-            with open(WELCOME_MESSAGE_FILE, "w") as file:
-                json.dump({}, file, indent=4)
-            logging.info("Created a new empty welcomemessage.json file.")
-            return {}
-
-        with open(WELCOME_MESSAGE_FILE, "r") as file:
-            data = json.load(file)
-            if isinstance(data, dict):
-                return data
-            else:
-                logging.warning("Invalid format in welcomemessage.json. Using an empty dictionary.")
-                return {}
-    except json.JSONDecodeError as e:
-        logging.warning("Failed to decode welcomemessage.json. Using an empty dictionary.")
-        handle_exception(None, "load_welcome_messages", "Failure", error=e)
-        return {}
-    except Exception as e:
-        logging.error(f"Unexpected error while loading welcomemessage.json: {e}")
-        handle_exception(None, "load_welcome_messages", "Failure", error=e)
-        return {}
-
-def save_welcome_messages():
+def save_welcome_message(guild_id):
     try:
-        os.makedirs(os.path.dirname(WELCOME_MESSAGE_FILE), exist_ok=True)
-
-        with open(WELCOME_MESSAGE_FILE, "w") as file:
-            json.dump(welcome_messages, file, indent=4)
+        persistence.mark_dirty("welcome_messages", int(guild_id))
     except Exception as e:
-        logging.error(f"Failed to save welcomemessage.json: {e}")
-        handle_exception(None, "save_welcome_messages", "Failure", error=e)
+        logging.error(f"Failed to save welcome message for guild {guild_id}: {e}")
+        schedule_exception_report("save_welcome_message", e)
 
 def save_or_update_welcome_message(guild_id, channel_id, user_id, title, desc, message_type, image_url, timestamp):
     try:
-        welcome_messages[str(guild_id)] = {
-            "channel_id": channel_id,
-            "user_id": user_id,
-            "welcome_message": {
-                "title": title,
-                "desc": desc,
-                "type": message_type,
-                "image_url": image_url,
-            },
-            "timestamp": timestamp
-        }
-        save_welcome_messages()
+        welcome_messages[int(guild_id)] = WelcomeConfig(
+            channel_id=channel_id,
+            user_id=user_id,
+            title=title,
+            desc=desc,
+            message_type=message_type,
+            image_url=image_url,
+            timestamp=timestamp
+        )
+        save_welcome_message(guild_id)
         logging.info(f"Welcome message for guild {guild_id} updated.")
     except Exception as e:
         logging.error(f"Failed to save or update welcome message for guild {guild_id}: {e}")
-        handle_exception(None, "save_or_update_welcome_message", "Failure", error=e)
+        schedule_exception_report("save_or_update_welcome_message", e)
 
 def remove_welcome_message(guild_id):
     try:
-        if str(guild_id) in welcome_messages:
-            del welcome_messages[str(guild_id)]
-            save_welcome_messages()
+        if int(guild_id) in welcome_messages:
+            del welcome_messages[int(guild_id)]
+            persistence.mark_dirty("welcome_messages", int(guild_id))
             logging.info(f"Welcome message for guild {guild_id} removed.")
             return True
         return False
     except Exception as e:
         logging.error(f"Failed to remove welcome message for guild {guild_id}: {e}")
-        handle_exception(None, "remove_welcome_message", "Failure", error=e)
+        schedule_exception_report("remove_welcome_message", e)
         return False
 
 def cleanup_downloaded_music():
@@ -258,27 +1078,175 @@ def cleanup_downloaded_music():
             os.makedirs(music_path)
     except Exception as e:
         logging.error(f"Error cleaning up downloaded music: {e}")
-        handle_exception(None, "cleanup_downloaded_music", "Failure", error=e)
+        schedule_exception_report("cleanup_downloaded_music", e)
 
 def load_language_settings():
-    try:
-        with open(LANGUAGE_GUILDS_SETTINGS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+    return storage.load_languages()
+
+language_settings_cache = None
+# A miss is a lookup for a guild with no stored language, which falls back to "en"
+language_cache_stats = {"hits": 0, "misses": 0}
+
+def load_language_cache():
+    global language_settings_cache
+    language_settings_cache = load_language_settings()
+    logging.info(f"Loaded language settings for {len(language_settings_cache)} guilds.")
 
-def save_language_settings(settings):
-    with open(LANGUAGE_GUILDS_SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=4, ensure_ascii=False)
+persistence.register("guild_languages", lambda: language_settings_cache, storage.upsert_languages, storage.delete_language)
 
 async def set_language(guild_id, language_code):
-    settings = load_language_settings()
-    settings[str(guild_id)] = language_code
-    save_language_settings(settings)
+    if language_settings_cache is None:
+        load_language_cache()
+    language_settings_cache[int(guild_id)] = language_code
+    persistence.mark_dirty("guild_languages", int(guild_id))
 
 def get_language(guild_id):
-    settings = load_language_settings()
-    return settings.get(str(guild_id), "en")
+    if language_settings_cache is None:
+        load_language_cache()
+    language = language_settings_cache.get(guild_id)
+    if language is None:
+        language_cache_stats["misses"] += 1
+        return "en"
+    language_cache_stats["hits"] += 1
+    return language
+
+with startup_report.phase("language_cache"):
+    load_language_cache()
+
+LOCALES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+class LocalizationCatalog:
+    def __init__(self, path, default_language="en"):
+        self.path = path
+        self.default_language = default_language
+        self.lock = threading.Lock()
+        self.tables = {}
+        self.sections = {}
+        self.version = 0
+        self.metrics = {"bundle_loads": 0, "load_ms": {}}
+
+    @property
+    def languages(self):
+        return set(self.tables)
+
+    def available_languages(self):
+        try:
+            return sorted(name[:-5] for name in os.listdir(self.path) if name.endswith(".json"))
+        except FileNotFoundError:
+            return []
+
+    def _read_bundle(self, language):
+        bundle_file = os.path.join(self.path, f"{language}.json")
+        if not os.path.exists(bundle_file):
+            return None
+        with open(bundle_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _flatten(self, table, prefix, texts):
+        for key, value in texts.items():
+            path = f"{prefix}.{key}" if prefix else key
+            table[path] = value
+            if isinstance(value, dict):
+                self._flatten(table, path, value)
+
+    def table(self, language):
+        table = self.tables.get(language)
+        if table is not None:
+            return table
+        fallback = None if language == self.default_language else self.table(self.default_language)
+        with self.lock:
+            if language in self.tables:
+                return self.tables[language]
+            start = time.perf_counter()
+            bundle = self._read_bundle(language)
+            if bundle is None:
+                if fallback is not None:
+                    return fallback
+                logging.error(f"Default language bundle is missing from {self.path}.")
+                bundle = {}
+            table = {}
+            self._flatten(table, "", bundle)
+            if fallback is not None:
+                table = {**fallback, **table}
+            self.tables[language] = table
+            self.metrics["bundle_loads"] += 1
+            self.metrics["load_ms"][language] = (time.perf_counter() - start) * 1000
+        logging.info(f"Loaded '{language}' language bundle with {len(table)} entries.")
+        return table
+
+    def reload(self):
+        with self.lock:
+            self.tables = {}
+            self.sections = {}
+            self.version += 1
+
+    def get(self, language, key, default=None):
+        value = (self.tables.get(language) or self.table(language)).get(key)
+        return default if value is None else value
+
+    def text(self, language, key, default=None):
+        value = (self.tables.get(language) or self.table(language)).get(key)
+        if value is None:
+            return key if default is None else default
+        return value
+
+    def format(self, language, key, **fmt):
+        return self.text(language, key).format(**fmt)
+
+    def section(self, language, namespace):
+        cache_key = (language, namespace)
+        section = self.sections.get(cache_key)
+        if section is None:
+            prefix = f"{namespace}."
+            table = self.tables.get(language) or self.table(language)
+            section = {key[len(prefix):]: value for key, value in table.items() if key.startswith(prefix)}
+            self.sections[cache_key] = section
+        return section
+
+catalog = LocalizationCatalog(LOCALES_PATH)
+
+class ResponseTemplateCache:
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.templates = {}
+        self.version = catalog.version
+        self.metrics = {"invalidations": 0, "commands": defaultdict(lambda: {"hits": 0, "builds": 0})}
+
+    def get(self, command, language, build):
+        if self.version != self.catalog.version:
+            self.templates.clear()
+            self.version = self.catalog.version
+            self.metrics["invalidations"] += 1
+        counters = self.metrics["commands"][command]
+        payload = self.templates.get((command, language))
+        if payload is None:
+            payload = build(language)
+            self.templates[(command, language)] = payload
+            counters["builds"] += 1
+        else:
+            counters["hits"] += 1
+        return payload
+
+    def stats(self):
+        stats = {}
+        for command, counters in self.metrics["commands"].items():
+            total = counters["hits"] + counters["builds"]
+            stats[command] = {**counters, "reuse_rate": counters["hits"] / total if total else 0.0}
+        return stats
+
+response_templates = ResponseTemplateCache(catalog)
+
+def t(guild_id, key, **fmt):
+    # Hot path for event handlers: the language cache is loaded at import, so skip get_language's None check.
+    language = language_settings_cache.get(guild_id)
+    if language is None:
+        language_cache_stats["misses"] += 1
+        language = "en"
+    else:
+        language_cache_stats["hits"] += 1
+    table = catalog.tables.get(language) or catalog.table(language)
+    text = table.get(key, key)
+    return text.format(**fmt) if fmt else text
 
 ''' ----- Data ----- '''
 #
@@ -295,55 +1263,34 @@ async def handle_cooldown_error(ctx, error):
         )
         await ctx.send(embed=embed)
         
-async def handle_exception(source, identifier, status, error=None):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    severity = "ERROR" if status == "Failure" else "INFO"
-
-    if hasattr(source, "guild") and source.guild:
-        language = get_language(source.guild.id)
-    else:
-        language = "en"
-
-    ERROR_MESSAGES = {
-        "en": {
-            "permission_denied": "Permission Denied: Bot lacks necessary permissions.",
-            "http_exception": "HTTP Exception: Network error with Discord API.",
-            "not_found": "Not Found: Requested resource is missing.",
-            "unexpected_error": "Unexpected Error: {error}",
-            "no_error": "No error message provided.",
-            "notification": "⚠️ An error occurred in `{identifier}`: {error_message}"
-        },
-        "zh": {
-            "permission_denied": "權限被拒絕：機器人缺少必要的權限。",
-            "http_exception": "HTTP 異常：Discord API 網絡錯誤。",
-            "not_found": "未找到：請求的資源缺失。",
-            "unexpected_error": "意外錯誤：{error}",
-            "no_error": "沒有提供錯誤訊息。",
-            "notification": "⚠️ `{identifier}` 中發生錯誤：{error_message}"
-        },
-        "ja": {
-            "permission_denied": "権限拒否: Botに必要な権限がありません。",
-            "http_exception": "HTTP 例外: Discord APIのネットワークエラー。",
-            "not_found": "未発見: リクエストされたリソースがありません。",
-            "unexpected_error": "予期しないエラー: {error}",
-            "no_error": "エラーメッセージは提供されていません。",
-            "notification": "⚠️ `{identifier}` でエラーが発生しました：{error_message}"
-        }
-    }
-    
-    error_messages = ERROR_MESSAGES.get(language, ERROR_MESSAGES["en"])
+EXCEPTION_SUCCESS_SAMPLE_RATE = float(os.getenv("EXCEPTION_SUCCESS_SAMPLE_RATE", 0.01))
+EXCEPTION_DEDUPE_WINDOW_SECONDS = float(os.getenv("EXCEPTION_DEDUPE_WINDOW_SECONDS", 60))
+EXCEPTION_NOTIFY_INTERVAL_SECONDS = float(os.getenv("EXCEPTION_NOTIFY_INTERVAL_SECONDS", 30))
+EXCEPTION_SUMMARY_MINUTES = 5
+
+exception_report_stats = {
+    "successes": defaultdict(int),
+    "failures": defaultdict(int),
+    "sampled_successes": 0,
+    "suppressed_failures": 0,
+    "suppressed_notifications": 0,
+}
+recent_failures = {}
+last_failure_notifications = {}
 
+def describe_source(source):
     if hasattr(source, "command"):
         context_type = "Command"
     elif hasattr(source, "guild") or hasattr(source, "channel"):
         context_type = "Event"
     else:
         context_type = "Unknown Source"
-        location = "Unknown Location"
-        user_info = "Unknown User"
 
-    if hasattr(source, "guild") and source.guild:
-        location = f"Server: {source.guild.name} (ID: {source.guild.id}) | Channel: {source.channel.name} (ID: {source.channel.id})"
+    channel = getattr(source, "channel", None)
+    if hasattr(source, "guild") and source.guild and channel is not None:
+        location = f"Server: {source.guild.name} (ID: {source.guild.id}) | Channel: {channel.name} (ID: {channel.id})"
+    elif hasattr(source, "guild") and source.guild:
+        location = f"Server: {source.guild.name} (ID: {source.guild.id})"
     elif hasattr(source, "author"):
         location = f"Direct Message (User: {source.author})"
     else:
@@ -354,41 +1301,725 @@ async def handle_exception(source, identifier, status, error=None):
         else f"Member: {source.name} (ID: {source.id})" if hasattr(source, "name")
         else "Unknown User"
     )
-    
-    if status == "Failure":
-        if isinstance(error, Forbidden):
-            error_message = error_messages["permission_denied"]
-        elif isinstance(error, HTTPException):
-            error_message = error_messages["http_exception"]
-        elif isinstance(error, NotFound):
-            error_message = error_messages["not_found"]
-        else:
-            error_message = error_messages["unexpected_error"].format(error=error)
-    else:
-        error_message = error_messages["no_error"]
+    return context_type, location, user_info
+
+def notification_allowed(source, now):
+    channel = getattr(source, "channel", None)
+    target = channel.id if channel is not None else getattr(source, "id", id(source))
+    last_sent = last_failure_notifications.get(target)
+    if last_sent is not None and now - last_sent < EXCEPTION_NOTIFY_INTERVAL_SECONDS:
+        exception_report_stats["suppressed_notifications"] += 1
+        return False
+    last_failure_notifications[target] = now
+    return True
+
+pending_exception_reports = set()
+
+def schedule_exception_report(identifier, error):
+    # handle_exception is async; synchronous helpers (which log the error themselves) hand it to the loop when one is running
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(handle_exception(None, identifier, "Failure", error=error))
+    pending_exception_reports.add(task)
+    task.add_done_callback(pending_exception_reports.discard)
 
-    if status == "Failure":
-        logger.error(f"[{timestamp}] [{severity}] {context_type} '{identifier}' FAILURE | {location} | {user_info} | Error: {error_message}")
+async def handle_exception(source, identifier, status, error=None):
+    if status != "Failure":
+        exception_report_stats["successes"][identifier] += 1
+        if EXCEPTION_SUCCESS_SAMPLE_RATE > 0 and random.random() < EXCEPTION_SUCCESS_SAMPLE_RATE:
+            exception_report_stats["sampled_successes"] += 1
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            context_type, location, user_info = describe_source(source)
+            logger.info(f"[{timestamp}] [INFO] {context_type} '{identifier}' SUCCESS (sampled) | {location} | {user_info}")
+        return
+
+    exception_report_stats["failures"][identifier] += 1
+    if hasattr(source, "command"):
+        # Commands catch their own errors; flag the context so the after-invoke hook records an error.
+        source.reported_failure = True
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    language = get_language(source.guild.id) if hasattr(source, "guild") and source.guild else "en"
+    context_type, location, user_info = describe_source(source)
+
+    if isinstance(error, Forbidden):
+        error_message = catalog.text(language, "errors.permission_denied")
+    elif isinstance(error, HTTPException):
+        error_message = catalog.text(language, "errors.http_exception")
+    elif isinstance(error, NotFound):
+        error_message = catalog.text(language, "errors.not_found")
+    else:
+        error_message = catalog.format(language, "errors.unexpected_error", error=error)
+
+    now = time.monotonic()
+    failure_key = (identifier, type(error).__name__)
+    recent = recent_failures.get(failure_key)
+    if recent and now - recent[0] < EXCEPTION_DEDUPE_WINDOW_SECONDS:
+        recent[1] += 1
+        exception_report_stats["suppressed_failures"] += 1
     else:
-        logger.info(f"[{timestamp}] [{severity}] {context_type} '{identifier}' SUCCESS | {location} | {user_info}")
+        suppressed = f" | {recent[1]} similar failures suppressed" if recent and recent[1] else ""
+        recent_failures[failure_key] = [now, 0]
+        logger.error(f"[{timestamp}] [ERROR] {context_type} '{identifier}' FAILURE | {location} | {user_info} | Error: {error_message}{suppressed}")
 
-    if status == "Failure" and severity == "ERROR" and hasattr(source, "send"):
+    if hasattr(source, "send") and notification_allowed(source, now):
         try:
-            notification_message = error_messages["notification"].format(identifier=identifier, error_message=error_message)
+            notification_message = catalog.format(language, "errors.notification", identifier=identifier, error_message=error_message)
             await source.send(notification_message)
         except Forbidden:
             logger.warning(f"Unable to notify user in {location} due to permission restrictions.")
 
+@tasks.loop(minutes=EXCEPTION_SUMMARY_MINUTES)
+async def log_exception_summary():
+    successes = exception_report_stats["successes"]
+    failures = exception_report_stats["failures"]
+    if successes or failures:
+        top_successes = ", ".join(f"{name}={count}" for name, count in sorted(successes.items(), key=lambda item: -item[1])[:10])
+        top_failures = ", ".join(f"{name}={count}" for name, count in sorted(failures.items(), key=lambda item: -item[1])[:10])
+        logger.info(
+            f"Summary (last {EXCEPTION_SUMMARY_MINUTES} min): {sum(successes.values())} successes [{top_successes}] | "
+            f"{sum(failures.values())} failures [{top_failures}] | suppressed: {exception_report_stats['suppressed_failures']} failure logs, "
+            f"{exception_report_stats['suppressed_notifications']} notifications | sampled successes: {exception_report_stats['sampled_successes']}"
+        )
+    successes.clear()
+    failures.clear()
+    for key in ("sampled_successes", "suppressed_failures", "suppressed_notifications"):
+        exception_report_stats[key] = 0
+
+    now = time.monotonic()
+    for failure_key, (first_seen, _) in list(recent_failures.items()):
+        if now - first_seen >= EXCEPTION_DEDUPE_WINDOW_SECONDS:
+            del recent_failures[failure_key]
+    for target, last_sent in list(last_failure_notifications.items()):
+        if now - last_sent >= EXCEPTION_NOTIFY_INTERVAL_SECONDS:
+            del last_failure_notifications[target]
+
 ''' ----- Handles ----- '''
 #
 #
 #
+''' ----- Metrics ----- '''
+
+class CommandMetrics:
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, samples=1024):
+        self.samples = samples
+        self.lock = threading.Lock()
+        self.commands = {}
+
+    def _entry(self, name):
+        entry = self.commands.get(name)
+        if entry is None:
+            entry = {
+                "buckets": [0] * len(self.BUCKETS),
+                "count": 0,
+                "sum": 0.0,
+                "recent": deque(maxlen=self.samples),
+                "success": 0,
+                "error": 0,
+                "cooldown": 0,
+            }
+            self.commands[name] = entry
+        return entry
+
+    def observe(self, name, seconds, failed):
+        with self.lock:
+            entry = self._entry(name)
+            entry["count"] += 1
+            entry["sum"] += seconds
+            entry["recent"].append(seconds)
+            entry["error" if failed else "success"] += 1
+            for index, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    entry["buckets"][index] += 1
+                    break
+
+    def record_cooldown(self, name):
+        with self.lock:
+            self._entry(name)["cooldown"] += 1
+
+    @staticmethod
+    def _percentile(ordered, fraction):
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        with self.lock:
+            snapshot = {name: (sorted(entry["recent"]), dict(entry, recent=None)) for name, entry in self.commands.items()}
+        result = {}
+        for name, (ordered, entry) in snapshot.items():
+            result[name] = {
+                "count": entry["count"],
+                "success": entry["success"],
+                "error": entry["error"],
+                "cooldown": entry["cooldown"],
+                "p50": self._percentile(ordered, 0.50),
+                "p95": self._percentile(ordered, 0.95),
+                "p99": self._percentile(ordered, 0.99),
+            }
+        return result
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP discord_command_duration_seconds End-to-end command latency.",
+            "# TYPE discord_command_duration_seconds histogram",
+        ]
+        with self.lock:
+            entries = {name: dict(entry, buckets=list(entry["buckets"]), recent=None) for name, entry in self.commands.items()}
+        for name, entry in sorted(entries.items()):
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS, entry["buckets"]):
+                cumulative += count
+                lines.append(f'discord_command_duration_seconds_bucket{{command="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'discord_command_duration_seconds_bucket{{command="{name}",le="+Inf"}} {entry["count"]}')
+            lines.append(f'discord_command_duration_seconds_sum{{command="{name}"}} {entry["sum"]:.6f}')
+            lines.append(f'discord_command_duration_seconds_count{{command="{name}"}} {entry["count"]}')
+        lines.append("# HELP discord_command_total Command invocations by outcome.")
+        lines.append("# TYPE discord_command_total counter")
+        for name, entry in sorted(entries.items()):
+            for outcome in ("success", "error", "cooldown"):
+                lines.append(f'discord_command_total{{command="{name}",outcome="{outcome}"}} {entry[outcome]}')
+        return "\n".join(lines) + "\n"
+
+command_metrics = CommandMetrics()
+
+rest_feature = contextvars.ContextVar("rest_feature", default=None)
+current_rest_call = contextvars.ContextVar("current_rest_call", default=None)
+current_guild_id = contextvars.ContextVar("current_guild_id", default=None)
+
+GUILD_USAGE_METRICS = ("cpu_ms", "events", "rest_calls", "messages_sent", "message_edits", "disk_bytes")
+GUILD_DISK_USAGE_TTL_SECONDS = float(os.getenv("GUILD_DISK_USAGE_TTL_SECONDS", 300))
+
+class GuildAccounting:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.usage = {}
+        self.started = time.time()
+        self.disk_lock = threading.Lock()
+        self.disk_cache = None
+
+    def add(self, guild_id, metric, amount=1):
+        if guild_id is None:
+            return
+        with self.lock:
+            entry = self.usage.get(guild_id)
+            if entry is None:
+                entry = self.usage[guild_id] = {"cpu_ms": 0.0, "events": 0, "rest_calls": 0, "messages_sent": 0, "message_edits": 0}
+            entry[metric] += amount
+
+    def record_rest(self, route):
+        guild_id = getattr(route, "guild_id", None)
+        if guild_id is None and getattr(route, "channel_id", None) is not None:
+            channel = bot.get_channel(int(route.channel_id))
+            guild_id = channel.guild.id if channel is not None and getattr(channel, "guild", None) else None
+        if guild_id is None:
+            guild_id = current_guild_id.get()
+        else:
+            guild_id = int(guild_id)
+        self.add(guild_id, "rest_calls")
+        if route.path == "/channels/{channel_id}/messages" and route.method == "POST":
+            self.add(guild_id, "messages_sent")
+        elif route.path == "/channels/{channel_id}/messages/{message_id}" and route.method == "PATCH":
+            self.add(guild_id, "message_edits")
+
+    @staticmethod
+    def scan_disk_usage():
+        usage = {}
+        music_path = os.path.join(WORKSPACE, "downloaded_music")
+        if not os.path.isdir(music_path):
+            return usage
+        for name in os.listdir(music_path):
+            if not name.isdigit():
+                continue
+            total = 0
+            for root, _, files in os.walk(os.path.join(music_path, name)):
+                for file_name in files:
+                    try:
+                        total += os.path.getsize(os.path.join(root, file_name))
+                    except OSError:
+                        pass
+            usage[int(name)] = total
+        return usage
+
+    def disk_usage(self):
+        # At most one walk of the download tree per TTL, however often the report is requested
+        with self.disk_lock:
+            if self.disk_cache is None or time.monotonic() - self.disk_cache[0] >= GUILD_DISK_USAGE_TTL_SECONDS:
+                self.disk_cache = (time.monotonic(), self.scan_disk_usage())
+            return self.disk_cache[1]
+
+    def report(self, metric="cpu_ms", top=10):
+        with self.lock:
+            usage = {guild_id: dict(entry) for guild_id, entry in self.usage.items()}
+        disk = self.disk_usage()
+        for guild_id in disk:
+            usage.setdefault(guild_id, {"cpu_ms": 0.0, "events": 0, "rest_calls": 0, "messages_sent": 0, "message_edits": 0})
+        for guild_id, entry in usage.items():
+            entry["disk_bytes"] = disk.get(guild_id, 0)
+            guild = bot.get_guild(guild_id)
+            entry["name"] = guild.name if guild else None
+            entry["members"] = guild.member_count if guild else None
+        ranked = sorted(usage.items(), key=lambda item: -item[1][metric])[:top]
+        return {"since": self.started, "metric": metric, "guilds": [{"guild_id": guild_id, **entry} for guild_id, entry in ranked]}
+
+def event_guild_id(args):
+    for arg in args:
+        if isinstance(arg, discord.Guild):
+            return arg.id
+        guild = getattr(arg, "guild", None)
+        if guild is not None:
+            return guild.id
+    return None
+
+@types.coroutine
+def metered(coro, on_cpu):
+    # Drive the coroutine step by step so only time spent running it is charged, not time spent awaiting.
+    value, error = None, None
+    while True:
+        start = time.thread_time()
+        try:
+            future = coro.throw(error) if error is not None else coro.send(value)
+        except StopIteration as stop:
+            on_cpu(time.thread_time() - start)
+            return stop.value
+        except BaseException:
+            on_cpu(time.thread_time() - start)
+            raise
+        on_cpu(time.thread_time() - start)
+        try:
+            value, error = (yield future), None
+        except BaseException as e:
+            value, error = None, e
+
+guild_accounting = GuildAccounting()
+
+class RestAccounting:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.features = {}
+        self.started = time.time()
+
+    def install(self, http):
+        original_request = http.request
+
+        async def request(route, **kwargs):
+            call = {"rate_limited": 0}
+            token = current_rest_call.set(call)
+            feature = rest_feature.get() or self.infer_feature()
+            start = time.perf_counter()
+            status = "ok"
+            guild_accounting.record_rest(route)
+            try:
+                return await original_request(route, **kwargs)
+            except HTTPException as e:
+                status = e.status
+                raise
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                current_rest_call.reset(token)
+                self.record(feature, f"{route.method} {route.path}", (time.perf_counter() - start) * 1000, status, call["rate_limited"])
+
+        http.request = request
+
+    @staticmethod
+    def infer_feature():
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == __file__ and code.co_name != "request":
+                return f"code:{code.co_name}"
+            frame = frame.f_back
+        return "discord.py"
+
+    def record(self, feature, route, elapsed_ms, status, rate_limited):
+        with self.lock:
+            for table, key in ((self.routes, route), (self.features, feature)):
+                entry = table.get(key)
+                if entry is None:
+                    entry = table[key] = {"count": 0, "errors": 0, "rate_limited": 0, "total_ms": 0.0, "max_ms": 0.0, "by": defaultdict(int)}
+                entry["count"] += 1
+                entry["total_ms"] += elapsed_ms
+                entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+                entry["rate_limited"] += rate_limited
+                if status != "ok":
+                    entry["errors"] += 1
+                entry["by"][feature if table is self.routes else route] += 1
+
+    def total_calls(self, feature=None):
+        with self.lock:
+            if feature is not None:
+                return self.features.get(feature, {}).get("count", 0)
+            return sum(entry["count"] for entry in self.routes.values())
+
+    def snapshot(self):
+        with self.lock:
+            copy_table = lambda table: {key: dict(entry, by=dict(entry["by"])) for key, entry in table.items()}
+            return {"since": self.started, "routes": copy_table(self.routes), "features": copy_table(self.features)}
+
+    def format_top(self, kind="features", top=10):
+        rows = sorted(self.snapshot()[kind].items(), key=lambda item: -item[1]["count"])[:top]
+        return [
+            f"{key[:44]:<45}{entry['count']:>6}{entry['rate_limited']:>5}{entry['errors']:>5}{entry['total_ms'] / entry['count']:>7.0f}ms"
+            for key, entry in rows
+        ]
+
+class RateLimitLogFilter(logging.Filter):
+    def filter(self, record):
+        if isinstance(record.msg, str) and record.msg.startswith("We are being rate limited."):
+            call = current_rest_call.get()
+            if call is not None:
+                call["rate_limited"] += 1
+        return True
+
+rest_accounting = RestAccounting()
+rest_accounting.install(bot.http)
+logging.getLogger("discord.http").addFilter(RateLimitLogFilter())
+
+@tasks.loop(minutes=10)
+async def dump_rest_accounting():
+    lines = rest_accounting.format_top("features", top=10)
+    if lines:
+        logger.info("REST usage by feature (count / 429s / errors / avg):\n" + "\n".join(lines))
+
+@bot.before_invoke
+async def start_command_timer(ctx):
+    ctx.metrics_started = time.perf_counter()
+    rest_feature.set(f"command:{ctx.command.qualified_name}")
+
+@bot.after_invoke
+async def record_command_timing(ctx):
+    started = getattr(ctx, "metrics_started", None)
+    if started is None or ctx.command is None:
+        return
+    failed = ctx.command_failed or getattr(ctx, "reported_failure", False)
+    command_metrics.observe(ctx.command.qualified_name, time.perf_counter() - started, failed)
+
+@bot.listen("on_command_error")
+async def record_command_error(ctx, error):
+    if ctx.command is None:
+        return
+    if isinstance(error, commands.CommandOnCooldown):
+        command_metrics.record_cooldown(ctx.command.qualified_name)
+    elif getattr(ctx, "metrics_started", None) is None:
+        # Rejected before the command body ran (checks, bad arguments), so after_invoke never fires.
+        command_metrics.observe(ctx.command.qualified_name, 0.0, True)
+
+LOOP_LAG_INTERVAL_SECONDS = 0.1
+LOOP_BLOCK_THRESHOLD_SECONDS = float(os.getenv("LOOP_BLOCK_THRESHOLD_SECONDS", 0.5))
+
+class EventLoopMonitor:
+    def __init__(self, interval=LOOP_LAG_INTERVAL_SECONDS, block_threshold=LOOP_BLOCK_THRESHOLD_SECONDS):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.lock = threading.Lock()
+        self.handlers = {}
+        self.lags = deque(maxlen=600)
+        self.max_lag = 0.0
+        self.blocked = deque(maxlen=10)
+        self.blocked_count = 0
+        self.heartbeat = time.monotonic()
+        self.loop_thread_id = None
+        self.task = None
+        self.watchdog = None
+        self.stopping = threading.Event()
+
+    def instrument(self, name, handler):
+        @functools.wraps(handler)
+        async def monitored(*args, **kwargs):
+            rest_feature.set(f"event:{name}")
+            guild_id = event_guild_id(args)
+            current_guild_id.set(guild_id)
+            guild_accounting.add(guild_id, "events")
+            charge_cpu = lambda seconds: guild_accounting.add(guild_id, "cpu_ms", seconds * 1000)
+            start = time.perf_counter()
+            try:
+                return await metered(handler(*args, **kwargs), charge_cpu)
+            finally:
+                self.record_handler(name, time.perf_counter() - start)
+        monitored.monitored_handler = handler
+        return monitored
+
+    def record_handler(self, name, seconds):
+        with self.lock:
+            entry = self.handlers.get(name)
+            if entry is None:
+                entry = self.handlers[name] = {"count": 0, "total": 0.0, "max": 0.0}
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def start(self):
+        if self.task is not None:
+            return
+        self.loop_thread_id = threading.get_ident()
+        self.heartbeat = time.monotonic()
+        self.stopping.clear()
+        self.task = asyncio.get_running_loop().create_task(self._sample_lag())
+        self.watchdog = Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self.watchdog.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def _sample_lag(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - scheduled - self.interval)
+            self.heartbeat = time.monotonic()
+            with self.lock:
+                self.lags.append(lag)
+                self.max_lag = max(self.max_lag, lag)
+
+    def _watch(self):
+        reported_heartbeat = None
+        while not self.stopping.wait(self.interval / 2):
+            heartbeat = self.heartbeat
+            stalled = time.monotonic() - heartbeat
+            if stalled < self.block_threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self.loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<no frame>"
+            with self.lock:
+                self.blocked_count += 1
+                self.blocked.append({"at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "stalled": stalled, "stack": stack})
+            logger.warning(f"Event loop blocked for {stalled * 1000:.0f} ms (threshold {self.block_threshold * 1000:.0f} ms). Stack:\n{stack}")
+
+    def summary(self):
+        with self.lock:
+            lags = sorted(self.lags)
+            handlers = {name: dict(entry) for name, entry in self.handlers.items()}
+            blocked = list(self.blocked)
+            blocked_count = self.blocked_count
+            max_lag = self.max_lag
+        percentile = lambda fraction: lags[min(len(lags) - 1, int(fraction * len(lags)))] if lags else 0.0
+        return {
+            "lag_p50": percentile(0.50),
+            "lag_p99": percentile(0.99),
+            "lag_max": max_lag,
+            "blocked_count": blocked_count,
+            "blocked": blocked,
+            "handlers": handlers,
+        }
+
+loop_monitor = EventLoopMonitor()
+
+GATEWAY_TRACE_PATH = os.path.join("workspace", "gateway_traces")
+GATEWAY_TRACE_FILE = os.getenv("GATEWAY_TRACE_FILE")
+TRACE_SNOWFLAKE_BASE = 1100000000000000000
+
+class TraceAnonymizer:
+    # Structural values the handlers branch on are kept; every other string is masked to its own length so payload sizes survive
+    KEEP_KEYS = frozenset({
+        "type", "permissions", "allow", "deny", "flags", "public_flags", "locale", "preferred_locale", "status",
+        "custom_id", "component_type", "format_type", "content_type", "rtc_region", "discriminator",
+    })
+    KEEP_SUFFIXES = ("timestamp", "_at", "_since", "_until")
+    MENTION_PATTERN = re.compile(r"<(@!?|@&|#)(\d{15,20})>")
+
+    def __init__(self):
+        self.ids = {}
+
+    def snowflake(self, value):
+        pseudonym = self.ids.get(value)
+        if pseudonym is None:
+            pseudonym = self.ids[value] = str(TRACE_SNOWFLAKE_BASE + len(self.ids))
+        return pseudonym
+
+    def scrub(self, value, key=None):
+        if isinstance(value, dict):
+            return {name: self.scrub(item, name) for name, item in value.items()}
+        if isinstance(value, list):
+            return [self.scrub(item, key) for item in value]
+        if not isinstance(value, str):
+            return value
+        if value.isdigit() and 15 <= len(value) <= 20 and key not in self.KEEP_KEYS:
+            return self.snowflake(value)
+        if key in self.KEEP_KEYS or (key and key.endswith(self.KEEP_SUFFIXES)):
+            return value
+        if key == "content":
+            return self.scrub_content(value)
+        return "x" * len(value)
+
+    def scrub_content(self, value):
+        # Command names and mentions survive (mentions remapped) so prefix commands and converters still work on replay
+        command = ""
+        if value.startswith(bot.command_prefix):
+            name, separator, value = value.partition(" ")
+            command = name + separator
+        parts, last = [], 0
+        for match in self.MENTION_PATTERN.finditer(value):
+            parts.append("x" * (match.start() - last))
+            parts.append(f"<{match.group(1)}{self.snowflake(match.group(2))}>")
+            last = match.end()
+        parts.append("x" * (len(value) - last))
+        return command + "".join(parts)
+
+class GatewayTraceRecorder:
+    def __init__(self):
+        self.queue = SimpleQueue()
+        self.thread = None
+        self.path = None
+        self.started = 0.0
+        self.events = 0
+        self.installed = False
+
+    def install(self, state):
+        # discord.py dispatches through this dict, so wrapping its entries sees every gateway event before parsing
+        for event, parser in list(state.parsers.items()):
+            state.parsers[event] = self._wrap(event, parser)
+        self.installed = True
+
+    def _wrap(self, event, parser):
+        def record_and_parse(data):
+            if self.path is not None:
+                self.events += 1
+                # Only a C-level dump happens on the loop; anonymizing and disk writes run on the writer thread
+                self.queue.put((time.perf_counter() - self.started, event, json.dumps(data)))
+            return parser(data)
+        return record_and_parse
+
+    def start(self, path):
+        if not self.installed:
+            self.install(bot._connection)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.started = time.perf_counter()
+        self.events = 0
+        self.thread = threading.Thread(target=self._write, args=(path, TraceAnonymizer()), name="gateway-trace", daemon=True)
+        self.thread.start()
+        self.path = path
+        logging.info(f"Recording gateway trace to {path}.")
+
+    def stop(self):
+        path, self.path = self.path, None
+        if path is None:
+            return None
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+        logging.info(f"Stopped gateway trace {path} after {self.events} events.")
+        return path
+
+    def _write(self, path, anonymizer):
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"trace": "discord-gateway", "version": 1, "started": datetime.now().isoformat()}) + "\n")
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                offset, event, raw = item
+                file.write(json.dumps({"t": round(offset, 6), "event": event, "d": anonymizer.scrub(json.loads(raw))}, separators=(",", ":")) + "\n")
+
+gateway_trace = GatewayTraceRecorder()
+
+def instrument_event_handlers():
+    for name in dir(bot):
+        if not name.startswith("on_"):
+            continue
+        handler = getattr(bot, name)
+        if asyncio.iscoroutinefunction(handler) and not hasattr(handler, "monitored_handler") and name in bot.__dict__:
+            setattr(bot, name, loop_monitor.instrument(name, handler))
+    for event_name, listeners in bot.extra_events.items():
+        listeners[:] = [
+            listener if hasattr(listener, "monitored_handler") else loop_monitor.instrument(f"{event_name}:{listener.__name__}", listener)
+            for listener in listeners
+        ]
+
+''' ----- Metrics ----- '''
+#
+#
+#
 ''' ----- Bot Events ----- '''
 
+STARTUP_CONCURRENCY = int(os.getenv("STARTUP_CONCURRENCY", 8))
+STARTUP_PROGRESS_INTERVAL_SECONDS = float(os.getenv("STARTUP_PROGRESS_INTERVAL_SECONDS", 5))
+# One semaphore for every startup phase, so running them side by side does not multiply the REST calls in flight
+startup_semaphore = asyncio.Semaphore(STARTUP_CONCURRENCY)
+startup_task = None
+presence_task = None
+
+async def run_startup_phase(name, items, worker):
+    items = list(items)
+    done = 0
+    last_progress = time.perf_counter()
+
+    async def run(item):
+        nonlocal done, last_progress
+        async with startup_semaphore:
+            await worker(item)
+        done += 1
+        now = time.perf_counter()
+        if done == len(items) or now - last_progress >= STARTUP_PROGRESS_INTERVAL_SECONDS:
+            last_progress = now
+            logger.info(f"Startup {name}: {done}/{len(items)} done")
+
+    with startup_report.phase(name):
+        await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+async def fetch_guild_invites(guild):
+    try:
+        invite_cache[guild.id] = await guild.invites()
+    except Exception as e:
+        await handle_exception(bot, f"fetch_invites_{guild.id}", "Failure", error=e)
+        logger.info(f"Failed to fetch invites for guild {guild.id}: {e}")
+
+def command_tree_hash(guild=None):
+    commands = sorted((command.to_dict(bot.tree) for command in bot.tree.get_commands(guild=guild)), key=lambda command: (command.get("type", 1), command["name"]))
+    return hashlib.sha256(json.dumps(commands, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+async def sync_command_tree(guild=None, force=False):
+    # The hash is stored per application and scope, so a reconnect or restart with an unchanged tree makes no REST call
+    scope = f"guild:{guild.id}" if guild else "global"
+    key = f"command_tree_hash:{bot.application_id}:{scope}"
+    digest = command_tree_hash(guild)
+    if not force and await asyncio.to_thread(storage.get_meta, key) == digest:
+        return False
+    await bot.tree.sync(guild=guild)
+    await asyncio.to_thread(storage.set_meta, key, digest)
+    logger.info(f"Synced application commands for {scope}")
+    return True
+
+async def sync_guild_commands(guild):
+    try:
+        await sync_command_tree(discord.Object(id=guild.id) if guild else None)
+    except Exception as e:
+        await handle_exception(bot, f"sync_guild_{guild.id}" if guild else "sync_global", "Failure", error=e)
+
+async def prewarm_guild_settings(store):
+    try:
+        await store.prewarm([guild.id for guild in bot.guilds])
+    except Exception as e:
+        await handle_exception(bot, f"prewarm_{store.name}", "Failure", error=e)
+
+async def run_startup_phases():
+    await asyncio.gather(
+        run_startup_phase("guild_settings_prewarm", GUILD_SETTINGS_STORES, prewarm_guild_settings),
+        run_startup_phase("invite_fetch", bot.guilds, fetch_guild_invites),
+        run_startup_phase("tree_sync", [None, *bot.guilds], sync_guild_commands),
+    )
+    startup_report.finish()
+
+# gateway connected, before the guilds stream in
+@bot.listen("on_connect")
+async def mark_gateway_connected():
+    startup_report.mark("gateway_connected")
+
 # bot ready
 @bot.event
 async def on_ready():
-    global logging_channel_ids, invite_cache, welcome_messages
+    global invite_cache, startup_task, presence_task
+    startup_report.mark("on_ready_started")
     
     game = discord.Activity(type=discord.ActivityType.watching, name="haiya")
     logger.info(f'Bot has logged in as {bot.user}!')
@@ -405,73 +2036,36 @@ async def on_ready():
                 await handle_exception(bot, "change_activity", "Failure", error=e)
                 logger.error(f"Error updating presence: {e}")
 
-    bot.loop.create_task(change_activity())
+    # READY fires again after a reconnect; one presence loop is enough
+    if presence_task is None or presence_task.done():
+        presence_task = bot.loop.create_task(change_activity())
 
-    try:
-        if ticket_embeds is None:
-            load_ticket_embeds()
-    except Exception as e:
-        await handle_exception(bot, "load_ticket_embeds", "Failure", error=e)
+    if not evict_idle_guild_settings.is_running():
+        evict_idle_guild_settings.start()
 
-    try:
-        log_channels_data = load_log_channels()
-        logging_channel_ids = {}
-
-        for guild_id, data in log_channels_data.items():
-            guild = bot.get_guild(int(guild_id))
-            if guild:
-                channel = guild.get_channel(data["channel_id"])
-                if channel:
-                    logging_channel_ids[int(guild_id)] = channel.id
-                    logger.info(f"Logging channel for guild {guild_id} set to channel {channel.id}")
-    except Exception as e:
-        await handle_exception(bot, "load_log_channels", "Failure", error=e)
+    if not log_exception_summary.is_running():
+        log_exception_summary.start()
 
-    try:
-        welcome_messages = load_welcome_messages()
-    except Exception as e:
-        await handle_exception(bot, "load_welcome_messages", "Failure", error=e)
+    if not dump_rest_accounting.is_running():
+        dump_rest_accounting.start()
 
-    for guild in bot.guilds:
-        try:
-            invite_cache[guild.id] = await guild.invites()
-        except Exception as e:
-            await handle_exception(bot, f"fetch_invites_{guild.id}", "Failure", error=e)
-            logger.info(f"Failed to fetch invites for guild {guild.id}: {e}")
-            
     if shutil.which("ffmpeg") is None:
         logger.info("FFmpeg is not installed. Please install FFmpeg to use voice features.")
 
     try:
-        cleanup_downloaded_music()
+        with startup_report.phase("cleanup_downloaded_music"):
+            cleanup_downloaded_music()
         logger.info("Just cleaned up old files.")
     except Exception as e:
         await handle_exception(bot, "cleanup_downloaded_music", "Failure", error=e)
 
-    for guild in bot.guilds:
-        try:
-            await bot.tree.sync(guild=discord.Object(id=guild.id))
-        except Exception as e:
-            await handle_exception(bot, f"sync_guild_{guild.id}", "Failure", error=e)
+    if not compact_ticket_journal.is_running():
+        compact_ticket_journal.start()
 
-    for ticket_id, ticket_data in ticket_embeds.items():
-        try:
-            guild = bot.get_guild(ticket_data["guild_id"])
-            if guild:
-                channel = guild.get_channel(ticket_data["channel_id"])
-                if channel:
-                    try:
-                        message = await channel.fetch_message(ticket_data["message_id"])
-                        view = SupportTicketView(ticket_embed_id=ticket_id, button_label=ticket_data["button_label"])
-                        await message.edit(view=view)
-                        logger.info(f"Reconnected ticket button for ticket ID {ticket_id}")
-                    except discord.NotFound:
-                        logger.info(f"Ticket message for ticket ID {ticket_id} not found in channel {channel.id}")
-                    except discord.Forbidden:
-                        logger.warning(f"Missing permissions to fetch message or edit view in channel {channel.id}")
-        except Exception as e:
-            await handle_exception(bot, f"reconnect_ticket_{ticket_id}", "Failure", error=e)
-            print(f"Failed to reconnect ticket button for ticket ID {ticket_id}: {e}")
+    # Commands work from here on; the REST-heavy phases continue in the background
+    startup_report.mark("on_ready_complete")
+    if startup_task is None or startup_task.done():
+        startup_task = bot.loop.create_task(run_startup_phases())
 
 # Bot joined the server (Check who invited and the datetime)
 @bot.event
@@ -522,36 +2116,21 @@ async def language(ctx, lang_code: str):
         return
 
     lang_code = lang_code.lower()
-    supported_languages = ["en", "ja", "zh"]
+    supported_languages = catalog.available_languages()
 
     if lang_code not in supported_languages:
         await ctx.send(embed=discord.Embed(
             title="Invalid Language Code",
-            description="Supported language codes are: `en` (English), `ja` (Japanese), `zh` (Chinese).",
+            description=f"Supported language codes are: {', '.join(f'`{code}`' for code in supported_languages)}.",
             color=discord.Color.red()
         ))
         return
 
     await set_language(ctx.guild.id, lang_code)
 
-    MESSAGES = {
-        "en": {
-            "title": "Language Updated",
-            "description": "The bot language has been set to English."
-        },
-        "ja": {
-            "title": "言語が更新されました",
-            "description": "ボットの言語が日本語に設定されました。"
-        },
-        "zh": {
-            "title": "語言已更新",
-            "description": "機器人語言已設置為繁體中文。"
-        }
-    }
-
     embed = discord.Embed(
-        title=MESSAGES[lang_code]["title"],
-        description=MESSAGES[lang_code]["description"],
+        title=catalog.text(lang_code, "language.title"),
+        description=catalog.text(lang_code, "language.description"),
         color=discord.Color.green()
     )
     await ctx.send(embed=embed)
@@ -571,236 +2150,11 @@ async def language_error(ctx, error):
         ))
 
 # help
-COMMAND_HELP_TEXTS = {
-    "zh": {
-        "main_embed": {
-            "title": "Yuzu bot指令列表",
-            "description": "從下拉選單中選擇一個類別以查看相關指令。",
-            "select_placeholder": "選擇您需要幫助的內容"
-        },
-        "options": {
-            "general": {"label": "一般指令", "description": "機器人的一般指令", "emoji": "📝"},
-            "fun": {"label": "娛樂指令", "description": "娛樂和有趣的指令", "emoji": "🎉"},
-            "ticket": {"label": "支援票指令", "description": "管理支援票的指令", "emoji": "🎟️"},
-            "logs": {"label": "記錄頻道指令", "description": "管理記錄頻道的指令", "emoji": "📜"},
-            "welcome": {"label": "歡迎訊息指令", "description": "設置歡迎訊息的指令", "emoji": "👋"},
-            "music": {"label": "音樂指令", "description": "播放和控制音樂指令", "emoji": "🎵"},
-            "tools": {"label": "工具指令", "description": "各種工具相關指令", "emoji": "🛠️"}
-        },
-        "General Commands": {
-            "title": "一般指令",
-            "commands": {
-                "$language en/ja/zh": "更改Yuzu bot語言",
-                "$help": "顯示指令幫助",
-                "$ping": "確認機器人是否在線",
-                "$info": "獲取機器人資訊",
-                "$invitebot": "獲取機器人邀請連結"
-            }
-        },
-        "Tools Commands": {
-            "title": "工具指令",
-            "commands": {
-                "$serverlink": "獲取伺服器邀請連結",
-                "$typhoonday": "獲取停班停課消息🌀",
-                "$timezone": "顯示常見國家的當地時間"
-            }
-        },
-        "Fun Commands": {
-            "title": "娛樂指令",
-            "commands": {
-                "$luck": "測運氣分數🍀",
-                "$advice": "隨機建議"
-            }
-        },
-        "Ticket Commands": {
-            "title": "支援票指令",
-            "commands": {
-                "$ticket": "建立支援票",
-                "$close": "關閉支援票並生成聊天記錄",
-                "$end": "關閉支援票頻道"
-            }
-        },
-        "Logs Channel Commands": {
-            "title": "記錄頻道指令",
-            "commands": {
-                "$setlogschannel <channelid>": "設定記錄頻道",
-                "$removelogschannel": "刪除記錄頻道"
-            }
-        },
-        "Welcome Message Commands": {
-            "title": "歡迎訊息指令",
-            "commands": {
-                "$setwelcomechannel <channelid>": "設定歡迎頻道",
-                "$setwelcomemessage": "設定歡迎訊息",
-                "$removewelcomechannel": "刪除歡迎頻道"
-            }
-        },
-        "Music Commands": {
-            "title": "音樂指令",
-            "commands": {
-                "$play <url of youtube/spotify/soundcloud>": "播放音樂或將音樂添加到隊列",
-                "$stop": "停止播放並清空隊列",
-                "$loop track/queue/off": "循環播放單曲或整個隊列或關掉",
-                "$tracklist": "顯示當前播放隊列",
-                "$skip": "跳過當前曲目"
-            }
-        }
-    },
-    "ja": {
-        "main_embed": {
-            "title": "ユズボットコマンドリスト",
-            "description": "ドロップダウンからカテゴリを選択して、関連するコマンドを確認できます。",
-            "select_placeholder": "助けが必要な内容を選択してください"
-        },
-        "options": {
-            "general": {"label": "一般コマンド", "description": "ボットの一般コマンド", "emoji": "📝"},
-            "fun": {"label": "楽しいコマンド", "description": "エンターテイメントと楽しいコマンド", "emoji": "🎉"},
-            "ticket": {"label": "チケットコマンド", "description": "チケット管理のコマンド", "emoji": "🎟️"},
-            "logs": {"label": "ログチャンネルコマンド", "description": "ログチャンネルの管理コマンド", "emoji": "📜"},
-            "welcome": {"label": "ウェルカムメッセージコマンド", "description": "ウェルカムメッセージの設定コマンド", "emoji": "👋"},
-            "music": {"label": "音楽コマンド", "description": "音楽を再生および操作するコマンド", "emoji": "🎵"},
-            "tools": {"label": "ツールコマンド", "description": "様々なツール関連コマンド", "emoji": "🛠️"}
-        },
-        "General Commands": {
-            "title": "一般コマンド",
-            "commands": {
-                "$language en/ja/zh": "ユズボットの言語を変更する",
-                "$help": "コマンドヘルプを表示",
-                "$ping": "ボットがオンラインか確認",
-                "$info": "ボットの情報を取得",
-                "$invitebot": "ボットの招待リンクを取得"
-            }
-        },
-        "Tools Commands": {
-            "title": "ツールコマンド",
-            "commands": {
-                "$serverlink": "サーバーの招待リンクを取得",
-                "$typhoonday": "台湾の台風情報取得🌀",
-                "$timezone": "各国の現在時刻を表示"
-            }
-        },
-        "Fun Commands": {
-            "title": "楽しいコマンド",
-            "commands": {
-                "$luck": "運勢を確認🍀",
-                "$advice": "ランダムなアドバイス"
-            }
-        },
-        "Ticket Commands": {
-            "title": "チケットコマンド",
-            "commands": {
-                "$ticket": "サポートチケットを作成",
-                "$close": "チケットを閉じて記録を生成",
-                "$end": "チケットチャネルを閉じる"
-            }
-        },
-        "Logs Channel Commands": {
-            "title": "ログチャンネルコマンド",
-            "commands": {
-                "$setlogschannel <channelid>": "ログチャンネルを設定",
-                "$removelogschannel": "ログチャンネルを削除"
-            }
-        },
-        "Welcome Message Commands": {
-            "title": "ウェルカムメッセージコマンド",
-            "commands": {
-                "$setwelcomechannel <channelid>": "ウェルカムチャンネルを設定",
-                "$setwelcomemessage": "ウェルカムメッセージを設定",
-                "$removewelcomechannel": "ウェルカムチャンネルを削除"
-            }
-        },
-        "Music Commands": {
-            "title": "音楽コマンド",
-            "commands": {
-                "$play <url of youtube/spotify/soundcloud>": "音楽を再生するか、キューに追加する",
-                "$stop": "再生を停止してキューをクリア",
-                "$loop track/queue/off": "単曲、全キューをループ再生または停止",
-                "$tracklist": "現在のキューを表示",
-                "$skip": "現在の曲をスキップする"
-            }
-        }
-    },
-    "en": {
-        "main_embed": {
-            "title": "Yuzu bot Command list",
-            "description": "Select a category from the dropdown to see relevant commands.",
-            "select_placeholder": "Select what you need help with"
-        },
-        "options": {
-            "general": {"label": "General Commands", "description": "General bot commands", "emoji": "📝"},
-            "fun": {"label": "Fun Commands", "description": "Entertainment and fun commands", "emoji": "🎉"},
-            "ticket": {"label": "Ticket Commands", "description": "Commands for managing tickets", "emoji": "🎟️"},
-            "logs": {"label": "Logs Channel Commands", "description": "Commands for logs channel management", "emoji": "📜"},
-            "welcome": {"label": "Welcome Message Commands", "description": "Commands for setting welcome messages", "emoji": "👋"},
-            "music": {"label": "Music Commands", "description": "Commands for playing and managing music", "emoji": "🎵"},
-            "tools": {"label": "Tools Commands", "description": "Various utility-related commands", "emoji": "🛠️"}
-        },
-        "General Commands": {
-            "title": "General Commands",
-            "commands": {
-                "$language en/ja/zh": "Change the language of Yuzu bot",
-                "$help": "Show command help",
-                "$ping": "Check if the bot is online",
-                "$info": "Get bot information",
-                "$invitebot": "Get bot invite link"
-            }
-        },
-        "Tools Commands": {
-            "title": "Tools Commands",
-            "commands": {
-                "$serverlink": "Get server invite link",
-                "$typhoonday": "Get Taiwan typhoon day information 🌀",
-                "$timezone": "Show local time for some countries"
-            }
-        },
-        "Fun Commands": {
-            "title": "Fun Commands",
-            "commands": {
-                "$luck": "Check luck score 🍀",
-                "$advice": "Get random advice"
-            }
-        },
-        "Ticket Commands": {
-            "title": "Ticket Commands",
-            "commands": {
-                "$ticket": "Create a support ticket embed message",
-                "$close": "Close the ticket and generate a transcript",
-                "$end": "Close the ticket channel"
-            }
-        },
-        "Logs Channel Commands": {
-            "title": "Logs Channel Commands",
-            "commands": {
-                "$setlogschannel <channelid>": "Set up the logs channel",
-                "$removelogschannel": "Remove the logs channel from the server"
-            }
-        },
-        "Welcome Message Commands": {
-            "title": "Welcome Message Commands",
-            "commands": {
-                "$setwelcomechannel <channelid>": "Set up the welcome channel",
-                "$setwelcomemessage": "Set up the welcome message",
-                "$removewelcomechannel": "Remove the welcome channel from the server"
-            }
-        },
-        "Music Commands": {
-            "title": "Music Commands",
-            "commands": {
-                "$play <url of youtube/spotify/soundcloud>": "Play music or add it to the queue",
-                "$stop": "Stop playback and clear the queue",
-                "$loop track/queue/off": "Loop single track, entire queue, or turn off looping",
-                "$tracklist": "Show the current playback queue",
-                "$skip": "Skip the current track"
-            }
-        }
-    }
-}
-
 class HelpSelectMenu(View):
     def __init__(self, language):
         super().__init__(timeout=None)
         self.language = language
-        language_texts = COMMAND_HELP_TEXTS.get(self.language, {})
+        language_texts = catalog.get(self.language, "help", {})
 
         options_texts = language_texts.get("options", {})
 
@@ -859,8 +2213,7 @@ class HelpSelectMenu(View):
 
     async def select_callback(self, interaction: discord.Interaction):
         selection = interaction.data["values"][0]
-        language_texts = COMMAND_HELP_TEXTS.get(self.language, {})
-        category_texts = language_texts.get(selection, {})
+        category_texts = catalog.get(self.language, f"help.{selection}", {})
 
         embed = discord.Embed(color=0x5865F2)
         embed.title = category_texts.get("title", "Help")
@@ -871,6 +2224,15 @@ class HelpSelectMenu(View):
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+def build_help_response(language):
+    main_embed_text = catalog.get(language, "help.main_embed", {})
+    embed = discord.Embed(
+        title=main_embed_text.get("title", "Command Help"),
+        description=main_embed_text.get("description", "Select a category to view commands."),
+        color=0x5865F2
+    )
+    return {"embed": embed, "view": HelpSelectMenu(language)}
+
 bot.remove_command("help")
 @bot.command(name="help")
 @commands.cooldown(rate=1, per=3, type=commands.BucketType.user)
@@ -882,40 +2244,30 @@ async def help(ctx):
         else:
             language = "en"
 
-        main_embed_text = COMMAND_HELP_TEXTS[language].get("main_embed", {})
-
-        embed = discord.Embed(
-            title=main_embed_text.get("title", "Command Help"),
-            description=main_embed_text.get("description", "Select a category to view commands."),
-            color=0x5865F2
-        )
-        await ctx.send(embed=embed, view=HelpSelectMenu(language))
+        await ctx.send(**response_templates.get("help", language, build_help_response))
     except commands.CommandOnCooldown as cooldown_error:
         await handle_cooldown_error(ctx, cooldown_error)
     except Exception as error:
         await handle_exception(ctx, "help", "Failure", error)
 
 # info
-INFO_TEXTS = {
-    "zh": {
-        "title": "Yuzu Bot 詳細資訊",
-        "description": "Hello, 我的名字是Yuzu, 是一個由badlyac和shino開發出來的Discord bot (●'◡'●),\n如果您遇到問題需要回報請在Discord上聯絡我們, 謝謝! (ids: badlyac, shinoxdd)",
-        "github": "[BadlyacX](https://github.com/BadlyacX) [shinoxdd](https://github.com/shinoxdd)",
-        "footer": "Thank you for using Yuzu Bot!"
-    },
-    "ja": {
-        "title": "ユズーボット詳細情報",
-        "description": "こんにちわ！、僕の名前はユズです。Discordボットとしてbadlyacとshinoによって作成されました (●'◡'●)。\n問題が発生した場合は、Discordで私たちに連絡してください（ID: badlyac, shinoxdd）。",
-        "github": "[BadlyacX](https://github.com/BadlyacX) [shinoxdd](https://github.com/shinoxdd)",
-        "footer": "Yuzu Botをご利用いただきありがとうございます！"
-    },
-    "en": {
-        "title": "Yuzu Bot Information",
-        "description": "Hello, I am Yuzu, a Discord bot developed by badlyac and shino (●'◡'●),\nIf you encounter any problems please contact us on Discord (ids: badlyac, shinoxdd)",
-        "github": "[BadlyacX](https://github.com/BadlyacX) [shinoxdd](https://github.com/shinoxdd)",
-        "footer": "Thank you for using Yuzu Bot!"
-    }
-}
+def build_info_response(language):
+    info_text = catalog.section(language, "info")
+
+    botinfo_embed = discord.Embed(
+        title=info_text["title"],
+        description=info_text["description"],
+        color=discord.Color.green()
+    )
+    
+    botinfo_embed.add_field(
+        name="GitHub Repository",
+        value=info_text["github"],
+        inline=False
+    )
+
+    botinfo_embed.set_footer(text=info_text["footer"])
+    return {"embed": botinfo_embed}
 
 @bot.command()
 @commands.cooldown(1, 3, commands.BucketType.user)
@@ -927,23 +2279,7 @@ async def info(ctx):
         else:
             language = "en"
 
-        info_text = INFO_TEXTS.get(language, INFO_TEXTS["en"])
-
-        botinfo_embed = discord.Embed(
-            title=info_text["title"],
-            description=info_text["description"],
-            color=discord.Color.green()
-        )
-        
-        botinfo_embed.add_field(
-            name="GitHub Repository",
-            value=info_text["github"],
-            inline=False
-        )
-
-        botinfo_embed.set_footer(text=info_text["footer"])
-
-        await ctx.send(embed=botinfo_embed)
+        await ctx.send(**response_templates.get("info", language, build_info_response))
         await handle_exception(ctx, "info", "Success")
         
     except Exception as e:
@@ -953,24 +2289,6 @@ async def info_error(ctx, error):
     await handle_cooldown_error(ctx, error)
     
 # serverlink
-SERVERLINK_TEXTS = {
-    "zh": {
-        "title": "伺服器邀請連結",
-        "description": "邀請連結: {url}",
-        "footer": "此邀請連結一小時內有效。"
-    },
-    "ja": {
-        "title": "サーバー招待リンク",
-        "description": "招待リンク: {url}",
-        "footer": "この招待リンクは1時間有効です。"
-    },
-    "en": {
-        "title": "Server Invite Link",
-        "description": "Invite Link: {url}",
-        "footer": "This invite link is valid for one hour."
-    }
-}
-
 @bot.command()
 @commands.cooldown(1, 3, commands.BucketType.user)
 async def serverlink(ctx):
@@ -983,7 +2301,7 @@ async def serverlink(ctx):
             invite = None
             language = "en"
 
-        link_text = SERVERLINK_TEXTS.get(language, SERVERLINK_TEXTS["en"])
+        link_text = catalog.section(language, "serverlink")
 
         if invite:
             description = link_text["description"].format(url=invite.url)
@@ -1007,26 +2325,25 @@ async def serverlink_error(ctx, error):
     await handle_exception(ctx, "serverlink", "Failure", error=error)
         
 # invitebot
-INVITEBOT_TEXTS = {
-    "zh": {
-        "title": "邀請 Yuzu Bot",
-        "description": "點擊下方按鈕邀請 Yuzu Bot 加入您的伺服器！",
-        "footer": "感謝您考慮將 Yuzu Bot 加入您的伺服器！",
-        "button_label": "邀請 Yuzu Bot"
-    },
-    "ja": {
-        "title": "ユズボットを招待",
-        "description": "下のボタンをクリックして、ユズボットをサーバーに招待しましょう！",
-        "footer": "ユズボットをご検討いただきありがとうございます！",
-        "button_label": "タイガーボットを招待"
-    },
-    "en": {
-        "title": "Invite Yuzu Bot",
-        "description": "Click the button below to invite Yuzu Bot to your server!",
-        "footer": "Thank you for considering Yuzu Bot for your server!",
-        "button_label": "Invite Yuzu Bot"
-    }
-}
+def build_invitebot_response(language):
+    invite_text = catalog.section(language, "invitebot")
+
+    invite_embed = discord.Embed(
+        title=invite_text["title"],
+        description=invite_text["description"],
+        color=discord.Color.purple()
+    )
+    invite_embed.set_footer(text=invite_text["footer"])
+
+    invite_button = Button(
+        label=invite_text["button_label"],
+        url="https://discord.com/oauth2/authorize?client_id=1303629862011011082&permissions=8&integration_type=0&scope=bot"
+    )
+    
+    # Link buttons never dispatch interactions, so one view can back every message.
+    view = View(timeout=None)
+    view.add_item(invite_button)
+    return {"embed": invite_embed, "view": view}
 
 @bot.command()
 @commands.cooldown(1, 3, commands.BucketType.user)
@@ -1038,24 +2355,7 @@ async def invitebot(ctx):
         else:
             language = "en"
 
-        invite_text = INVITEBOT_TEXTS.get(language, INVITEBOT_TEXTS["en"])
-
-        invite_embed = discord.Embed(
-            title=invite_text["title"],
-            description=invite_text["description"],
-            color=discord.Color.purple()
-        )
-        invite_embed.set_footer(text=invite_text["footer"])
-
-        invite_button = Button(
-            label=invite_text["button_label"],
-            url="https://discord.com/oauth2/authorize?client_id=1303629862011011082&permissions=8&integration_type=0&scope=bot"
-        )
-        
-        view = View()
-        view.add_item(invite_button)
-
-        await ctx.send(embed=invite_embed, view=view)
+        await ctx.send(**response_templates.get("invitebot", language, build_invitebot_response))
         await handle_exception(ctx, "invitebot", "Success")
     except Exception as e:
         await handle_exception(ctx, "invitebot", "Failure", error=e)
@@ -1064,33 +2364,6 @@ async def invitebot_error(ctx, error):
     await handle_cooldown_error(ctx, error)
 
 # luck
-LUCK_TEXTS = {
-    "zh": {
-        "loading": "測運氣中⋯",
-        "result": "你的運氣分數是： {score}\n",
-        "very_good": "今天你的運氣非常好 :D",
-        "good": "今天運氣還不錯 :)",
-        "average": "今天運氣普通 :/",
-        "bad": "今天運氣不太好，請小心 :("
-    },
-    "ja": {
-        "loading": "運勢を測定中⋯",
-        "result": "あなたの運勢スコアは： {score}\n",
-        "very_good": "今日はとても運がいいです :D",
-        "good": "今日は運がいいです :)",
-        "average": "今日は普通の運です :/",
-        "bad": "今日は運が良くないので気を付けてください :("
-    },
-    "en": {
-        "loading": "Calculating luck...",
-        "result": "Your luck score is: {score}\n",
-        "very_good": "You are very lucky today :D",
-        "good": "You are quite lucky today :)",
-        "average": "Your luck is average today :/",
-        "bad": "Your luck isn't great today, be careful :("
-    }
-}
-
 @bot.command()
 @commands.cooldown(1, 3, commands.BucketType.user)
 async def luck(ctx):
@@ -1102,7 +2375,7 @@ async def luck(ctx):
         else:
             language = "en"
 
-        luck_text = LUCK_TEXTS.get(language, LUCK_TEXTS["en"])
+        luck_text = catalog.section(language, "luck")
 
         loading_embed = discord.Embed(
             description=luck_text["loading"],
@@ -1136,7 +2409,8 @@ async def luck_error(ctx, error):
 @commands.cooldown(1, 3, commands.BucketType.user)
 async def ping(ctx):
     try:
-        await ctx.send('Pong!')
+        language = get_language(ctx.guild.id) if ctx.guild else "en"
+        await ctx.send(**response_templates.get("ping", language, lambda language: {"content": "Pong!"}))
         await handle_exception(ctx, "ping", "Success")
     except Exception as e:
         await handle_exception(ctx, "ping", "Failure", error=e)
@@ -1149,7 +2423,8 @@ async def ping_error(ctx, error):
 @commands.cooldown(1, 3, commands.BucketType.user)
 async def hello(ctx):
     try:
-        await ctx.send('Hello!')
+        language = get_language(ctx.guild.id) if ctx.guild else "en"
+        await ctx.send(**response_templates.get("hello", language, lambda language: {"content": "Hello!"}))
         await handle_exception(ctx, "hello", "Success")
     except Exception as e:
         await handle_exception(ctx, "hello", "Failure", error=e)
@@ -1158,51 +2433,6 @@ async def hello_error(ctx, error):
     await handle_cooldown_error(ctx, error)
     
 # timezone
-TIMEZONE_TEXTS = {
-    "zh": {
-        "title": "各國當前時間",
-        "countries": {
-            "台灣": "Asia/Taipei",
-            "日本": "Asia/Tokyo",
-            "美國": "America/New_York",
-            "英國": "Europe/London",
-            "德國": "Europe/Berlin",
-            "澳洲": "Australia/Sydney",
-            "印度": "Asia/Kolkata",
-            "巴西": "America/Sao_Paulo",
-            "南非": "Africa/Johannesburg"
-        }
-    },
-    "ja": {
-        "title": "各国の現在時刻",
-        "countries": {
-            "台湾": "Asia/Taipei",
-            "日本": "Asia/Tokyo",
-            "アメリカ": "America/New_York",
-            "イギリス": "Europe/London",
-            "ドイツ": "Europe/Berlin",
-            "オーストラリア": "Australia/Sydney",
-            "インド": "Asia/Kolkata",
-            "ブラジル": "America/Sao_Paulo",
-            "南アフリカ": "Africa/Johannesburg"
-        }
-    },
-    "en": {
-        "title": "Current Time in Various Countries",
-        "countries": {
-            "Taiwan": "Asia/Taipei",
-            "Japan": "Asia/Tokyo",
-            "United States": "America/New_York",
-            "United Kingdom": "Europe/London",
-            "Germany": "Europe/Berlin",
-            "Australia": "Australia/Sydney",
-            "India": "Asia/Kolkata",
-            "Brazil": "America/Sao_Paulo",
-            "South Africa": "Africa/Johannesburg"
-        }
-    }
-}
-
 @bot.command()
 @commands.cooldown(1, 3, commands.BucketType.user)
 async def timezone(ctx):
@@ -1213,7 +2443,7 @@ async def timezone(ctx):
         else:
             language = "en"
 
-        timezone_text = TIMEZONE_TEXTS.get(language, TIMEZONE_TEXTS["en"])
+        timezone_text = catalog.section(language, "timezone")
 
         embed = discord.Embed(title=timezone_text["title"], color=0x0080FF)
 
@@ -1250,6 +2480,7 @@ async def typhoonday(ctx):
         
         if response.status_code == 200:
             response.encoding = 'utf-8'
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             status_data = defaultdict(list)
 
@@ -1308,237 +2539,6 @@ async def typhoonday_error(ctx, error):
     await handle_cooldown_error(ctx, error)
         
 # advice
-ADVICE_TEXTS = {
-    "zh": [
-    "相信自己的直覺。", "多考慮所有選擇。", "現在行動是最好的決定。", "再等一下，時機還沒成熟。",
-    "詢問你信任的朋友意見。", "休息一下，重新思考你的問題。", "也許現在不是最好的時間。",
-    "追隨你的心，勇敢行動。", "不妨試試看，結果可能出乎意料。", "注意周圍的訊號，它們會指引你。",
-    "保持冷靜，事情會變得明朗。", "計劃未來，但不要過於擔心。", "放下過去的包袱，輕鬆前行。",
-    "不要忽視身邊的小細節。", "學習如何說“不”。", "這是自我成長的機會。", "勇敢表達你的真實感受。",
-    "事情往往比你想的要簡單。", "嘗試從另一個角度看問題。", "簡單一點，享受當下。",
-    "別害怕失敗，這是學習的過程。", "找到內心的平靜，然後再出發。", "嘗試新事物，也許你會喜歡上它。",
-    "保持耐心，事情需要時間。", "專注於可以改變的事情。", "保持好奇，世界充滿驚喜。",
-    "試著聽從自己的內心聲音。", "凡事量力而為。", "這是一個重新開始的好機會。",
-    "信任你的直覺，尤其在艱難時。", "記得休息，保持充沛的精力。", "人生沒有捷徑，享受旅程吧。",
-    "別害怕改變，它是成長的一部分。", "你的潛力比你想的更大。", "放慢腳步，細細體會生活。",
-    "尋找生活中的小確幸。", "每一天都是新的開始。", "試著接受你無法改變的事情。",
-    "信任你所愛的人，他們在支持你。", "學會原諒，不僅是對別人，也是對自己。", "對未來充滿希望。",
-    "每個困難都是成長的契機。", "別讓過去影響你的未來。", "生活中有許多值得感恩的事物。",
-    "記得你的夢想，不要輕易放棄。", "給自己一個微笑，鼓勵自己。", "不要總是和自己比較。",
-    "生活不必完美，真實就好。", "別忘了追求快樂。", "找到生活中的平衡。", "做個堅強的人。",
-    "相信你可以創造奇蹟。", "每個人都有自己的步調，保持自信。", "別讓壓力佔據你的生活。",
-    "生活中總有美好的事物在等待你。", "向前走，別回頭。", "給自己設定新的目標。",
-    "用心對待每一件小事。", "試著換個環境，找找靈感。", "每個錯誤都是一個學習機會。",
-    "尋找自己的熱情所在。", "找到生活中的意義。", "勇敢面對自己的缺點。", "享受每一刻，因為它不會重來。",
-    "別讓他人的評價影響你。", "學會欣賞自己。", "保持正向的態度。", "用心感受生活。",
-    "隨時為自己加油打氣。", "給自己一個安靜的時刻。", "專注於當下，別過於擔心未來。",
-    "每一件小事都值得重視。", "別讓恐懼限制你的生活。", "信任自己的能力。",
-    "嘗試新鮮的體驗。", "對人保持善意。", "找到屬於自己的節奏。", "培養自信心。",
-    "學會珍惜擁有的事物。", "生活是一場冒險，享受它。", "勇敢追求你的目標。",
-    "別忘了初心。", "保持耐心，成功需要時間。", "在困難中尋找希望。",
-    "每一天都可以是新的開始。", "記住快樂是內心的選擇。", "尋找人生的意義。",
-    "找到你的夢想，然後追求它。", "不要害怕獨處。", "感恩生活中的小確幸。",
-    "保持開放的心態。", "接受挑戰，它會讓你更強大。", "做自己，別為他人而改變。",
-    "不要害怕改變。", "跟隨自己的內心。", "找到你的熱情所在。",
-    "每一個困難都是機會。", "學會管理你的情緒。", "培養正向思維。",
-    "做一個溫暖的人。", "保持謙虛。", "找到自己的價值。",
-    "培養你的才能。", "關心你的健康。", "生活中充滿美好。",
-    "別害怕挑戰。", "保持樂觀。", "享受你的生活。",
-    "放鬆心情。", "對未來保持希望。", "成為更好的自己。",
-    "信任你的朋友。", "不要過度擔心。", "勇敢嘗試。",
-    "找到你的目標。", "感受當下。", "活在當下。",
-    "別忘了微笑。", "每一天都是禮物。", "重視你擁有的一切。",
-    "尋找快樂。", "放下過去。", "活出自我。",
-    "追求你的夢想。", "做你自己。", "對生活充滿熱情。",
-    "每一天都很重要。", "找到你的熱愛。", "追隨你的心。",
-    "放鬆自己。", "每一天都是機會。", "感謝每一刻。",
-    "保持自信。", "每一個選擇都很重要。", "每一天都有意義。",
-    "信任你的直覺。", "找到你的熱情。", "保持冷靜。",
-    "追求你的夢想。", "接受挑戰。", "勇敢追夢。",
-    "每一天都是新的。", "找到你的方向。", "信任自己。",
-    "追隨你的熱情。", "珍惜當下。", "保持開放。",
-    "每一刻都值得。", "放下過去。", "每一件小事都有意義。",
-    "找到你的價值。", "信任你的直覺。", "做一個好人。",
-    "保持耐心。", "放鬆心情。", "每一天都是新開始。",
-    "相信未來。", "找到你的目標。", "別害怕改變。",
-    "感受當下。", "勇敢行動。", "保持冷靜。",
-    "每一天都有新機會。", "不要害怕挑戰。", "每一刻都是禮物。",
-    "追隨你的心。", "活在當下。", "每一天都有新可能。",
-    "保持希望。", "每一天都是新的一天。", "珍惜每一刻。",
-    "放下過去。", "對未來充滿信心。", "勇敢面對。",
-    "不要輕易放棄。", "生活充滿可能。", "學會感恩。",
-    "每一刻都是禮物。", "放慢腳步。", "找到你的熱情。",
-    "對未來保持期待。", "別害怕嘗試。", "找到生活的美好。",
-    "保持冷靜。", "每一天都是新的可能。", "保持希望。",
-    "信任自己的決定。", "每一刻都有價值。", "放下過去。",
-    "每一天都是新機會。", "保持正向心態。", "對未來充滿期待。",
-    "信任你的直覺。", "每一天都是禮物。", "找到內心的平靜。",
-    "對生活充滿熱情。", "每一天都有意義。", "保持冷靜。",
-    "每一刻都是新開始。", "每一天都是機會。", "放下過去。",
-    "找到生活的美好。", "每一刻都是禮物。", "保持樂觀。",
-    "珍惜你所擁有的。", "每一天都是機會。", "信任自己的能力。",
-    "放下過去。", "對未來充滿希望。", "每一刻都是禮物。",
-    "信任你的直覺。", "找到生活的美好。", "保持冷靜。",
-    "對未來充滿期待。", "每一天都是新開始。", "每一刻都是新機會。",
-    "保持正面思維。", "信任你的心。", "每一刻都是機會。",
-    "對未來充滿希望。", "每一刻都是禮物。", "放下過去。",
-    "對未來充滿信心。", "保持正向心態。", "每一刻都是機會。",
-    "每一天都是新可能。", "信任自己的能力。", "放下過去。", "信任你的心。"
-],
-    "ja": [
-    "自分の直感を信じてください。", "すべての選択肢を考慮してください。", "今行動することが最善の決断です。", "少し待ってください、タイミングがまだ整っていません。",
-    "信頼できる友人に意見を求めてください。", "休憩して、問題を再考してください。", "今は最適な時期ではないかもしれません。",
-    "心に従い、勇気を持って行動してください。", "試してみてください、結果は予想外かもしれません。", "周囲のサインに注意を払ってください。それらが道を示してくれるでしょう。",
-    "冷静に保ちましょう。物事は明確になります。", "未来を計画してください、ただし心配しすぎないでください。", "過去の重荷を手放し、軽やかに進んでください。",
-    "身近な小さなことを見逃さないでください。", "「ノー」と言う方法を学びましょう。", "これは自己成長の機会です。", "自分の本当の気持ちを勇敢に表現してください。",
-    "物事はあなたが思っているよりも簡単です。", "別の視点から問題を見てみてください。", "シンプルにして、今を楽しんでください。",
-    "失敗を恐れないでください。それは学びのプロセスです。", "心の平和を見つけてから再出発してください。", "新しいことに挑戦してみてください。気に入るかもしれません。",
-    "忍耐強くいましょう。物事には時間がかかります。", "変えられることに集中してください。", "好奇心を持ち続けてください。世界は驚きで満ちています。",
-    "自分の内なる声に耳を傾けてください。", "無理をしないでください。", "これは新たなスタートの良い機会です。",
-    "困難な時には特に、あなたの直感を信じてください。", "休息を忘れずに、エネルギーを保ちましょう。", "人生には近道がありません。旅を楽しんでください。",
-    "変化を恐れないでください。それは成長の一部です。", "あなたの可能性は思っている以上に大きいです。", "ペースを落として、人生をじっくり味わってください。",
-    "生活の中の小さな幸せを見つけてください。", "毎日は新しい始まりです。", "変えられないことを受け入れてみましょう。",
-    "愛する人を信頼してください。彼らはあなたを支えています。", "許すことを学んでください。それは他人だけでなく自分にも必要です。", "未来に希望を持ちましょう。",
-    "すべての困難は成長の機会です。", "過去があなたの未来に影響を与えないようにしましょう。", "人生には感謝すべきことがたくさんあります。",
-    "あなたの夢を忘れないでください。簡単にはあきらめないでください。", "自分に微笑みを送り、励ましてください。", "自分と他人を常に比較しないでください。",
-    "完璧を求めず、真実であることが大切です。", "幸せを追求することを忘れないでください。", "生活のバランスを見つけましょう。", "強い人になりましょう。",
-    "あなたは奇跡を起こすことができると信じてください。", "皆それぞれのペースがあります。自信を持ちましょう。", "ストレスに支配されないようにしましょう。",
-    "人生には常に美しいものが待っています。", "前を向いて進みましょう。振り返らないでください。", "自分に新しい目標を設定してください。",
-    "小さなことにも心を込めて取り組んでください。", "環境を変えてみて、インスピレーションを得ましょう。", "すべてのミスは学びの機会です。",
-    "自分の情熱を見つけてください。", "人生の意味を見つけましょう。", "自分の欠点に勇敢に向き合いましょう。", "すべての瞬間を楽しんでください。それは二度と訪れません。",
-    "他人の評価に影響されないでください。", "自分を大切にすることを学んでください。", "前向きな態度を保ちましょう。", "心から生活を感じてください。",
-    "いつでも自分を応援しましょう。", "静かな時間を自分に与えましょう。", "今に集中して、将来の心配をしすぎないでください。",
-    "小さなことでも価値があるものとして見ましょう。", "恐怖があなたの生活を制限しないようにしましょう。", "自分の能力を信じてください。",
-    "新鮮な体験を試してみてください。", "他人に対して親切に接しましょう。", "自分のリズムを見つけてください。", "自信を持ちましょう。",
-    "自分が持っているものを大切にしてください。", "人生は冒険です。それを楽しみましょう。", "目標を勇敢に追い求めましょう。",
-    "初心を忘れないでください。", "忍耐強くいましょう。成功には時間がかかります。", "困難の中に希望を見つけましょう。",
-    "毎日は新たな始まりです。", "幸せは心の選択です。", "人生の意味を探してみましょう。",
-    "あなたの夢を見つけ、それを追い求めましょう。", "孤独を恐れないでください。", "生活の中の小さな幸せに感謝してください。",
-    "オープンな心を持ち続けましょう。", "挑戦を受け入れてください。それはあなたを強くします。", "自分らしくいましょう。他人のために変わらないでください。",
-    "変化を恐れないでください。", "自分の心に従ってください。", "情熱を見つけてください。",
-    "すべての困難はチャンスです。", "感情を管理する方法を学びましょう。", "ポジティブな思考を養いましょう。",
-    "温かい人になりましょう。", "謙虚さを保ちましょう。", "自分の価値を見つけてください。",
-    "才能を育ててください。", "健康に気を配りましょう。", "人生は美しいもので満ちています。",
-    "挑戦を恐れないでください。", "楽観的でいましょう。", "人生を楽しんでください。",
-    "気持ちをリラックスさせましょう。", "未来に希望を持ち続けましょう。", "より良い自分を目指しましょう。",
-    "友人を信頼してください。", "心配しすぎないでください。", "勇敢に挑戦しましょう。",
-    "目標を見つけてください。", "今を感じてください。", "今この瞬間を生きましょう。",
-    "笑顔を忘れないでください。", "毎日は贈り物です。", "持っているすべてのものを大切にしてください。",
-    "幸せを探してください。", "過去を手放しましょう。", "自分らしく生きましょう。",
-    "夢を追い求めてください。", "自分自身でいてください。", "生活に情熱を持ってください。",
-    "毎日が大切です。", "好きなものを見つけてください。", "自分の心に従ってください。",
-    "リラックスしてください。", "毎日はチャンスです。", "すべての瞬間に感謝しましょう。",
-    "自信を持ってください。", "すべての選択が重要です。", "毎日には意味があります。",
-    "直感を信じてください。", "情熱を見つけてください。", "冷静でいてください。",
-    "夢を追い求めてください。", "挑戦を受け入れてください。", "勇敢に夢を追いかけてください。",
-    "毎日は新しいです。", "自分の方向性を見つけてください。", "自分を信じてください。",
-    "情熱に従ってください。", "今を大切にしてください。", "オープンな姿勢を保ってください。",
-    "すべての瞬間が価値があります。", "過去を手放してください。", "小さなことも意味があります。",
-    "あなたの価値を見つけてください。", "直感を信じてください。", "良い人でいましょう。",
-    "忍耐強くいましょう。", "気持ちをリラックスさせましょう。", "毎日が新しい始まりです。",
-    "未来を信じましょう。", "目標を見つけてください。", "変化を恐れないでください。",
-    "今を感じてください。", "勇敢に行動しましょう。", "冷静でいてください。",
-    "毎日は新しい機会をもたらします。", "挑戦を恐れないでください。", "すべての瞬間が贈り物です。",
-    "心に従ってください。", "今この瞬間を生きましょう。", "毎日が新しい可能性を秘めています。",
-    "希望を持ち続けましょう。", "毎日は新しい日です。", "すべての瞬間を大切にしてください。",
-    "過去を手放してください。", "未来に自信を持ちましょう。", "困難に勇敢に立ち向かいましょう。",
-    "簡単にはあきらめないでください。", "人生には無限の可能性があります。", "感謝の気持ちを学びましょう。",
-    "すべての瞬間が贈り物です。", "ペースを落としてください。", "情熱を見つけてください。",
-    "未来に期待を持ちましょう。", "新しいことに挑戦することを恐れないでください。", "人生の美しさを見つけてください。",
-    "冷静でいてください。", "毎日は新しい可能性をもたらします。", "希望を持ち続けましょう。",
-    "自分の決断を信じてください。", "すべての瞬間には価値があります。", "過去を手放してください。",
-    "毎日は新しいチャンスです。", "前向きな姿勢を維持しましょう。", "未来に期待を持ちましょう。",
-    "直感を信じてください。", "毎日は贈り物です。", "内なる平和を見つけてください。",
-    "情熱をもって生活を楽しんでください。", "毎日には意味があります。", "冷静でいてください。",
-    "すべての瞬間が新しい始まりです。", "毎日はチャンスです。", "過去を手放してください。",
-    "人生の美しさを見つけてください。", "すべての瞬間が贈り物です。", "楽観的でいましょう。",
-    "持っているものを大切にしてください。", "毎日はチャンスです。", "自分の能力を信じてください。",
-    "過去を手放してください。", "未来に希望を持ちましょう。", "すべての瞬間が贈り物です。",
-    "直感を信じてください。", "人生の美しさを見つけてください。", "冷静でいてください。",
-    "未来に期待を持ちましょう。", "毎日は新しい始まりです。", "すべての瞬間が新しい機会です。",
-    "前向きな姿勢を保ちましょう。", "自分の心を信じてください。", "すべての瞬間がチャンスです。",
-    "未来に希望を持ち続けましょう。", "すべての瞬間が贈り物です。", "過去を手放してください。",
-    "未来に自信を持ちましょう。", "前向きな考え方を維持しましょう。", "すべての瞬間がチャンスです。",
-    "毎日は新しい可能性を秘めています。", "自分の能力を信じてください。", "過去を手放してください。", "自分の心を信じてください。"
-],
-    "en": [
-    "Trust your intuition.", "Consider all options.", "Act now; it's the best decision.", "Wait a bit; the timing isn't right yet.",
-    "Seek advice from friends you trust.", "Take a break and rethink your question.", "Maybe now is not the best time.",
-    "Follow your heart and act bravely.", "Give it a try; the outcome might surprise you.", "Pay attention to signs around you; they'll guide you.",
-    "Stay calm; things will become clearer.", "Plan for the future, but don't worry too much.", "Let go of past burdens and move forward with ease.",
-    "Don't ignore the small details around you.", "Learn how to say 'No'.", "This is a chance for self-growth.", "Express your true feelings bravely.",
-    "Things are often simpler than you think.", "Try looking at the problem from another perspective.", "Simplify and enjoy the moment.",
-    "Don't fear failure; it's part of learning.", "Find inner peace, then proceed.", "Try something new; you might end up liking it.",
-    "Be patient; things take time.", "Focus on what you can change.", "Stay curious; the world is full of surprises.",
-    "Listen to your inner voice.", "Know your limits in everything.", "This is a great chance for a fresh start.",
-    "Trust your intuition, especially in tough times.", "Remember to rest and stay energized.", "There are no shortcuts in life; enjoy the journey.",
-    "Don't fear change; it's part of growth.", "Your potential is greater than you think.", "Slow down and savor life.",
-    "Look for little moments of happiness in life.", "Each day is a new beginning.", "Try to accept what you cannot change.",
-    "Trust those you love; they support you.", "Learn to forgive, both others and yourself.", "Have hope for the future.",
-    "Every challenge is an opportunity to grow.", "Don't let the past affect your future.", "There are many things to be grateful for in life.",
-    "Remember your dreams; don't give up easily.", "Give yourself a smile for encouragement.", "Stop comparing yourself to others.",
-    "Life doesn't need to be perfect; being real is enough.", "Don't forget to pursue happiness.", "Find balance in life.", "Be a strong person.",
-    "Believe you can create miracles.", "Everyone has their own pace; stay confident.", "Don't let stress dominate your life.",
-    "There are always beautiful things waiting for you in life.", "Move forward without looking back.", "Set new goals for yourself.",
-    "Handle each small thing with care.", "Try changing your environment for inspiration.", "Every mistake is a learning opportunity.",
-    "Find your passion in life.", "Discover the meaning of life.", "Face your flaws courageously.", "Enjoy each moment because it won't come again.",
-    "Don't let others' opinions affect you.", "Learn to appreciate yourself.", "Maintain a positive attitude.", "Feel life with all your heart.",
-    "Always cheer yourself up.", "Give yourself a quiet moment.", "Focus on the present, don't worry too much about the future.",
-    "Every little thing is worth valuing.", "Don't let fear limit your life.", "Trust in your abilities.",
-    "Try fresh experiences.", "Be kind to others.", "Find your own rhythm.", "Build self-confidence.",
-    "Learn to cherish what you have.", "Life is an adventure; enjoy it.", "Pursue your goals bravely.",
-    "Never forget your original intentions.", "Be patient; success takes time.", "Find hope amidst challenges.",
-    "Every day can be a new beginning.", "Remember, happiness is a choice from within.", "Search for the meaning of life.",
-    "Find your dreams and pursue them.", "Don't be afraid of solitude.", "Appreciate the small happiness in life.",
-    "Keep an open mind.", "Accept challenges; they make you stronger.", "Be yourself; don't change for others.",
-    "Don't be afraid of change.", "Follow your heart.", "Find your passion.",
-    "Every hardship is an opportunity.", "Learn to manage your emotions.", "Cultivate positive thinking.",
-    "Be a warm-hearted person.", "Stay humble.", "Find your worth.",
-    "Develop your talents.", "Take care of your health.", "Life is full of beauty.",
-    "Don't be afraid of challenges.", "Stay optimistic.", "Enjoy your life.",
-    "Relax your mind.", "Keep hope for the future.", "Become a better version of yourself.",
-    "Trust your friends.", "Don't worry too much.", "Take bold steps.",
-    "Find your goals.", "Feel the present.", "Live in the moment.",
-    "Don't forget to smile.", "Every day is a gift.", "Value everything you have.",
-    "Seek happiness.", "Let go of the past.", "Live your true self.",
-    "Pursue your dreams.", "Be yourself.", "Fill life with enthusiasm.",
-    "Every day is important.", "Find what you love.", "Follow your heart.",
-    "Relax yourself.", "Every day is an opportunity.", "Appreciate each moment.",
-    "Stay confident.", "Every choice is important.", "Each day has meaning.",
-    "Trust your intuition.", "Find your passion.", "Stay calm.",
-    "Pursue your dreams.", "Accept challenges.", "Chase your dreams bravely.",
-    "Each day is new.", "Find your direction.", "Trust yourself.",
-    "Follow your passion.", "Cherish the present.", "Stay open.",
-    "Every moment is worthwhile.", "Let go of the past.", "Every small thing has meaning.",
-    "Find your value.", "Trust your intuition.", "Be a good person.",
-    "Be patient.", "Calm your mind.", "Each day is a fresh start.",
-    "Believe in the future.", "Find your goals.", "Don't be afraid of change.",
-    "Feel the present.", "Act courageously.", "Stay calm.",
-    "Every day brings new opportunities.", "Don't fear challenges.", "Each moment is a gift.",
-    "Follow your heart.", "Live in the moment.", "Each day holds new possibilities.",
-    "Keep hope alive.", "Every day is a new day.", "Cherish every moment.",
-    "Let go of the past.", "Be confident about the future.", "Face challenges courageously.",
-    "Don't give up easily.", "Life is full of possibilities.", "Learn to be grateful.",
-    "Every moment is a gift.", "Slow down.", "Find your passion.",
-    "Look forward to the future.", "Don't fear trying new things.", "Find the beauty in life.",
-    "Stay calm.", "Each day brings new possibilities.", "Keep hope alive.",
-    "Trust your decisions.", "Every moment has value.", "Let go of the past.",
-    "Each day is a new opportunity.", "Maintain a positive mindset.", "Look forward to the future.",
-    "Trust your intuition.", "Each day is a gift.", "Find inner peace.",
-    "Fill your life with passion.", "Each day has meaning.", "Stay calm.",
-    "Each moment is a fresh start.", "Every day is a chance.", "Let go of the past.",
-    "Find the beauty in life.", "Each moment is a gift.", "Stay optimistic.",
-    "Cherish what you have.", "Every day is a chance.", "Trust your abilities.",
-    "Let go of the past.", "Stay hopeful for the future.", "Each moment is a gift.",
-    "Trust your intuition.", "Discover the beauty in life.", "Stay calm.",
-    "Look forward to the future.", "Each day is a new beginning.", "Each moment brings new opportunities.",
-    "Keep a positive mindset.", "Trust your heart.", "Each moment is a chance.",
-    "Stay hopeful for the future.", "Each moment is a gift.", "Let go of the past.",
-    "Stay confident about the future.", "Maintain a positive outlook.", "Each moment is a chance.",
-    "Every day holds new possibilities.", "Trust your abilities.", "Let go of the past.", "Trust your heart."
-]
-}
-
 @bot.command()
 @commands.cooldown(1, 1.5, commands.BucketType.user)
 async def advice(ctx):
@@ -1549,7 +2549,7 @@ async def advice(ctx):
         else:
             language = "en"
 
-        advice_list = ADVICE_TEXTS.get(language, ADVICE_TEXTS["en"])
+        advice_list = catalog.get(language, "advice")
 
         response = random.choice(advice_list)
 
@@ -1578,7 +2578,7 @@ async def gemini(ctx, *, prompt: str = None):
 
     try:
         # Generate a response using the model
-        response = model.generate_content(prompt)
+        response = gemini_model().generate_content(prompt)
 
         # Check if the response exceeds Discord's character limit
         if len(response.text) > 2000:
@@ -1604,86 +2604,55 @@ async def gemini(ctx, *, prompt: str = None):
 #
 ''' ----- Ticket System ----- '''
 
-ticket_embeds = load_ticket_embeds()
+with startup_report.phase("ticket_embeds"):
+    ticket_embeds = load_ticket_embeds()
 temp_roles = {}
 
-LANGUAGE_SETTINGS = {
-    "zh": {
-        "setup_button_label": "點擊設定",
-        "setup_title": "支援票設定",
-        "setup_description": "點擊下方按鈕設定支援票",
-        "modal_title": "Support Ticket 設定",
-        "title_label": "標題",
-        "title_placeholder": "請輸入標題",
-        "desc_label": "內容",
-        "desc_placeholder": "請輸入內容",
-        "button_label": "按鈕標籤",
-        "button_placeholder": "請輸入按鈕標籤",
-        "color_label": "顏色",
-        "color_placeholder": "請輸入顏色 (例如 '#000000' 或 'blue')",
-        "close_ticket": "支援票已關閉，訊息記錄已保存為HTML檔案。",
-        "end_ticket": "此支援票頻道即將被刪除。",
-        "no_permission": "抱歉，您沒有管理員權限來使用此命令。",
-    },
-    "ja": {
-        "setup_button_label": "セットアップ",
-        "setup_title": "サポートチケット設定",
-        "setup_description": "下のボタンをクリックしてサポートチケットを設定してください。",
-        "modal_title": "サポートチケットをセットアップ",
-        "title_label": "タイトル",
-        "title_placeholder": "タイトルを入力してください",
-        "desc_label": "内容",
-        "desc_placeholder": "内容を入力してください",
-        "button_label": "ボタンラベル",
-        "button_placeholder": "ボタンラベルを入力してください",
-        "color_label": "色",
-        "color_placeholder": "色を入力してください（例：'#000000'または'blue'）",
-        "close_ticket": "サポートチケットは閉じられ、メッセージの記録が保存されました。",
-        "end_ticket": "このチャンネルは削除されます。",
-        "no_permission": "申し訳ありませんが、このコマンドを使用する権限がありません。",
-    },
-    "en": {
-        "setup_button_label": "Click to Setup",
-        "setup_title": "Support Ticket Setup",
-        "setup_description": "Click the button below to setup Support Ticket",
-        "modal_title": "Support Ticket Setup",
-        "title_label": "Title",
-        "title_placeholder": "Enter title",
-        "desc_label": "Description",
-        "desc_placeholder": "Enter description",
-        "button_label": "Button Label",
-        "button_placeholder": "Enter button label",
-        "color_label": "Color",
-        "color_placeholder": "Enter color (e.g., '#000000' or 'blue')",
-        "close_ticket": "Ticket has been closed and transcript saved.",
-        "end_ticket": "This channel will now be deleted.",
-        "no_permission": "Sorry, you do not have administrator permissions to use this command.",
-    }
-}
+class PanelButton(discord.ui.DynamicItem[discord.ui.Button], template=r"(?P<kind>support_ticket|ticket_modal|open_form)_(?P<key>[0-9A-Za-z-]+)"):
+    # One persistent router for every panel button: clicks are resolved from the custom_id,
+    # so panels need no View per message and keep working after a restart without being edited
+    def __init__(self, kind, key, label=None, style=discord.ButtonStyle.secondary):
+        super().__init__(discord.ui.Button(label=label, style=style, custom_id=f"{kind}_{key}"))
+        self.kind = kind
+        self.key = key
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["kind"], match["key"], item.label, item.style)
+
+    async def callback(self, interaction: discord.Interaction):
+        await PANEL_BUTTON_HANDLERS[self.kind](interaction, self.key)
+
+# kind -> async handler(interaction, key); the welcome section registers open_form
+PANEL_BUTTON_HANDLERS = {}
+bot.add_dynamic_items(PanelButton)
+
+# Older setup panels were posted with ticket_modal_jp
+PANEL_LANGUAGE_KEYS = {"jp": "ja"}
 
 class TicketView(View):
     def __init__(self, language="en"):
         super().__init__(timeout=None)
-        settings = LANGUAGE_SETTINGS.get(language, LANGUAGE_SETTINGS["en"])
         self.language = language
         
         if language == "zh":
-            button = Button(label="點擊設定", style=discord.ButtonStyle.primary, custom_id="ticket_modal_zh")
+            button = PanelButton("ticket_modal", "zh", "點擊設定", discord.ButtonStyle.primary)
         elif language == "ja":
-            button = Button(label="セットアップ", style=discord.ButtonStyle.secondary, custom_id="ticket_modal_jp")
+            button = PanelButton("ticket_modal", "ja", "セットアップ")
         else:
-            button = Button(label="Click to Setup", style=discord.ButtonStyle.secondary, custom_id="ticket_modal_en")
-        
-        button.callback = self.open_modal
+            button = PanelButton("ticket_modal", "en", "Click to Setup")
         self.add_item(button)
 
-    async def open_modal(self, interaction: discord.Interaction):
-        modal = TicketModal(language=self.language)
-        await interaction.response.send_modal(modal)
+async def open_ticket_setup_modal(interaction: discord.Interaction, key):
+    # The panel outlives the $ticket call, so the button re-checks the permission $ticket requires
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("You need administrator permissions to set up tickets.", ephemeral=True)
+        return
+    await interaction.response.send_modal(TicketModal(language=PANEL_LANGUAGE_KEYS.get(key, key)))
 
 class TicketModal(Modal):
     def __init__(self, language="en"):
-        settings = LANGUAGE_SETTINGS.get(language, LANGUAGE_SETTINGS["en"])
+        settings = catalog.section(language, "ticket")
         super().__init__(title=settings["modal_title"])
 
         self.language = language
@@ -1759,64 +2728,83 @@ class TicketModal(Modal):
         await interaction.response.send_message(embed=embed, view=final_view)
         ticket_message = await interaction.original_response()
 
-        ticket_embeds[ticket_embed_id] = {
-            "user_id":      interaction.user.id,
-            "guild_id":     guild.id,
-            "channel_id":   interaction.channel.id,
-            "message_id":   ticket_message.id,
-            "created_at":   creation_time,
-            "title":        title,
-            "description":  description,
-            "button_label": button_label,
-            "category_id":  ticket_category_id
-        }
-        save_ticket_embeds()
+        ticket_embeds[ticket_embed_id] = TicketPanel(
+            user_id=interaction.user.id,
+            guild_id=guild.id,
+            channel_id=interaction.channel.id,
+            message_id=ticket_message.id,
+            created_at=creation_time,
+            title=title,
+            description=description,
+            button_label=button_label,
+            category_id=ticket_category_id
+        )
+        save_ticket_embed(ticket_embed_id)
+
+@bot.listen("on_raw_message_delete")
+async def prune_deleted_ticket_panel(payload):
+    ticket_embed_id = ticket_panel_messages.get(payload.message_id)
+    if ticket_embed_id is not None and remove_ticket_embed(ticket_embed_id):
+        logging.info(f"Removed ticket panel {ticket_embed_id} after its message was deleted.")
+
+@bot.listen("on_raw_bulk_message_delete")
+async def prune_bulk_deleted_ticket_panels(payload):
+    for message_id in payload.message_ids:
+        ticket_embed_id = ticket_panel_messages.get(message_id)
+        if ticket_embed_id is not None and remove_ticket_embed(ticket_embed_id):
+            logging.info(f"Removed ticket panel {ticket_embed_id} after its message was bulk deleted.")
+
+@bot.listen("on_guild_channel_delete")
+async def prune_channel_ticket_panels(channel):
+    stale = [ticket_embed_id for ticket_embed_id, panel in ticket_embeds.items() if panel.channel_id == channel.id]
+    for ticket_embed_id in stale:
+        remove_ticket_embed(ticket_embed_id)
+    if stale:
+        logging.info(f"Removed {len(stale)} ticket panels from deleted channel {channel.id}.")
 
 class SupportTicketView(discord.ui.View):
     def __init__(self, ticket_embed_id, button_label):
         super().__init__(timeout=None)
         self.ticket_embed_id = ticket_embed_id
+        self.add_item(PanelButton("support_ticket", ticket_embed_id, button_label, discord.ButtonStyle.primary))
 
-        button = discord.ui.Button(
-            label=button_label,
-            style=discord.ButtonStyle.primary,
-            custom_id=f"support_ticket_{ticket_embed_id}",
-        )
-        button.callback = self.open_ticket_callback
-        self.add_item(button)
-
-    async def open_ticket_callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        guild = interaction.guild
-
-        category = discord.utils.get(guild.categories, name="Tickets Channel")
-        if category is None:
-            category = await guild.create_category("Tickets Channel")
-            for role in guild.roles:
-                await category.set_permissions(role, view_channel=False)
-            admin_role = discord.utils.find(lambda r: r.permissions.administrator, guild.roles)
-            if admin_role:
-                await category.set_permission(admin_role, view_channel=True)
-
-        username = interaction.user.name
-        user_id = interaction.user.id
-
-        overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            interaction.user: discord.PermissionOverwrite(view_channel=True),
-            discord.utils.find(lambda r: r.permissions.administrator, guild.roles): discord.PermissionOverwrite(view_channel=True)
-        }
+async def open_support_ticket(interaction: discord.Interaction, ticket_embed_id):
+    if ticket_embed_id not in ticket_embeds:
+        await interaction.response.send_message("This ticket panel is no longer available.", ephemeral=True)
+        return
+    await interaction.response.defer()
+    guild = interaction.guild
+
+    category = discord.utils.get(guild.categories, name="Tickets Channel")
+    if category is None:
+        category = await guild.create_category("Tickets Channel")
+        for role in guild.roles:
+            await category.set_permissions(role, view_channel=False)
+        admin_role = discord.utils.find(lambda r: r.permissions.administrator, guild.roles)
+        if admin_role:
+            await category.set_permission(admin_role, view_channel=True)
+
+    username = interaction.user.name
+    user_id = interaction.user.id
+
+    overwrites = {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False),
+        interaction.user: discord.PermissionOverwrite(view_channel=True),
+        discord.utils.find(lambda r: r.permissions.administrator, guild.roles): discord.PermissionOverwrite(view_channel=True)
+    }
 
-        channel_name = f"ticket-{username}"
-        ticket_channel = discord.utils.get(category.channels, name=channel_name)
+    channel_name = f"ticket-{username}"
+    ticket_channel = discord.utils.get(category.channels, name=channel_name)
 
-        if ticket_channel is None:
-            ticket_channel = await guild.create_text_channel(channel_name, category=category, overwrites=overwrites)
-            await ticket_channel.send(f"{interaction.user.mention} Your ticket has been created.")
-        else:
-           await ticket_channel.set_permissions(interaction.user, view_channel=True)
-           await ticket_channel.send(f"{interaction.user.mention} You already have a ticket.")
+    if ticket_channel is None:
+        ticket_channel = await guild.create_text_channel(channel_name, category=category, overwrites=overwrites)
+        await ticket_channel.send(f"{interaction.user.mention} Your ticket has been created.")
+    else:
+       await ticket_channel.set_permissions(interaction.user, view_channel=True)
+       await ticket_channel.send(f"{interaction.user.mention} You already have a ticket.")
 
+PANEL_BUTTON_HANDLERS["ticket_modal"] = open_ticket_setup_modal
+PANEL_BUTTON_HANDLERS["support_ticket"] = open_support_ticket
 
 @bot.command()
 @commands.has_permissions(administrator=True)
@@ -1829,11 +2817,10 @@ async def ticket(ctx):
         ))
         return
     language = get_language(ctx.guild.id)
-    settings = LANGUAGE_SETTINGS.get(language, LANGUAGE_SETTINGS["en"])
     view = TicketView(language=language)
     embed = discord.Embed(
-        title=settings["setup_title"], 
-        description=settings["setup_description"], 
+        title=catalog.text(language, "ticket.setup_title"), 
+        description=catalog.text(language, "ticket.setup_description"), 
         color=discord.Color.blue()
     )
     await ctx.send(embed=embed, view=view)
@@ -2224,6 +3211,452 @@ async def stopuserlistening(ctx):
     COMMAND_CONTEXTS.clear()
     await ctx.send("🛑 Stopped listening to all specified users.")
 
+@bot.command(aliases=["lcs"])
+@allowed_only()
+async def languagecachestats(ctx):
+    guilds = len(language_settings_cache or {})
+    hits, misses = language_cache_stats["hits"], language_cache_stats["misses"]
+    total = hits + misses
+    await ctx.send(f"`Language cache: {guilds} guilds | hits: {hits} | misses (no setting, fell back to en): {misses} | "
+                   f"hit rate: {hits / total if total else 0.0:.1%}`")
+
+@bot.command(aliases=["locs"])
+@allowed_only()
+async def localestats(ctx):
+    loaded = ", ".join(
+        f"{language} ({len(table)} entries, {catalog.metrics['load_ms'].get(language, 0):.1f} ms)"
+        for language, table in sorted(catalog.tables.items())
+    ) or "none"
+    await ctx.send(
+        f"`Language bundles: available {', '.join(catalog.available_languages())} | loaded: {loaded} | "
+        f"loads: {catalog.metrics['bundle_loads']} | version: {catalog.version}`"
+    )
+
+@bot.command(aliases=["rlocales"])
+@allowed_only()
+async def reloadlocales(ctx):
+    catalog.reload()
+    await ctx.send("`Language bundles will be reloaded from disk on next use.`")
+
+@bot.command(aliases=["rts"])
+@allowed_only()
+async def responsetemplatestats(ctx):
+    stats = response_templates.stats()
+    lines = [
+        f"{command}: {counters['hits']} hits / {counters['builds']} builds ({counters['reuse_rate']:.1%} reused)"
+        for command, counters in sorted(stats.items())
+    ] or ["no cached responses yet"]
+    await ctx.send(
+        f"```Response templates: {len(response_templates.templates)} cached | "
+        f"invalidations: {response_templates.metrics['invalidations']}\n" + "\n".join(lines) + "```"
+    )
+
+@bot.command(aliases=["exs"])
+@allowed_only()
+async def exceptionstats(ctx):
+    successes = exception_report_stats["successes"]
+    failures = exception_report_stats["failures"]
+    await ctx.send(
+        f"`Since last summary: {sum(successes.values())} successes | {sum(failures.values())} failures | "
+        f"suppressed: {exception_report_stats['suppressed_failures']} failure logs, {exception_report_stats['suppressed_notifications']} notifications | "
+        f"success sample rate: {EXCEPTION_SUCCESS_SAMPLE_RATE} | dedupe window: {EXCEPTION_DEDUPE_WINDOW_SECONDS:g}s`"
+    )
+
+@bot.command(name="stats")
+@allowed_only()
+async def stats(ctx, top: int = 15):
+    summary = command_metrics.summary()
+    if not summary:
+        await ctx.send("`No commands recorded yet.`")
+        return
+    rows = sorted(summary.items(), key=lambda item: -item[1]["count"])[:top]
+    lines = [f"{'command':<16}{'count':>7}{'err':>5}{'cd':>5}{'p50':>9}{'p95':>9}{'p99':>9}"]
+    for name, entry in rows:
+        lines.append(
+            f"{name[:15]:<16}{entry['count']:>7}{entry['error']:>5}{entry['cooldown']:>5}"
+            f"{entry['p50'] * 1000:>7.0f}ms{entry['p95'] * 1000:>7.0f}ms{entry['p99'] * 1000:>7.0f}ms"
+        )
+    await ctx.send("```" + "\n".join(lines) + "```")
+
+@bot.command(aliases=["lps"])
+@allowed_only()
+async def loopstats(ctx, top: int = 10):
+    summary = loop_monitor.summary()
+    rows = sorted(summary["handlers"].items(), key=lambda item: -item[1]["total"])[:top]
+    lines = [
+        f"Loop lag p50 {summary['lag_p50'] * 1000:.1f} ms | p99 {summary['lag_p99'] * 1000:.1f} ms | "
+        f"max {summary['lag_max'] * 1000:.1f} ms | blocked {summary['blocked_count']}x (>{loop_monitor.block_threshold * 1000:.0f} ms)",
+        f"{'handler':<28}{'count':>7}{'avg':>9}{'max':>9}",
+    ]
+    for name, entry in rows:
+        lines.append(f"{name[:27]:<28}{entry['count']:>7}{entry['total'] / entry['count'] * 1000:>7.1f}ms{entry['max'] * 1000:>7.0f}ms")
+    if summary["blocked"]:
+        last = summary["blocked"][-1]
+        stack_tail = "".join(last["stack"].splitlines(keepends=True)[-8:])
+        lines.append(f"Last block at {last['at']} ({last['stalled'] * 1000:.0f} ms):\n{stack_tail}")
+    await ctx.send("```" + "\n".join(lines)[:1990] + "```")
+
+@bot.command(aliases=["rst"])
+@allowed_only()
+async def reststats(ctx, kind: str = "features", top: int = 10):
+    if kind not in ("features", "routes"):
+        await ctx.send("`Usage: $reststats [features|routes] [top]`")
+        return
+    snapshot = rest_accounting.snapshot()
+    total = sum(entry["count"] for entry in snapshot["routes"].values())
+    limited = sum(entry["rate_limited"] for entry in snapshot["routes"].values())
+    minutes = max((time.time() - snapshot["since"]) / 60, 1 / 60)
+    lines = [
+        f"{total} REST calls ({total / minutes:.1f}/min) | {limited} rate limited",
+        f"{kind[:-1]:<45}{'count':>6}{'429':>5}{'err':>5}{'avg':>9}",
+        *rest_accounting.format_top(kind, top),
+    ]
+    await ctx.send("```" + "\n".join(lines)[:1990] + "```")
+
+@bot.command(aliases=["gu"])
+@allowed_only()
+async def guildusage(ctx, metric: str = "cpu_ms", top: int = 10):
+    if metric not in GUILD_USAGE_METRICS:
+        await ctx.send(f"`Metric must be one of: {', '.join(GUILD_USAGE_METRICS)}`")
+        return
+    report = await bot.loop.run_in_executor(None, guild_accounting.report, metric, top)
+    lines = [f"{'guild':<26}{'cpu':>9}{'events':>8}{'rest':>7}{'msgs':>6}{'edits':>7}{'disk':>9}"]
+    for entry in report["guilds"]:
+        label = (entry["name"] or str(entry["guild_id"]))[:25]
+        lines.append(
+            f"{label:<26}{entry['cpu_ms']:>7.0f}ms{entry['events']:>8}{entry['rest_calls']:>7}"
+            f"{entry['messages_sent']:>6}{entry['message_edits']:>7}{entry['disk_bytes'] / 1024 / 1024:>7.1f}MB"
+        )
+    await ctx.send(f"```Top {len(report['guilds'])} guilds by {metric}\n" + "\n".join(lines)[:1950] + "```")
+
+# On-demand profiler: nothing is installed until a developer asks for a profile
+PROFILE_MAX_SECONDS = 120
+PROFILE_SAMPLE_INTERVAL = 0.005
+profiler_lock = asyncio.Lock()
+
+def sample_stacks(thread_id, stop_event, interval=PROFILE_SAMPLE_INTERVAL):
+    stacks = defaultdict(int)
+    while not stop_event.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if names:
+            stacks[";".join(reversed(names))] += 1
+    return stacks
+
+def format_sampled_profile(stacks, limit=40):
+    total = sum(stacks.values())
+    self_counts = defaultdict(int)
+    inclusive_counts = defaultdict(int)
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        self_counts[frames[-1]] += count
+        for name in set(frames):
+            inclusive_counts[name] += count
+    lines = [f"{total} samples every {PROFILE_SAMPLE_INTERVAL * 1000:.0f} ms", "", "self%   incl%   function"]
+    for name, count in sorted(self_counts.items(), key=lambda item: -item[1])[:limit]:
+        lines.append(f"{count / total:6.1%}  {inclusive_counts[name] / total:6.1%}  {name}")
+    return "\n".join(lines) + "\n"
+
+@bot.command(name="profile", aliases=["prof"])
+@allowed_only()
+async def profile(ctx, seconds: int = 10, mode: str = "cprofile", collapsed: bool = False):
+    if mode not in ("cprofile", "sample"):
+        await ctx.send("`Usage: $profile [seconds] [cprofile|sample] [collapsed: yes/no]`")
+        return
+    if profiler_lock.locked():
+        await ctx.send("`A profile is already running.`")
+        return
+    seconds = max(1, min(seconds, PROFILE_MAX_SECONDS))
+    async with profiler_lock:
+        await ctx.send(f"`Profiling the event loop for {seconds}s ({mode}{', collapsed stacks' if collapsed else ''})...`")
+        stop_event = threading.Event()
+        sampler = None
+        if mode == "sample" or collapsed:
+            sampler = bot.loop.run_in_executor(None, sample_stacks, threading.get_ident(), stop_event)
+        profiler = None
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            if profiler:
+                profiler.disable()
+            stop_event.set()
+        stacks = await sampler if sampler else {}
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        files = []
+        if profiler:
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(60)
+            files.append(discord.File(io.BytesIO(report.getvalue().encode("utf-8")), filename=f"profile-{timestamp}.txt"))
+        elif stacks:
+            files.append(discord.File(io.BytesIO(format_sampled_profile(stacks).encode("utf-8")), filename=f"profile-{timestamp}.txt"))
+        if collapsed and stacks:
+            folded = "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+            files.append(discord.File(io.BytesIO(folded.encode("utf-8")), filename=f"profile-{timestamp}.folded"))
+        if not files:
+            await ctx.send("`No samples were collected.`")
+            return
+        await ctx.send(f"`Profile finished after {seconds}s.`", files=files)
+
+# Memory diagnostics: sizes of the long-lived module caches plus tracemalloc snapshot diffs
+MEMORY_TRACE_FRAMES = int(os.getenv("MEMORY_TRACE_FRAMES", "1"))
+MEMORY_SIZE_MAX_DEPTH = 6
+# Objects owned by discord.py's own caches are reported under "discord caches", not per structure
+MEMORY_SHARED_TYPES = (
+    discord.Client, discord.state.ConnectionState, discord.http.HTTPClient, discord.Guild, discord.abc.GuildChannel,
+    discord.Thread, discord.Role, discord.Message, discord.abc.User, asyncio.AbstractEventLoop,
+    types.ModuleType, types.FunctionType, types.MethodType, type,
+)
+memory_snapshots = {"baseline": None, "taken_at": None, "started_tracing": False}
+
+def approximate_size(obj, seen=None, depth=0):
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or isinstance(obj, MEMORY_SHARED_TYPES):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj, 0)
+    if depth >= MEMORY_SIZE_MAX_DEPTH or obj is None or isinstance(obj, (str, bytes, int, float)):
+        return size
+    if isinstance(obj, dict):
+        children = [item for pair in list(obj.items()) for item in pair]
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        children = list(obj)
+    else:
+        children = [obj.__dict__] if hasattr(obj, "__dict__") else []
+        for cls in type(obj).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__"):
+                    children.append(getattr(obj, slot, None))
+    return size + sum(approximate_size(child, seen, depth + 1) for child in children)
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def tracked_structures():
+    return {
+        "invite_cache": invite_cache,
+        "COMMAND_CONTEXTS": COMMAND_CONTEXTS,
+        "LISTENING_CHANNELS": LISTENING_CHANNELS,
+        "LISTENING_USERS": LISTENING_USERS,
+        "CREATED_CHANNELS": CREATED_CHANNELS,
+        "music_queue": queue,
+        "ticket_embeds": ticket_embeds,
+    }
+
+def discord_cache_sizes():
+    guilds = list(bot.guilds)
+    return {
+        "guilds": len(guilds),
+        "members": sum(len(guild.members) for guild in guilds),
+        "channels": sum(len(guild.channels) for guild in guilds),
+        "users": len(bot.users),
+        "messages": len(bot.cached_messages),
+        "max_messages": bot._connection.max_messages,
+        "voice_clients": len(bot.voice_clients),
+    }
+
+def memory_report(deep=True):
+    structures = {}
+    for name, value in tracked_structures().items():
+        structures[name] = {"entries": len(value), "bytes": approximate_size(value) if deep else None}
+    structures["invite_cache"]["invites"] = sum(len(invites) for invites in list(invite_cache.values()))
+    return {
+        "rss_bytes": current_rss(),
+        "traced_bytes": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        "structures": structures,
+        "discord": discord_cache_sizes(),
+    }
+
+def render_memory_prometheus():
+    report = memory_report(deep=False)
+    lines = [
+        "# HELP discord_bot_cache_entries Entries held by long-lived bot and discord.py caches.",
+        "# TYPE discord_bot_cache_entries gauge",
+    ]
+    for name, entry in report["structures"].items():
+        lines.append(f'discord_bot_cache_entries{{cache="{name}"}} {entry["entries"]}')
+    for name, count in report["discord"].items():
+        if name != "max_messages":
+            lines.append(f'discord_bot_cache_entries{{cache="discord_{name}"}} {count}')
+    if report["rss_bytes"] is not None:
+        lines.append("# HELP discord_bot_resident_memory_bytes Resident set size of the bot process.")
+        lines.append("# TYPE discord_bot_resident_memory_bytes gauge")
+        lines.append(f"discord_bot_resident_memory_bytes {report['rss_bytes']}")
+    return "\n".join(lines) + "\n"
+
+def take_memory_snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+def allocation_site(traceback_):
+    # Prefer the innermost frame inside the bot so library internals point back at the caller
+    for frame in reversed(traceback_):
+        if frame.filename == __file__:
+            return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+    frame = traceback_[-1]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+def memory_snapshot_stats(mode, top):
+    key = "traceback" if MEMORY_TRACE_FRAMES > 1 else "lineno"
+    snapshot = take_memory_snapshot()
+    if mode == "diff":
+        stats = snapshot.compare_to(memory_snapshots["baseline"], key)
+        stats.sort(key=lambda stat: -stat.size_diff)
+        rows = [(allocation_site(stat.traceback), stat.size_diff, stat.count_diff, stat.size) for stat in stats[:top]]
+    else:
+        stats = snapshot.statistics(key)
+        rows = [(allocation_site(stat.traceback), stat.size, stat.count, stat.size) for stat in stats[:top]]
+    return rows, sum(stat.size for stat in snapshot.statistics("filename"))
+
+@bot.command(aliases=["mem"])
+@allowed_only()
+async def memory(ctx):
+    # The deep size walk visits every object in the module caches, so it runs in a worker thread instead of stalling the gateway
+    report = await asyncio.to_thread(memory_report)
+    mib = lambda value: f"{value / 1024 / 1024:.1f} MiB" if value is not None else "n/a"
+    lines = [f"RSS {mib(report['rss_bytes'])} | traced {mib(report['traced_bytes'])}", f"{'structure':<20}{'entries':>9}{'approx':>12}"]
+    for name, entry in report["structures"].items():
+        lines.append(f"{name:<20}{entry['entries']:>9}{entry['bytes'] / 1024:>9.1f} KiB")
+    lines.append(f"invite_cache holds {report['structures']['invite_cache']['invites']} Invite objects")
+    caches = report["discord"]
+    lines.append(
+        f"discord.py: {caches['guilds']} guilds | {caches['members']} members | {caches['channels']} channels | "
+        f"{caches['users']} users | {caches['messages']}/{caches['max_messages']} messages | {caches['voice_clients']} voice"
+    )
+    await ctx.send("```" + "\n".join(lines)[:1990] + "```")
+
+@bot.command(aliases=["msnap"])
+@allowed_only()
+async def memsnapshot(ctx, action: str = "diff", top: int = 10):
+    if action not in ("start", "diff", "top", "reset", "stop"):
+        await ctx.send("`Usage: $memsnapshot [start|diff|top|reset|stop] [top]`")
+        return
+    if action == "stop":
+        if memory_snapshots["started_tracing"]:
+            tracemalloc.stop()
+        memory_snapshots.update(baseline=None, taken_at=None, started_tracing=False)
+        await ctx.send("`tracemalloc snapshots cleared.`")
+        return
+    if action == "start" and not tracemalloc.is_tracing():
+        tracemalloc.start(MEMORY_TRACE_FRAMES)
+        memory_snapshots["started_tracing"] = True
+    if not tracemalloc.is_tracing():
+        await ctx.send("`tracemalloc is not running. Use $memsnapshot start first.`")
+        return
+    if action in ("start", "reset") or memory_snapshots["baseline"] is None:
+        memory_snapshots["baseline"] = await bot.loop.run_in_executor(None, take_memory_snapshot)
+        memory_snapshots["taken_at"] = time.time()
+        if action != "diff":
+            await ctx.send(f"`Baseline snapshot taken ({MEMORY_TRACE_FRAMES} frame(s) per allocation).`")
+            return
+
+    rows, total = await bot.loop.run_in_executor(None, memory_snapshot_stats, action, top)
+    if action == "diff":
+        lines = [
+            f"Growth since baseline {time.time() - memory_snapshots['taken_at']:.0f}s ago | traced now {total / 1024 / 1024:.1f} MiB",
+            f"{'call site':<40}{'delta':>13}{'blocks':>9}{'total':>13}",
+        ]
+        for site, size, count, current in rows:
+            lines.append(f"{site[-39:]:<40}{size / 1024:>+9.1f} KiB{count:>+9}{current / 1024:>9.1f} KiB")
+    else:
+        lines = [f"Top allocation sites | traced {total / 1024 / 1024:.1f} MiB", f"{'call site':<40}{'size':>13}{'blocks':>9}"]
+        for site, size, count, _ in rows:
+            lines.append(f"{site[-39:]:<40}{size / 1024:>9.1f} KiB{count:>9}")
+    await ctx.send("```" + "\n".join(lines)[:1990] + "```")
+
+@bot.command(aliases=["gwt"])
+@allowed_only()
+async def gatewaytrace(ctx, action: str = "status", name: str = None):
+    if action == "start":
+        if gateway_trace.path:
+            await ctx.send(f"`Already recording to {gateway_trace.path}.`")
+            return
+        filename = os.path.splitext(os.path.basename(name or f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}"))[0] + ".ndjson"
+        gateway_trace.start(os.path.join(GATEWAY_TRACE_PATH, filename))
+        await ctx.send(f"`Recording anonymized gateway events to {gateway_trace.path}.`")
+    elif action == "stop":
+        events = gateway_trace.events
+        path = await bot.loop.run_in_executor(None, gateway_trace.stop)
+        await ctx.send(f"`Saved {events} events to {path}.`" if path else "`No trace is being recorded.`")
+    elif action == "status":
+        if gateway_trace.path:
+            await ctx.send(f"`Recording to {gateway_trace.path}: {gateway_trace.events} events in {time.perf_counter() - gateway_trace.started:.0f}s.`")
+        else:
+            await ctx.send("`No trace is being recorded.`")
+    else:
+        await ctx.send("`Usage: $gatewaytrace [start|stop|status] [name]`")
+
+@bot.command(aliases=["sur"])
+@allowed_only()
+async def startupreport(ctx):
+    report = startup_report.as_dict()
+    lines = [f"Startup {'took' if startup_report.completed else 'running for'} {report['total_seconds']:.2f}s | {report['guilds']} guilds | {report['ticket_panels']} ticket panels"]
+    lines.append("-- marks --")
+    for name, seconds in sorted(report["marks"].items(), key=lambda item: item[1]):
+        lines.append(f"{name:<28}{seconds:>9.3f}s")
+    lines.append("-- phases --")
+    for name, phase in sorted(report["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"{name:<28}{phase['seconds']:>9.3f}s{phase['rest_calls']:>6} REST")
+    lines.append("-- imports --")
+    for name, seconds in sorted(report["imports"].items(), key=lambda item: -item[1]):
+        lines.append(f"{name:<28}{seconds:>9.3f}s")
+    await ctx.send("```" + "\n".join(lines)[:1990] + "```")
+
+@bot.command(aliases=["scmd"])
+@allowed_only()
+async def synccommands(ctx, scope: str = "guild"):
+    # Forces a sync even when the stored hash matches, for when Discord's copy drifted from the tree
+    if scope not in ("guild", "global") or (scope == "guild" and ctx.guild is None):
+        await ctx.send("`Usage: $synccommands [guild|global]` (guild only works in a server)")
+        return
+    await sync_command_tree(ctx.guild if scope == "guild" else None, force=True)
+    await ctx.send(f"`Synced {scope} application commands ({command_tree_hash(ctx.guild if scope == 'guild' else None)[:12]}).`")
+
+@bot.command(aliases=["pst"])
+@allowed_only()
+async def persiststats(ctx):
+    metrics = persistence.metrics
+    journal = ticket_journal.metrics
+    average = metrics["total_write_ms"] / metrics["flushes"] if metrics["flushes"] else 0
+    pending = sum(len(keys) for keys in persistence.dirty.values())
+    await ctx.send(
+        f"`Mutations: {metrics['mutations']} | flushes: {metrics['flushes']} | rows written: {metrics['rows_written']} | "
+        f"coalesced: {metrics['coalesced_writes']} | failed: {metrics['failed_flushes']} | pending: {pending}`\n"
+        f"`Write latency: last {metrics['last_write_ms']:.2f}ms | avg {average:.2f}ms | max {metrics['max_write_ms']:.2f}ms`\n"
+        f"`Ticket journal: {ticket_journal.records} uncompacted | appended: {journal['appended']} | "
+        f"compactions: {journal['compactions']} ({journal['compacted_records']} records) | "
+        f"last replay: {journal['last_replay_records']} records in {journal['last_replay_ms']:.1f}ms`"
+    )
+
+@bot.command(aliases=["gss"])
+@allowed_only()
+async def guildsettingsstats(ctx):
+    lines = []
+    for store in GUILD_SETTINGS_STORES:
+        stats = await bot.loop.run_in_executor(None, store.stats)
+        lines.append(
+            f"`{store.name}: {stats['resident']} resident / {stats['total']} total "
+            f"(+{stats['resident_empty']} empty) | hits: {stats['hits']} | loads: {stats['loads']} | evictions: {stats['evictions']}`"
+        )
+    await ctx.send("\n".join(lines))
+
 @bot.event
 async def on_message(message):
     if message.guild is not None:
@@ -2260,27 +3693,6 @@ async def on_message(message):
 #
 ''' ----- Logs Channel ----- '''
 
-LOGS_CHANNEL_LANGUAGE_SETTINGS = {
-    "zh": {
-        "set_log_channel_success": "記錄頻道已更新至 {channel}.",
-        "remove_log_channel_success": "此伺服器的記錄頻道已移除。",
-        "no_log_channel_set": "此伺服器目前沒有設定記錄頻道。",
-        "no_permission": "抱歉，您沒有管理員權限來使用此命令。",
-    },
-    "ja": {
-        "set_log_channel_success": "ログチャンネルが {channel} に更新されました。",
-        "remove_log_channel_success": "このサーバーのログチャンネルが削除されました。",
-        "no_log_channel_set": "このサーバーには現在、ログチャンネルが設定されていません。",
-        "no_permission": "申し訳ありませんが、このコマンドを使用する権限がありません。",
-    },
-    "en": {
-        "set_log_channel_success": "Logging channel updated to {channel}.",
-        "remove_log_channel_success": "The log channel for this server has been removed.",
-        "no_log_channel_set": "No log channel is currently set for this server.",
-        "no_permission": "Sorry, you do not have administrator permissions to use this command.",
-    }
-}
-
 @bot.command()
 @commands.has_permissions(administrator=True)
 async def setlogchannel(ctx, channel: discord.TextChannel):
@@ -2292,14 +3704,10 @@ async def setlogchannel(ctx, channel: discord.TextChannel):
         ))
         return
 
-    language = get_language(ctx.guild.id)
-    settings = LOGS_CHANNEL_LANGUAGE_SETTINGS.get(language, LOGS_CHANNEL_LANGUAGE_SETTINGS["en"])
-    
     try:
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         save_or_update_log_channel(ctx.guild.id, channel.id, ctx.author.id, current_time)
-        logging_channel_ids[ctx.guild.id] = channel.id
-        await ctx.send(settings["set_log_channel_success"].format(channel=channel.mention))
+        await ctx.send(t(ctx.guild.id, "logs_channel.set_log_channel_success", channel=channel.mention))
         await handle_exception(ctx, "setlogchannel", "Success")
     except Exception as e:
         await handle_exception(ctx, "setlogchannel", "Failure", error=e)
@@ -2315,25 +3723,20 @@ async def removelogchannel(ctx):
         ))
         return
 
-    language = get_language(ctx.guild.id)
-    settings = LOGS_CHANNEL_LANGUAGE_SETTINGS.get(language, LOGS_CHANNEL_LANGUAGE_SETTINGS["en"])
-    
     try:
         guild_id = ctx.guild.id
         if remove_log_channel(guild_id):
-            if guild_id in logging_channel_ids:
-                del logging_channel_ids[guild_id]
-            await ctx.send(settings["remove_log_channel_success"])
+            await ctx.send(t(guild_id, "logs_channel.remove_log_channel_success"))
         else:
-            await ctx.send(settings["no_log_channel_set"])
+            await ctx.send(t(guild_id, "logs_channel.no_log_channel_set"))
         await handle_exception(ctx, "removelogchannel", "Success")
     except Exception as e:
         await handle_exception(ctx, "removelogchannel", "Failure", error=e)
 
 async def log_action(guild, embed):
-    channel_id = logging_channel_ids.get(guild.id)
-    if channel_id:
-        channel = guild.get_channel(channel_id)
+    config = log_channels.get(guild.id)
+    if config:
+        channel = guild.get_channel(config.channel_id)
         if channel:
             await channel.send(embed=embed)
 
@@ -2345,44 +3748,20 @@ def format_timestamp(dt):
 
 @bot.event
 async def on_message_delete(message):
-    if message.guild and message.guild.id in logging_channel_ids and not message.author.bot:
+    if message.guild and message.guild.id in log_channels and not message.author.bot:
         try:
-            language = get_language(message.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Message Deleted",
-                    "message_field": "Message",
-                    "channel_field": "Channel",
-                    "timestamp_field": "Date & Time",
-                    "deleted_by_field": "Deleted By"
-                },
-                "zh": {
-                    "title": "訊息已刪除",
-                    "message_field": "訊息內容",
-                    "channel_field": "頻道",
-                    "timestamp_field": "日期與時間",
-                    "deleted_by_field": "刪除者"
-                },
-                "ja": {
-                    "title": "メッセージが削除されました",
-                    "message_field": "メッセージ内容",
-                    "channel_field": "チャンネル",
-                    "timestamp_field": "日時",
-                    "deleted_by_field": "削除者"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = message.guild.id
 
-            embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-            embed.add_field(name=settings["message_field"], value=f"`{message.content or '[No Content]'}`", inline=False)
+            embed = discord.Embed(title=t(guild_id, "log.message_delete.title"), color=discord.Color.from_rgb(13, 13, 13))
+            embed.add_field(name=t(guild_id, "log.message_delete.message_field"), value=f"`{message.content or '[No Content]'}`", inline=False)
 
             if message.attachments:
                 attachment_urls = "\n".join([attachment.url for attachment in message.attachments])
                 embed.add_field(name="Attachments", value=f"`{attachment_urls}`", inline=False)
 
-            embed.add_field(name=settings["channel_field"], value=f"`{message.channel.name} ({message.channel.id})`", inline=False)
-            embed.add_field(name=settings["timestamp_field"], value=format_timestamp(message.created_at), inline=False)
-            embed.add_field(name=settings["deleted_by_field"], value=f"<@{message.author.id}> `{message.author.name}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.message_delete.channel_field"), value=f"`{message.channel.name} ({message.channel.id})`", inline=False)
+            embed.add_field(name=t(guild_id, "log.message_delete.timestamp_field"), value=format_timestamp(message.created_at), inline=False)
+            embed.add_field(name=t(guild_id, "log.message_delete.deleted_by_field"), value=f"<@{message.author.id}> `{message.author.name}`", inline=False)
 
             await log_action(message.guild, embed)
         except Exception as e:
@@ -2390,45 +3769,18 @@ async def on_message_delete(message):
 
 @bot.event
 async def on_message_edit(before, after):
-    if before.guild and before.guild.id in logging_channel_ids and not before.author.bot:
+    if before.guild and before.guild.id in log_channels and not before.author.bot:
         if before.content == after.content or before.attachments != after.attachments:
             return
         try:
-            language = get_language(before.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Message Edited",
-                    "before_field": "Before",
-                    "after_field": "After",
-                    "channel_field": "Channel",
-                    "timestamp_field": "Date & Time",
-                    "edited_by_field": "Edited By"
-                },
-                "zh": {
-                    "title": "訊息已編輯",
-                    "before_field": "編輯前",
-                    "after_field": "編輯後",
-                    "channel_field": "頻道",
-                    "timestamp_field": "日期與時間",
-                    "edited_by_field": "編輯者"
-                },
-                "ja": {
-                    "title": "メッセージが編集されました",
-                    "before_field": "編集前",
-                    "after_field": "編集後",
-                    "channel_field": "チャンネル",
-                    "timestamp_field": "日時",
-                    "edited_by_field": "編集者"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = before.guild.id
 
-            embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-            embed.add_field(name=settings["before_field"], value=f"`{before.content or '[No Content]'}`", inline=False)
-            embed.add_field(name=settings["after_field"], value=f"`{after.content or '[No Content]'}`", inline=False)
-            embed.add_field(name=settings["channel_field"], value=f"`{before.channel.name} ({before.channel.id})`", inline=False)
-            embed.add_field(name=settings["timestamp_field"], value=format_timestamp(before.created_at), inline=False)
-            embed.add_field(name=settings["edited_by_field"], value=f"<@{before.author.id}> `{before.author.name}`", inline=False)
+            embed = discord.Embed(title=t(guild_id, "log.message_edit.title"), color=discord.Color.from_rgb(13, 13, 13))
+            embed.add_field(name=t(guild_id, "log.message_edit.before_field"), value=f"`{before.content or '[No Content]'}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.message_edit.after_field"), value=f"`{after.content or '[No Content]'}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.message_edit.channel_field"), value=f"`{before.channel.name} ({before.channel.id})`", inline=False)
+            embed.add_field(name=t(guild_id, "log.message_edit.timestamp_field"), value=format_timestamp(before.created_at), inline=False)
+            embed.add_field(name=t(guild_id, "log.message_edit.edited_by_field"), value=f"<@{before.author.id}> `{before.author.name}`", inline=False)
 
             await log_action(before.guild, embed)
         except Exception as e:
@@ -2436,33 +3788,9 @@ async def on_message_edit(before, after):
 
 @bot.event
 async def on_member_join(member):
-    if member.guild.id in logging_channel_ids:
+    if member.guild.id in log_channels:
         try:
-            language = get_language(member.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Member Invited" if used_invite else "Member Joined",
-                    "user_field": "User",
-                    "invited_by_field": "Invited By",
-                    "invite_code_field": "Invite Code",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "title": "成員邀請加入" if used_invite else "成員加入",
-                    "user_field": "用戶",
-                    "invited_by_field": "邀請者",
-                    "invite_code_field": "邀請碼",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "title": "メンバーが招待されました" if used_invite else "メンバーが参加しました",
-                    "user_field": "ユーザー",
-                    "invited_by_field": "招待者",
-                    "invite_code_field": "招待コード",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = member.guild.id
 
             updated_invites = await member.guild.invites()
             old_invites = invite_cache.get(member.guild.id, [])
@@ -2476,43 +3804,23 @@ async def on_member_join(member):
 
             invite_cache[member.guild.id] = updated_invites
 
-            embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-            embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
+            title_key = "log.member_join.invited_title" if used_invite else "log.member_join.joined_title"
+            embed = discord.Embed(title=t(guild_id, title_key), color=discord.Color.from_rgb(13, 13, 13))
+            embed.add_field(name=t(guild_id, "log.member_join.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
             if inviter:
-                embed.add_field(name=settings["invited_by_field"], value=f"<@{inviter.id}> `{inviter.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_join.invited_by_field"), value=f"<@{inviter.id}> `{inviter.name}`", inline=False)
             if used_invite:
-                embed.add_field(name=settings["invite_code_field"], value=f"`{used_invite.code}`", inline=False)
-            embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                embed.add_field(name=t(guild_id, "log.member_join.invite_code_field"), value=f"`{used_invite.code}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.member_join.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
             await log_action(member.guild, embed)
         except Exception as e:
             await handle_exception(member, "on_member_join", "Failure", error=e)
 
 @bot.event
 async def on_member_remove(member):
-    if member.guild.id in logging_channel_ids:
+    if member.guild.id in log_channels:
         try:
-            language = get_language(member.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Member Kicked" if actor else "Member Left",
-                    "user_field": "User",
-                    "kicked_by_field": "Kicked By",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "title": "成員被踢出" if actor else "成員離開",
-                    "user_field": "用戶",
-                    "kicked_by_field": "踢出者",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "title": "メンバーがキックされました" if actor else "メンバーが退出しました",
-                    "user_field": "ユーザー",
-                    "kicked_by_field": "キックした人",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = member.guild.id
 
             audit_log = []
             async for entry in member.guild.audit_logs(action=discord.AuditLogAction.kick, limit=1):
@@ -2520,77 +3828,36 @@ async def on_member_remove(member):
                     audit_log.append(entry)
             actor = audit_log[0].user if audit_log else None
 
-            embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-            embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
+            title_key = "log.member_remove.kicked_title" if actor else "log.member_remove.left_title"
+            embed = discord.Embed(title=t(guild_id, title_key), color=discord.Color.from_rgb(13, 13, 13))
+            embed.add_field(name=t(guild_id, "log.member_remove.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
             if actor:
-                embed.add_field(name=settings["kicked_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-            embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                embed.add_field(name=t(guild_id, "log.member_remove.kicked_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.member_remove.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
             await log_action(member.guild, embed)
         except Exception as e:
             await handle_exception(member, "on_member_remove", "Failure", error=e)
 
 @bot.event
 async def on_member_update(before, after):
-    if before.guild.id in logging_channel_ids:
+    if before.guild.id in log_channels:
         try:
-            language = get_language(before.guild.id)
-            language_settings = {
-                "en": {
-                    "role_added_title": "Role Added",
-                    "role_removed_title": "Role Removed",
-                    "user_field": "User",
-                    "role_field": "Role",
-                    "nickname_changed_title": "Nickname Changed",
-                    "nickname_added_title": "Nickname Added",
-                    "nickname_removed_title": "Nickname Removed",
-                    "old_nick_field": "Old Nickname",
-                    "new_nick_field": "New Nickname",
-                    "changed_by_field": "Changed By",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "role_added_title": "角色已添加",
-                    "role_removed_title": "角色已移除",
-                    "user_field": "用戶",
-                    "role_field": "角色",
-                    "nickname_changed_title": "暱稱已更改",
-                    "nickname_added_title": "新增暱稱",
-                    "nickname_removed_title": "移除暱稱",
-                    "old_nick_field": "舊暱稱",
-                    "new_nick_field": "新暱稱",
-                    "changed_by_field": "更改者",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "role_added_title": "役職が追加されました",
-                    "role_removed_title": "役職が削除されました",
-                    "user_field": "ユーザー",
-                    "role_field": "役職",
-                    "nickname_changed_title": "ニックネームが変更されました",
-                    "nickname_added_title": "ニックネームが追加されました",
-                    "nickname_removed_title": "ニックネームが削除されました",
-                    "old_nick_field": "旧ニックネーム",
-                    "new_nick_field": "新しいニックネーム",
-                    "changed_by_field": "変更者",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = before.guild.id
 
             added_roles = [role for role in after.roles if role not in before.roles]
             for role in added_roles:
-                embed = discord.Embed(title=settings["role_added_title"], color=discord.Color.from_rgb(13, 13, 13))
-                embed.add_field(name=settings["user_field"], value=f"<@{after.id}> `{after.name}`", inline=False)
-                embed.add_field(name=settings["role_field"], value=f"`{role.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                embed = discord.Embed(title=t(guild_id, "log.member_update.role_added_title"), color=discord.Color.from_rgb(13, 13, 13))
+                embed.add_field(name=t(guild_id, "log.member_update.user_field"), value=f"<@{after.id}> `{after.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.role_field"), value=f"`{role.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(after.guild, embed)
 
             removed_roles = [role for role in before.roles if role not in after.roles]
             for role in removed_roles:
-                embed = discord.Embed(title=settings["role_removed_title"], color=discord.Color.from_rgb(13, 13, 13))
-                embed.add_field(name=settings["user_field"], value=f"<@{after.id}> `{after.name}`", inline=False)
-                embed.add_field(name=settings["role_field"], value=f"`{role.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                embed = discord.Embed(title=t(guild_id, "log.member_update.role_removed_title"), color=discord.Color.from_rgb(13, 13, 13))
+                embed.add_field(name=t(guild_id, "log.member_update.user_field"), value=f"<@{after.id}> `{after.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.role_field"), value=f"`{role.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(after.guild, embed)
 
             if before.nick != after.nick:
@@ -2601,72 +3868,27 @@ async def on_member_update(before, after):
                 actor = audit_log[0].user if audit_log else None
 
                 embed = discord.Embed(
-                    title=settings["nickname_changed_title"] if before.nick and after.nick else (
-                        settings["nickname_added_title"] if after.nick else settings["nickname_removed_title"]),
+                    title=t(guild_id, "log.member_update.nickname_changed_title") if before.nick and after.nick else (
+                        t(guild_id, "log.member_update.nickname_added_title") if after.nick else t(guild_id, "log.member_update.nickname_removed_title")),
                     color=discord.Color.from_rgb(13, 13, 13)
                 )
-                embed.add_field(name=settings["user_field"], value=f"<@{after.id}> `{after.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.user_field"), value=f"<@{after.id}> `{after.name}`", inline=False)
                 if before.nick:
-                    embed.add_field(name=settings["old_nick_field"], value=f"`{before.nick}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.member_update.old_nick_field"), value=f"`{before.nick}`", inline=False)
                 if after.nick:
-                    embed.add_field(name=settings["new_nick_field"], value=f"`{after.nick}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.member_update.new_nick_field"), value=f"`{after.nick}`", inline=False)
                 if actor:
-                    embed.add_field(name=settings["changed_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=t(guild_id, "log.member_update.changed_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.member_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(after.guild, embed)
         except Exception as e:
             await handle_exception(after, "on_member_update", "Failure", error=e)
 
 @bot.event
 async def on_voice_state_update(member, before, after):
-    if member.guild.id in logging_channel_ids:
+    if member.guild.id in log_channels:
         try:
-            language = get_language(member.guild.id)
-            language_settings = {
-                "en": {
-                    "mute_title": "User Muted",
-                    "unmute_title": "User Unmuted",
-                    "deaf_title": "User Deafened",
-                    "undeaf_title": "User Undeafened",
-                    "disconnect_title": "User Disconnected from Voice Channel",
-                    "move_title": "User Moved Voice Channel",
-                    "user_field": "User",
-                    "action_by_field": "Action By",
-                    "from_channel_field": "From Channel",
-                    "to_channel_field": "To Channel",
-                    "channel_field": "Channel",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "mute_title": "用戶被靜音",
-                    "unmute_title": "用戶取消靜音",
-                    "deaf_title": "用戶被禁聽",
-                    "undeaf_title": "用戶取消禁聽",
-                    "disconnect_title": "用戶已從語音頻道斷開",
-                    "move_title": "用戶移動了語音頻道",
-                    "user_field": "用戶",
-                    "action_by_field": "操作人",
-                    "from_channel_field": "從頻道",
-                    "to_channel_field": "到頻道",
-                    "channel_field": "頻道",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "mute_title": "ユーザーがミュートされました",
-                    "unmute_title": "ユーザーのミュートが解除されました",
-                    "deaf_title": "ユーザーが聴覚を制限されました",
-                    "undeaf_title": "ユーザーの聴覚制限が解除されました",
-                    "disconnect_title": "ユーザーがボイスチャンネルから切断されました",
-                    "move_title": "ユーザーがボイスチャンネルを移動しました",
-                    "user_field": "ユーザー",
-                    "action_by_field": "操作者",
-                    "from_channel_field": "移動元チャンネル",
-                    "to_channel_field": "移動先チャンネル",
-                    "channel_field": "チャンネル",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = member.guild.id
 
             actor = None
 
@@ -2676,13 +3898,13 @@ async def on_voice_state_update(member, before, after):
                     if entry.target and entry.target.id == member.id:
                         audit_log.append(entry)
                 actor = audit_log[0].user if audit_log else None
-                title = settings["mute_title"] if after.mute else settings["unmute_title"]
+                title = t(guild_id, "log.voice_state_update.mute_title") if after.mute else t(guild_id, "log.voice_state_update.unmute_title")
                 color = discord.Color.red() if after.mute else discord.Color.green()
                 embed = discord.Embed(title=title, color=color)
-                embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.voice_state_update.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
                 if actor:
-                    embed.add_field(name=settings["action_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.action_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.voice_state_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(member.guild, embed)
 
             if before.deaf != after.deaf:
@@ -2691,13 +3913,13 @@ async def on_voice_state_update(member, before, after):
                     if entry.target and entry.target.id == member.id:
                         audit_log.append(entry)
                 actor = audit_log[0].user if audit_log else None
-                title = settings["deaf_title"] if after.deaf else settings["undeaf_title"]
+                title = t(guild_id, "log.voice_state_update.deaf_title") if after.deaf else t(guild_id, "log.voice_state_update.undeaf_title")
                 color = discord.Color.red() if after.deaf else discord.Color.green()
                 embed = discord.Embed(title=title, color=color)
-                embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.voice_state_update.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
                 if actor:
-                    embed.add_field(name=settings["action_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.action_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.voice_state_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(member.guild, embed)
 
             if before.channel != after.channel:
@@ -2707,19 +3929,19 @@ async def on_voice_state_update(member, before, after):
                         audit_log.append(entry)
                 actor = audit_log[0].user if audit_log else None
                 if after.channel is None:
-                    embed = discord.Embed(title=settings["disconnect_title"], color=discord.Color.red())
-                    embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
-                    embed.add_field(name=settings["channel_field"], value=f"`{before.channel.name}`" if before.channel else "Unknown", inline=False)
+                    embed = discord.Embed(title=t(guild_id, "log.voice_state_update.disconnect_title"), color=discord.Color.red())
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.channel_field"), value=f"`{before.channel.name}`" if before.channel else "Unknown", inline=False)
                     if actor:
-                        embed.add_field(name=settings["action_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                        embed.add_field(name=t(guild_id, "log.voice_state_update.action_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
                 else:
-                    embed = discord.Embed(title=settings["move_title"], color=discord.Color.blue())
-                    embed.add_field(name=settings["user_field"], value=f"<@{member.id}> `{member.name}`", inline=False)
-                    embed.add_field(name=settings["from_channel_field"], value=f"`{before.channel.name}`" if before.channel else "None", inline=False)
-                    embed.add_field(name=settings["to_channel_field"], value=f"`{after.channel.name}`", inline=False)
+                    embed = discord.Embed(title=t(guild_id, "log.voice_state_update.move_title"), color=discord.Color.blue())
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.user_field"), value=f"<@{member.id}> `{member.name}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.from_channel_field"), value=f"`{before.channel.name}`" if before.channel else "None", inline=False)
+                    embed.add_field(name=t(guild_id, "log.voice_state_update.to_channel_field"), value=f"`{after.channel.name}`", inline=False)
                     if actor:
-                        embed.add_field(name=settings["action_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                        embed.add_field(name=t(guild_id, "log.voice_state_update.action_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.voice_state_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(member.guild, embed)
 
         except Exception as e:
@@ -2727,52 +3949,28 @@ async def on_voice_state_update(member, before, after):
 
 @bot.event
 async def on_guild_channel_create(channel):
-    if channel.guild.id in logging_channel_ids:
+    if channel.guild.id in log_channels:
         try:
-            language = get_language(channel.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Channel Created",
-                    "channel_field": "Channel",
-                    "type_field": "Type",
-                    "created_by_field": "Created By",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "title": "頻道已創建",
-                    "channel_field": "頻道",
-                    "type_field": "類型",
-                    "created_by_field": "創建者",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "title": "チャンネルが作成されました",
-                    "channel_field": "チャンネル",
-                    "type_field": "タイプ",
-                    "created_by_field": "作成者",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = channel.guild.id
 
             audit_log = []
             async for entry in channel.guild.audit_logs(action=discord.AuditLogAction.channel_create, limit=1):
                 audit_log.append(entry)
             actor = audit_log[0].user if audit_log else None
 
-            embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-            embed.add_field(name=settings["channel_field"], value=f"`{channel.name}`", inline=False)
-            embed.add_field(name=settings["type_field"], value=f"`{channel.type.name.capitalize()}`", inline=False)
+            embed = discord.Embed(title=t(guild_id, "log.channel_create.title"), color=discord.Color.from_rgb(13, 13, 13))
+            embed.add_field(name=t(guild_id, "log.channel_create.channel_field"), value=f"`{channel.name}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.channel_create.type_field"), value=f"`{channel.type.name.capitalize()}`", inline=False)
             if actor:
-                embed.add_field(name=settings["created_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-            embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                embed.add_field(name=t(guild_id, "log.channel_create.created_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+            embed.add_field(name=t(guild_id, "log.channel_create.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
             await log_action(channel.guild, embed)
         except Exception as e:
             await handle_exception(channel, "on_guild_channel_create", "Failure", error=e)
 
 @bot.event
 async def on_guild_channel_delete(channel):
-    if channel.guild.id in logging_channel_ids:
+    if channel.guild.id in log_channels:
         try:
             audit_log = []
             async for entry in channel.guild.audit_logs(action=discord.AuditLogAction.channel_delete, limit=1):
@@ -2791,68 +3989,35 @@ async def on_guild_channel_delete(channel):
 
 @bot.event
 async def on_guild_channel_update(before, after):
-    if before.guild.id in logging_channel_ids:
+    if before.guild.id in log_channels:
         try:
-            language = get_language(before.guild.id)
-            language_settings = {
-                "en": {
-                    "rename_title": "Channel Renamed",
-                    "permissions_update_title": "Channel Permissions Updated",
-                    "old_name_field": "Old Name",
-                    "new_name_field": "New Name",
-                    "type_field": "Type",
-                    "renamed_by_field": "Renamed By",
-                    "updated_by_field": "Updated By",
-                    "channel_field": "Channel",
-                    "target_field": "Target",
-                    "added_permissions_field": "Permissions Added",
-                    "removed_permissions_field": "Permissions Removed",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "rename_title": "頻道已重命名",
-                    "permissions_update_title": "頻道權限已更新",
-                    "old_name_field": "舊名稱",
-                    "new_name_field": "新名稱",
-                    "type_field": "類型",
-                    "renamed_by_field": "重命名者",
-                    "updated_by_field": "更新者",
-                    "channel_field": "頻道",
-                    "target_field": "目標",
-                    "added_permissions_field": "新增權限",
-                    "removed_permissions_field": "移除權限",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "rename_title": "チャンネル名が変更されました",
-                    "permissions_update_title": "チャンネル権限が更新されました",
-                    "old_name_field": "旧名",
-                    "new_name_field": "新名",
-                    "type_field": "タイプ",
-                    "renamed_by_field": "名前変更者",
-                    "updated_by_field": "更新者",
-                    "channel_field": "チャンネル",
-                    "target_field": "対象",
-                    "added_permissions_field": "追加された権限",
-                    "removed_permissions_field": "削除された権限",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = before.guild.id
+            # `after` is the cached channel, which later updates keep changing while the audit log is fetched
+            after_name = after.name
+            changes = []
+            for target in after.overwrites:
+                before_perms = before.overwrites_for(target)
+                after_perms = after.overwrites_for(target)
+
+                added_permissions = [perm for perm, value in after_perms if value and not getattr(before_perms, perm, False)]
+                removed_permissions = [perm for perm, value in before_perms if value and not getattr(after_perms, perm, False)]
+
+                if added_permissions or removed_permissions:
+                    changes.append({"target": target, "added_permissions": added_permissions, "removed_permissions": removed_permissions})
 
             audit_log = []
             async for entry in before.guild.audit_logs(action=discord.AuditLogAction.channel_update, limit=1):
                 audit_log.append(entry)
             actor = audit_log[0].user if audit_log else None
 
-            if before.name != after.name:
-                embed = discord.Embed(title=settings["rename_title"], color=discord.Color.from_rgb(13, 13, 13))
-                embed.add_field(name=settings["old_name_field"], value=f"`{before.name}`", inline=False)
-                embed.add_field(name=settings["new_name_field"], value=f"`{after.name}`", inline=False)
-                embed.add_field(name=settings["type_field"], value=f"`{after.type.name.capitalize()}`", inline=False)
+            if before.name != after_name:
+                embed = discord.Embed(title=t(guild_id, "log.channel_update.rename_title"), color=discord.Color.from_rgb(13, 13, 13))
+                embed.add_field(name=t(guild_id, "log.channel_update.old_name_field"), value=f"`{before.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.channel_update.new_name_field"), value=f"`{after_name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.channel_update.type_field"), value=f"`{after.type.name.capitalize()}`", inline=False)
                 if actor:
-                    embed.add_field(name=settings["renamed_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=t(guild_id, "log.channel_update.renamed_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                embed.add_field(name=t(guild_id, "log.channel_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(before.guild, embed)
 
             audit_log = []
@@ -2861,64 +4026,26 @@ async def on_guild_channel_update(before, after):
                     audit_log.append(entry)
             actor = audit_log[0].user if audit_log else None
 
-            changes = []
-            for target in after.overwrites:
-                before_perms = before.overwrites_for(target)
-                after_perms = after.overwrites_for(target)
-
-                added_permissions = [perm for perm, value in after_perms if value and not getattr(before_perms, perm, False)]
-                removed_permissions = [perm for perm, value in before_perms if value and not getattr(after_perms, perm, False)]
-
-                if added_permissions or removed_permissions:
-                    changes.append({"target": target, "added_permissions": added_permissions, "removed_permissions": removed_permissions})
-
             if changes:
-                embed = discord.Embed(title=settings["permissions_update_title"], color=discord.Color.from_rgb(13, 13, 13))
-                embed.add_field(name=settings["channel_field"], value=f"`{after.name}` ({after.type.name.capitalize()})", inline=False)
+                embed = discord.Embed(title=t(guild_id, "log.channel_update.permissions_update_title"), color=discord.Color.from_rgb(13, 13, 13))
+                embed.add_field(name=t(guild_id, "log.channel_update.channel_field"), value=f"`{after_name}` ({after.type.name.capitalize()})", inline=False)
                 if actor:
-                    embed.add_field(name=settings["updated_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.channel_update.updated_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
                 for change in changes:
                     target_name = f"<@&{change['target'].id}>" if isinstance(change['target'], discord.Role) else f"<@{change['target'].id}>"
                     added_perms_text = ", ".join([f"`{perm}`" for perm in change['added_permissions']]) if change['added_permissions'] else "None"
                     removed_perms_text = ", ".join([f"`{perm}`" for perm in change['removed_permissions']]) if change['removed_permissions'] else "None"
-                    embed.add_field(name=f"{settings['target_field']}: {target_name}", value=f"**{settings['added_permissions_field']}**: {added_perms_text}\n**{settings['removed_permissions_field']}**: {removed_perms_text}", inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=f"{t(guild_id, 'log.channel_update.target_field')}: {target_name}", value=f"**{t(guild_id, 'log.channel_update.added_permissions_field')}**: {added_perms_text}\n**{t(guild_id, 'log.channel_update.removed_permissions_field')}**: {removed_perms_text}", inline=False)
+                embed.add_field(name=t(guild_id, "log.channel_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(before.guild, embed)
         except Exception as e:
             await handle_exception(before, "on_guild_channel_update", "Failure", error=e)
 
 @bot.event
 async def on_guild_role_update(before, after):
-    if before.guild.id in logging_channel_ids:
+    if before.guild.id in log_channels:
         try:
-            language = get_language(before.guild.id)
-            language_settings = {
-                "en": {
-                    "title": "Role Permissions Updated",
-                    "role_field": "Role",
-                    "updated_by_field": "Updated By",
-                    "permissions_added_field": "Permissions Added",
-                    "permissions_removed_field": "Permissions Removed",
-                    "timestamp_field": "Date & Time"
-                },
-                "zh": {
-                    "title": "身分組權限已更新",
-                    "role_field": "身分組",
-                    "updated_by_field": "更新者",
-                    "permissions_added_field": "新增權限",
-                    "permissions_removed_field": "移除權限",
-                    "timestamp_field": "日期與時間"
-                },
-                "ja": {
-                    "title": "役職の権限が更新されました",
-                    "role_field": "役職",
-                    "updated_by_field": "更新者",
-                    "permissions_added_field": "追加された権限",
-                    "permissions_removed_field": "削除された権限",
-                    "timestamp_field": "日時"
-                }
-            }
-            settings = language_settings.get(language, language_settings["en"])
+            guild_id = before.guild.id
 
             audit_log = []
             async for entry in before.guild.audit_logs(action=discord.AuditLogAction.role_update, limit=1):
@@ -2930,15 +4057,15 @@ async def on_guild_role_update(before, after):
             removed_permissions = [perm for perm, value in before.permissions if value and not getattr(after.permissions, perm)]
 
             if added_permissions or removed_permissions:
-                embed = discord.Embed(title=settings["title"], color=discord.Color.from_rgb(13, 13, 13))
-                embed.add_field(name=settings["role_field"], value=f"`{after.name}`", inline=False)
+                embed = discord.Embed(title=t(guild_id, "log.role_update.title"), color=discord.Color.from_rgb(13, 13, 13))
+                embed.add_field(name=t(guild_id, "log.role_update.role_field"), value=f"`{after.name}`", inline=False)
                 if actor:
-                    embed.add_field(name=settings["updated_by_field"], value=f"<@{actor.id}> `{actor.name}`", inline=False)
+                    embed.add_field(name=t(guild_id, "log.role_update.updated_by_field"), value=f"<@{actor.id}> `{actor.name}`", inline=False)
                 if added_permissions:
-                    embed.add_field(name=settings["permissions_added_field"], value=", ".join([f"`{perm}`" for perm in added_permissions]), inline=False)
+                    embed.add_field(name=t(guild_id, "log.role_update.permissions_added_field"), value=", ".join([f"`{perm}`" for perm in added_permissions]), inline=False)
                 if removed_permissions:
-                    embed.add_field(name=settings["permissions_removed_field"], value=", ".join([f"`{perm}`" for perm in removed_permissions]), inline=False)
-                embed.add_field(name=settings["timestamp_field"], value=format_timestamp(datetime.now()), inline=False)
+                    embed.add_field(name=t(guild_id, "log.role_update.permissions_removed_field"), value=", ".join([f"`{perm}`" for perm in removed_permissions]), inline=False)
+                embed.add_field(name=t(guild_id, "log.role_update.timestamp_field"), value=format_timestamp(datetime.now()), inline=False)
                 await log_action(before.guild, embed)
         except Exception as e:
             await handle_exception(before, "on_guild_role_update", "Failure", error=e)
@@ -2951,52 +4078,7 @@ async def on_guild_role_update(before, after):
 
 class WelcomeMessageModal(Modal):
     def __init__(self, language="zh"):
-        language_settings = {
-            "en": {
-                "title_text": "Welcome Message Setup",
-                "title_label": "Title",
-                "title_placeholder": "Enter the welcome message title",
-                "desc_label": "Content",
-                "desc_placeholder": "Enter the welcome message content",
-                "type_label": "Message Type",
-                "type_placeholder": "Enter 'raw' or 'embed'",
-                "image_url_label": "Image URL or 'author'",
-                "image_url_placeholder": "Enter image URL or 'author' for member's avatar",
-                "color_label": "Color",
-                "color_placeholder": "Enter color (e.g., '#000000' or 'blue')",
-                "success_message": "Welcome message settings have been saved!"
-            },
-            "zh": {
-                "title_text": "歡迎訊息設定",
-                "title_label": "標題",
-                "title_placeholder": "請輸入歡迎訊息的標題",
-                "desc_label": "內容",
-                "desc_placeholder": "請輸入歡迎訊息的內容",
-                "type_label": "訊息類型",
-                "type_placeholder": "輸入 'raw' 或 'embed'",
-                "image_url_label": "圖片連結或 'author'",
-                "image_url_placeholder": "請輸入圖片URL或輸入 'author' 使用成員頭像",
-                "color_label": "顏色",
-                "color_placeholder": "請輸入顏色 (例如 '#000000' 或 'blue')",
-                "success_message": "歡迎訊息設置已保存！"
-            },
-            "ja": {
-                "title_text": "ウェルカムメッセージの設定",
-                "title_label": "タイトル",
-                "title_placeholder": "ウェルカムメッセージのタイトルを入力",
-                "desc_label": "内容",
-                "desc_placeholder": "ウェルカムメッセージの内容を入力",
-                "type_label": "メッセージタイプ",
-                "type_placeholder": "「raw」または「embed」と入力",
-                "image_url_label": "画像URLまたは「author」",
-                "image_url_placeholder": "画像のURLまたは「author」を入力",
-                "color_label": "色",
-                "color_placeholder": "色を入力（例：'#000000'または'blue'）",
-                "success_message": "ウェルカムメッセージの設定が保存されました！"
-            }
-        }
-
-        settings = language_settings.get(language, language_settings["zh"])
+        settings = catalog.section(language, "welcome_modal")
 
         super().__init__(title=settings["title_text"])
 
@@ -3015,7 +4097,7 @@ class WelcomeMessageModal(Modal):
         self.add_item(self.color_input)
 
     async def on_submit(self, interaction: discord.Interaction):
-        guild_id = str(interaction.guild.id)
+        guild_id = interaction.guild.id
 
         color_map = {
             "blue": "#0000FF",
@@ -3037,17 +4119,16 @@ class WelcomeMessageModal(Modal):
 
         color = color_text if re.match(hex_color_pattern, color_text) else color_map.get(color_text, "#00FF00")
 
-        welcome_messages[guild_id] = {
-            "channel_id": welcome_messages.get(guild_id, {}).get("channel_id"),
-            "welcome_message": {
-                "title": self.title_input.value,
-                "desc": self.desc_input.value if self.desc_input.value.lower() != "none" else None,
-                "type": self.type_input.value.lower(),
-                "image_url": self.image_url_input.value if self.image_url_input.value.lower() != "none" else None,
-                "color": color
-            }
-        }
-        save_welcome_messages()
+        existing = welcome_messages.get(guild_id)
+        welcome_messages[guild_id] = WelcomeConfig(
+            channel_id=existing.channel_id if existing else None,
+            title=self.title_input.value,
+            desc=self.desc_input.value if self.desc_input.value.lower() != "none" else None,
+            message_type=self.type_input.value.lower(),
+            image_url=self.image_url_input.value if self.image_url_input.value.lower() != "none" else None,
+            color=color
+        )
+        save_welcome_message(guild_id)
         await interaction.response.send_message(self.success_message, ephemeral=True)
 
 @bot.command()
@@ -3060,19 +4141,14 @@ async def setwelcomechannel(ctx, channel: discord.TextChannel):
         ))
         return
 
-    language = get_language(ctx.guild.id)
-    messages = {
-        "en": "Welcome channel has been set to {}.",
-        "zh": "歡迎頻道已設置為 {}。",
-        "ja": "ウェルカムチャンネルが {} に設定されました。"
-    }
-    message = messages.get(language, messages["en"])
-
-    guild_id = str(ctx.guild.id)
-    welcome_messages[guild_id] = welcome_messages.get(guild_id, {})
-    welcome_messages[guild_id]["channel_id"] = channel.id
-    save_welcome_messages()
-    await ctx.send(message.format(channel.mention))
+    guild_id = ctx.guild.id
+    config = welcome_messages.get(guild_id)
+    if config is None:
+        config = WelcomeConfig()
+        welcome_messages[guild_id] = config
+    config.channel_id = channel.id
+    save_welcome_message(guild_id)
+    await ctx.send(t(guild_id, "welcome.channel_set", channel=channel.mention))
 
 @bot.command()
 @commands.has_permissions(administrator=True)
@@ -3085,22 +4161,11 @@ async def removewelcomechannel(ctx):
         ))
         return
 
-    language = get_language(ctx.guild.id)
-    messages = {
-        "en": "The welcome channel data for this server has been removed.",
-        "zh": "此伺服器的歡迎頻道資料已被移除。",
-        "ja": "このサーバーのウェルカムチャンネルデータは削除されました。"
-    }
-    no_channel_messages = {
-        "en": "No welcome channel is currently set for this server.",
-        "zh": "此伺服器目前未設定歡迎頻道。",
-        "ja": "このサーバーにはウェルカムチャンネルが設定されていません。"
-    }
-    guild_id = str(ctx.guild.id)
+    guild_id = ctx.guild.id
     if remove_welcome_message(guild_id):
-        await ctx.send(messages.get(language, messages["en"]))
+        await ctx.send(t(guild_id, "welcome.channel_removed"))
     else:
-        await ctx.send(no_channel_messages.get(language, no_channel_messages["en"]))
+        await ctx.send(t(guild_id, "welcome.no_channel_set"))
 
 @bot.command()
 async def setwelcomemessage(ctx):
@@ -3112,59 +4177,50 @@ async def setwelcomemessage(ctx):
         ))
         return
 
-    language = get_language(ctx.guild.id)
-    embed_titles = {
-        "en": "Welcome Message Setup",
-        "zh": "歡迎訊息設定",
-        "ja": "ウェルカムメッセージの設定"
-    }
-    embed_descs = {
-        "en": "Please click the button below to open the welcome message setup form.",
-        "zh": "請點擊下方按鈕以開啟歡迎訊息設置表單。",
-        "ja": "以下のボタンをクリックして、ウェルカムメッセージ設定フォームを開いてください。"
-    }
-    button_labels = {
-        "zh": "點擊設定",
-        "ja": "セットアップ",
-        "en": "Click to Setup"
-    }
-
+    guild_id = ctx.guild.id
     embed = discord.Embed(
-        title=embed_titles.get(language, embed_titles["en"]),
-        description=embed_descs.get(language, embed_descs["en"]),
+        title=t(guild_id, "welcome.setup_title"),
+        description=t(guild_id, "welcome.setup_description"),
         color=0x00ff00
     )
 
-    view = discord.ui.View()
-    view.add_item(discord.ui.Button(label=button_labels["zh"], style=discord.ButtonStyle.primary, custom_id="open_form_zh"))
-    view.add_item(discord.ui.Button(label=button_labels["ja"], style=discord.ButtonStyle.secondary, custom_id="open_form_ja"))
-    view.add_item(discord.ui.Button(label=button_labels["en"], style=discord.ButtonStyle.secondary, custom_id="open_form_en"))
+    # Each button opens the form in its own language, so its label comes from that language's bundle
+    view = discord.ui.View(timeout=None)
+    view.add_item(PanelButton("open_form", "zh", catalog.text("zh", "welcome.setup_button"), discord.ButtonStyle.primary))
+    view.add_item(PanelButton("open_form", "ja", catalog.text("ja", "welcome.setup_button")))
+    view.add_item(PanelButton("open_form", "en", catalog.text("en", "welcome.setup_button")))
 
     await ctx.send(embed=embed, view=view)
 
-@bot.event
-async def on_member_join(member):
-    guild_id = str(member.guild.id)
-    if guild_id not in welcome_messages or "channel_id" not in welcome_messages[guild_id]:
+async def open_welcome_form(interaction: discord.Interaction, key):
+    await interaction.response.send_modal(WelcomeMessageModal(language=PANEL_LANGUAGE_KEYS.get(key, key)))
+
+PANEL_BUTTON_HANDLERS["open_form"] = open_welcome_form
+
+@bot.listen("on_member_join")
+async def send_member_welcome(member):
+    config = welcome_messages.get(member.guild.id)
+    if config is None or config.channel_id is None or not config.has_message:
         return
 
-    channel = bot.get_channel(welcome_messages[guild_id]["channel_id"])
+    channel = bot.get_channel(config.channel_id)
     if not channel:
         return
 
-    message_type = welcome_messages[guild_id]["welcome_message"]["type"]
-    title = welcome_messages[guild_id]["welcome_message"]["title"]
-    desc = welcome_messages[guild_id]["welcome_message"].get("desc")
-    image_url = welcome_messages[guild_id]["welcome_message"]["image_url"]
-    color_hex = welcome_messages[guild_id]["welcome_message"]["color"]
+    message_type = config.message_type
+    title = config.title
+    desc = config.desc
+    image_url = config.image_url
+    color_hex = config.color or "#00FF00"
 
-    desc = desc.replace("<author>", f"<@{member.id}>")
+    if desc:
+        desc = desc.replace("<author>", f"<@{member.id}>")
 
     if message_type == "embed":
         embed = discord.Embed(title=title, description=desc, color=discord.Color.from_str(color_hex))
-        if image_url.lower() == "author" and member.avatar:
+        if image_url and image_url.lower() == "author" and member.avatar:
             embed.set_thumbnail(url=member.avatar.url)
-        else:
+        elif image_url:
             embed.set_image(url=image_url)
         await channel.send(embed=embed)
     else:
@@ -3177,101 +4233,21 @@ async def on_member_join(member):
 #
 ''' ----- Music Bot ----- '''
 
-MUSIC_LANGUAGES_TEXTS = {
-    "en": {
-        "error_fetch_audio": "Could not fetch audio.",
-        "error_invalid_spotify_url": "Invalid Spotify URL.",
-        "queue_empty": "The queue is empty.",
-        "now_playing": "Now Playing",
-        "playing_track": "Playing: **{track_title}**",
-        "added_to_queue": "Added to Queue",
-        "added_track": "**{track_title}** added to queue.",
-        "duplicate_track": "Duplicate Track",
-        "track_already_in_queue": "Track **{track_title}** is already in the queue.",
-        "loop_mode": "Loop Mode",
-        "loop_mode_set": "Loop mode set to: **{mode_text}**.",
-        "invalid_loop_mode": "Invalid loop mode. Use 'off', 'track', or 'queue'.",
-        "playback_progress": "Playback Progress",
-        "time": "Time",
-        "queue_title": "Queue",
-        "searching": "Searching for:",
-        "added_playlist": "Added playlist **{playlist_name}** with **{track_count}** tracks to the queue.",
-        "playlist_no_new_tracks": "No new tracks from the playlist were added to the queue.",
-        "error": "An error occurred.",
-        "error_no_voice_channel": "You must be in a voice channel to use this command.",
-        "music_stopped": "Music playback has stopped.",
-        "queue_cleared": "The queue has been cleared.",
-        "disconnected": "Disconnected.",
-        "bot_left_channel": "The bot has left the voice channel.",
-        "skip_success": "Skipped Track",
-        "skip_message": "Skipped **{track_title}**. Playing next track...",
-    },
-    "zh": {
-        "error_fetch_audio": "無法獲取音訊。",
-        "error_invalid_spotify_url": "無效的 Spotify URL。",
-        "queue_empty": "隊列為空。",
-        "now_playing": "播放中",
-        "playing_track": "正在播放：**{track_title}**",
-        "added_to_queue": "已添加到隊列",
-        "added_track": "**{track_title}** 已添加到隊列。",
-        "duplicate_track": "重複的曲目",
-        "track_already_in_queue": "曲目 **{track_title}** 已在隊列中。",
-        "loop_mode": "循環模式",
-        "loop_mode_set": "循環模式已設置為：**{mode_text}**。",
-        "invalid_loop_mode": "無效的循環模式。請使用 'off'、'track' 或 'queue'。",
-        "playback_progress": "播放進度",
-        "time": "時間",
-        "queue_title": "播放隊列",
-        "searching": "正在搜索：",
-        "added_playlist": "已將播放清單 **{playlist_name}** 中的 **{track_count}** 首歌曲加入至隊列。",
-        "playlist_no_new_tracks": "播放清單中沒有新歌曲加入至隊列。",
-        "error": "發生錯誤。",
-        "error_no_voice_channel": "您必須在語音頻道中才能使用此指令。",
-        "music_stopped": "音樂播放已停止。",
-        "queue_cleared": "播放隊列已清空。",
-        "disconnected": "已斷開連接。",
-        "bot_left_channel": "機器人已離開語音頻道。",
-        "skip_success": "跳過曲目",
-        "skip_message": "跳過了 **{track_title}**，播放下一首歌曲...",
-    },
-    "ja": {
-        "error_fetch_audio": "オーディオを取得できませんでした。",
-        "error_invalid_spotify_url": "無効な Spotify URL です。",
-        "queue_empty": "キューは空です。",
-        "now_playing": "再生中",
-        "playing_track": "再生中：**{track_title}**",
-        "added_to_queue": "キューに追加されました",
-        "added_track": "**{track_title}** がキューに追加されました。",
-        "duplicate_track": "重複したトラック",
-        "track_already_in_queue": "トラック **{track_title}** はすでにキューにあります。",
-        "loop_mode": "ループモード",
-        "loop_mode_set": "ループモードが設定されました：**{mode_text}**。",
-        "invalid_loop_mode": "無効なループモードです。「off」、「track」、「queue」を使用してください。",
-        "playback_progress": "再生進行状況",
-        "time": "タイム",
-        "queue_title": "再生キュー",
-        "searching": "検索中：",
-        "added_playlist": "プレイリスト **{playlist_name}** から **{track_count}** 件のトラックをキューに追加しました。",
-        "playlist_no_new_tracks": "プレイリストに新しいトラックがありませんでした。",
-        "error": "エラーが発生しました。",
-        "error_no_voice_channel": "このコマンドを使用するには、ボイスチャンネルに参加する必要があります。",
-        "music_stopped": "音楽の再生が停止しました。",
-        "queue_cleared": "キューがクリアされました。",
-        "disconnected": "切断されました。",
-        "bot_left_channel": "ボットはボイスチャンネルを退出しました。",
-        "skip_success": "スキップしました",
-        "skip_message": "**{track_title}** をスキップしました。次のトラックを再生中...",
-    }
-}
-
 def get_message(guild_id, key, **kwargs):
-    language = get_language(guild_id)
-    message = MUSIC_LANGUAGES_TEXTS.get(language, {}).get(key, "")
-    return message.format(**kwargs)
+    return t(guild_id, f"music.{key}", **kwargs)
 
-os.environ["SPOTIPY_CLIENT_ID"] = os.getenv("SPOTIPY_CLIENT_ID")
-os.environ["SPOTIPY_CLIENT_SECRET"] = os.getenv("SPOTIPY_CLIENT_SECRET")
-spotify = Spotify(client_credentials_manager=SpotifyClientCredentials())
+# Music dependencies load on first use; missing Spotify credentials only fail Spotify links
+@functools.cache
+def spotify_client():
+    from spotipy import Spotify
+    from spotipy.oauth2 import SpotifyClientCredentials
+    return Spotify(client_credentials_manager=SpotifyClientCredentials(
+        client_id=os.getenv("SPOTIPY_CLIENT_ID"), client_secret=os.getenv("SPOTIPY_CLIENT_SECRET")
+    ))
+
+def youtube_dl(options):
+    import yt_dlp
+    return yt_dlp.YoutubeDL(options)
 
 YDL_OPTIONS = {
     'format': 'bestaudio',
@@ -3297,8 +4273,8 @@ def format_time(seconds):
 
 async def send_embed(ctx, title, description, color):
     language = get_language(ctx.guild.id)
-    localized_title = MUSIC_LANGUAGES_TEXTS.get(language, {}).get(title, title)
-    localized_description = MUSIC_LANGUAGES_TEXTS.get(language, {}).get(description, description)
+    localized_title = catalog.text(language, f"music.{title}", title)
+    localized_description = catalog.text(language, f"music.{description}", description)
     await ctx.send(embed=discord.Embed(title=localized_title, description=localized_description, color=color))
 
 async def download_audio(ctx, url):
@@ -3308,7 +4284,7 @@ async def download_audio(ctx, url):
         os.makedirs(download_path, exist_ok=True)
         ydl_opts = YDL_OPTIONS.copy()
         ydl_opts['outtmpl'] = f'{download_path}/%(title)s.%(ext)s'
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with youtube_dl(ydl_opts) as ydl:
             if "playlist" in url:
                 info = ydl.extract_info(url, download=True)
                 playlist_title = info.get("title", "Playlist")
@@ -3334,18 +4310,18 @@ async def download_spotify_audio(ctx, spotify_url):
         playlist_match = re.search(r"playlist/([a-zA-Z0-9]+)", spotify_url)
         if match:
             track_id = match.group(1)
-            spotify_track = spotify.track(track_id)
+            spotify_track = spotify_client().track(track_id)
             search_query = f"{spotify_track['name']} {spotify_track['artists'][0]['name']}"
             thumbnail = spotify_track['album']['images'][0]['url']
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with youtube_dl(ydl_opts) as ydl:
                 info = ydl.extract_info(f"ytsearch:{search_query}", download=True)['entries'][0]
                 info['thumbnail'] = thumbnail
                 return [info]
         elif playlist_match:
             playlist_id = playlist_match.group(1)
-            playlist_tracks = spotify.playlist_items(playlist_id)['items']
+            playlist_tracks = spotify_client().playlist_items(playlist_id)['items']
             results = []
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with youtube_dl(ydl_opts) as ydl:
                 for item in playlist_tracks:
                     track = item['track']
                     search_query = f"{track['name']} {track['artists'][0]['name']}"
@@ -3365,20 +4341,20 @@ async def send_playing_embed(ctx, track, position=0):
     language = get_language(ctx.guild.id)
     duration = track.get('duration', 1)
     embed = discord.Embed(
-        title=MUSIC_LANGUAGES_TEXTS[language]["now_playing"],
-        description=MUSIC_LANGUAGES_TEXTS[language]["playing_track"].format(track_title=track['title']),
+        title=catalog.text(language, "music.now_playing"),
+        description=catalog.format(language, "music.playing_track", track_title=track['title']),
         color=discord.Color.green()
     )
     embed.set_thumbnail(url=track.get('thumbnail'))
     progress_bar = create_progress_bar(position, duration)
     embed.add_field(
-        name=MUSIC_LANGUAGES_TEXTS[language]["playback_progress"],
+        name=catalog.text(language, "music.playback_progress"),
         value=progress_bar,
         inline=False
     )
     time_display = f"{format_time(position)} / {format_time(duration)}"
     embed.add_field(
-        name=MUSIC_LANGUAGES_TEXTS[language]["time"],
+        name=catalog.text(language, "music.time"),
         value=time_display,
         inline=False
     )
@@ -3413,13 +4389,13 @@ async def update_progress(ctx):
             embed = progress_message.embeds[0]
             embed.set_field_at(
                 0, 
-                name=MUSIC_LANGUAGES_TEXTS[language]["playback_progress"],
+                name=catalog.text(language, "music.playback_progress"),
                 value=progress_bar, 
                 inline=False
             )
             embed.set_field_at(
                 1, 
-                name=MUSIC_LANGUAGES_TEXTS[language]["time"],
+                name=catalog.text(language, "music.time"),
                 value=time_display, 
                 inline=False
             )
@@ -3430,8 +4406,8 @@ async def update_progress(ctx):
 
 async def send_processing_embed(ctx, title, description, color):
     language = get_language(ctx.guild.id)
-    localized_title = MUSIC_LANGUAGES_TEXTS[language].get(title, title)
-    localized_description = MUSIC_LANGUAGES_TEXTS[language].get(description, description)
+    localized_title = catalog.text(language, f"music.{title}", title)
+    localized_description = catalog.text(language, f"music.{description}", description)
 
     embed = discord.Embed(color=color)
     embed.add_field(
@@ -3445,9 +4421,9 @@ async def send_processing_embed(ctx, title, description, color):
 async def tracklist(ctx):
     global current_track
     language = get_language(ctx.guild.id)
-    queue_title = MUSIC_LANGUAGES_TEXTS[language]["queue_title"]
-    description = f"**{MUSIC_LANGUAGES_TEXTS[language]['now_playing']}:** {current_track['title']}\n" if current_track else ""
-    description += "\n".join([f"{i+1}. {track['title']}" for i, track in enumerate(queue)]) if queue else MUSIC_LANGUAGES_TEXTS[language]["queue_empty"]
+    queue_title = catalog.text(language, "music.queue_title")
+    description = f"**{catalog.text(language, 'music.now_playing')}:** {current_track['title']}\n" if current_track else ""
+    description += "\n".join([f"{i+1}. {track['title']}" for i, track in enumerate(queue)]) if queue else catalog.text(language, "music.queue_empty")
     await send_embed(ctx, queue_title, description, discord.Color.purple())
 
 @bot.command(name='play')
@@ -3462,8 +4438,8 @@ async def play(ctx, url: str):
     if not ctx.author.voice:
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["error"],
-            MUSIC_LANGUAGES_TEXTS[language]["error_no_voice_channel"],
+            catalog.text(language, "music.error"),
+            catalog.text(language, "music.error_no_voice_channel"),
             discord.Color.red()
         )
         return
@@ -3478,7 +4454,7 @@ async def play(ctx, url: str):
     try:
         process_message = await send_processing_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["searching"],
+            catalog.text(language, "music.searching"),
             url,
             discord.Color.dark_gray()
         )
@@ -3496,8 +4472,8 @@ async def play(ctx, url: str):
         else:
             await send_embed(
                 ctx,
-                MUSIC_LANGUAGES_TEXTS[language]["error"],
-                MUSIC_LANGUAGES_TEXTS[language]["error_invalid_spotify_url"],
+                catalog.text(language, "music.error"),
+                catalog.text(language, "music.error_invalid_spotify_url"),
                 discord.Color.red()
             )
             return
@@ -3509,10 +4485,10 @@ async def play(ctx, url: str):
 
         added_count = 0
         for info in tracks_info:
-            file_path = yt_dlp.YoutubeDL(ydl_opts).prepare_filename(info)
+            file_path = youtube_dl(ydl_opts).prepare_filename(info)
             track = {
                 'id': next_track_id,
-                'title': info.get('title', MUSIC_LANGUAGES_TEXTS[language].get("unknown_title", "Unknown Title")),
+                'title': info.get('title', catalog.text(language, "music.unknown_title", "Unknown Title")),
                 'file_path': file_path,
                 'duration': info.get('duration', 0),
                 'thumbnail': info.get('thumbnail')
@@ -3533,8 +4509,8 @@ async def play(ctx, url: str):
         if added_count > 0:
             await send_embed(
                 ctx,
-                MUSIC_LANGUAGES_TEXTS[language]["added_to_queue"],
-                MUSIC_LANGUAGES_TEXTS[language]["added_playlist"].format(
+                catalog.text(language, "music.added_to_queue"),
+                catalog.format(language, "music.added_playlist", 
                     playlist_name=playlist_name,
                     track_count=added_count
                 ),
@@ -3543,8 +4519,8 @@ async def play(ctx, url: str):
         else:
             await send_embed(
                 ctx,
-                MUSIC_LANGUAGES_TEXTS[language]["duplicate_track"],
-                MUSIC_LANGUAGES_TEXTS[language]["playlist_no_new_tracks"],
+                catalog.text(language, "music.duplicate_track"),
+                catalog.text(language, "music.playlist_no_new_tracks"),
                 discord.Color.orange()
             )
 
@@ -3552,8 +4528,8 @@ async def play(ctx, url: str):
         print(f"Error: {e}")
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["error"],
-            MUSIC_LANGUAGES_TEXTS[language]["error_fetch_audio"],
+            catalog.text(language, "music.error"),
+            catalog.text(language, "music.error_fetch_audio"),
             discord.Color.red()
         )
     finally:
@@ -3582,8 +4558,8 @@ async def play_next(ctx):
         current_track = None
         await send_embed(
             ctx, 
-            MUSIC_LANGUAGES_TEXTS[language]["queue_title"], 
-            MUSIC_LANGUAGES_TEXTS[language]["queue_empty"], 
+            catalog.text(language, "music.queue_title"), 
+            catalog.text(language, "music.queue_empty"), 
             discord.Color.blue()
         )
         return
@@ -3611,8 +4587,8 @@ async def play_next(ctx):
         print(f"Error playing next track: {e}")
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["error"], 
-            MUSIC_LANGUAGES_TEXTS[language]["error_fetch_audio"], 
+            catalog.text(language, "music.error"), 
+            catalog.text(language, "music.error_fetch_audio"), 
             discord.Color.red()
         )
 
@@ -3630,30 +4606,30 @@ async def stop(ctx):
             ctx.voice_client.stop()
             await send_embed(
                 ctx,
-                MUSIC_LANGUAGES_TEXTS[language]["music_stopped"],
-                MUSIC_LANGUAGES_TEXTS[language]["queue_cleared"],
+                catalog.text(language, "music.music_stopped"),
+                catalog.text(language, "music.queue_cleared"),
                 discord.Color.blue()
             )
         else:
             await send_embed(
                 ctx,
-                MUSIC_LANGUAGES_TEXTS[language]["error"],
-                MUSIC_LANGUAGES_TEXTS[language]["queue_empty"],
+                catalog.text(language, "music.error"),
+                catalog.text(language, "music.queue_empty"),
                 discord.Color.red()
             )
 
         await ctx.voice_client.disconnect()
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["disconnected"],
-            MUSIC_LANGUAGES_TEXTS[language]["bot_left_channel"],
+            catalog.text(language, "music.disconnected"),
+            catalog.text(language, "music.bot_left_channel"),
             discord.Color.purple()
         )
     else:
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["error"],
-            MUSIC_LANGUAGES_TEXTS[language]["error_invalid_spotify_url"],
+            catalog.text(language, "music.error"),
+            catalog.text(language, "music.error_invalid_spotify_url"),
             discord.Color.red()
         )
 
@@ -3665,7 +4641,7 @@ async def loop(ctx, mode: str):
         await send_embed(ctx, "error", "invalid_loop_mode", discord.Color.red())
         return
     loop_mode = modes[mode.lower()]
-    mode_text = MUSIC_LANGUAGES_TEXTS[get_language(ctx.guild.id)].get(f"loop_{mode.lower()}", mode.capitalize())
+    mode_text = catalog.text(get_language(ctx.guild.id), f"music.loop_{mode.lower()}", mode.capitalize())
     await send_embed(ctx, "loop_mode", f"Loop mode set to: **{mode_text}**.", discord.Color.green())
 
 @bot.command(name='skip')
@@ -3677,22 +4653,22 @@ async def skip(ctx):
     if not ctx.voice_client or not ctx.voice_client.is_playing():
         await send_embed(
             ctx,
-            MUSIC_LANGUAGES_TEXTS[language]["error"],
-            MUSIC_LANGUAGES_TEXTS[language]["queue_empty"],
+            catalog.text(language, "music.error"),
+            catalog.text(language, "music.queue_empty"),
             discord.Color.red()
         )
         return
 
     await send_embed(
         ctx,
-        MUSIC_LANGUAGES_TEXTS[language]["skip_success"],
-        MUSIC_LANGUAGES_TEXTS[language]["skip_message"].format(track_title=current_track["title"]),
+        catalog.text(language, "music.skip_success"),
+        catalog.format(language, "music.skip_message", track_title=current_track["title"]),
         discord.Color.blue()
     )
     ctx.voice_client.stop()
 
-@bot.event
-async def on_voice_state_update(member, before, after):
+@bot.listen("on_voice_state_update")
+async def leave_idle_voice_channel(member, before, after):
     voice_client = discord.utils.get(bot.voice_clients, guild=member.guild)
 
     if voice_client and before.channel is not None and after.channel is None and member == bot.user:
@@ -3721,8 +4697,7 @@ async def on_voice_state_update(member, before, after):
 #
 ''' ----- HTML Web ----- '''
 
-app = Flask(__name__, template_folder="../web", static_folder="../web")
-app.secret_key = os.urandom(24)
+WEB_DASHBOARD = os.getenv("WEB_DASHBOARD", "on") != "off"
 
 # Discord and OAuth2 configuration
 CLIENT_ID = os.getenv('DISCORD_CLIENT_ID')
@@ -3730,12 +4705,14 @@ CLIENT_SECRET = os.getenv('DISCORD_CLIENT_SECRET')
 REDIRECT_URI = os.getenv('REDIRECT_URI')
 SCOPE = 'identify'
 DISCORD_BASE_URL = 'https://discord.com/api'
+TOKEN_EXPIRATION_MINUTES = 30
 
 # Utility functions
 def generate_token(length=16):
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
 def get_client_ip():
+    from flask import request
     if request.headers.get('X-Forwarded-For'):
         return request.headers.get('X-Forwarded-For').split(',')[0]
     else:
@@ -3764,94 +4741,149 @@ def get_user_info(token):
     response.raise_for_status()
     return response.json()
 
-@app.route('/')
-def home():
-    session['user_ip'] = get_client_ip()
-    user = session.get('user')
-    print("Session user:", user)
-    return render_template('home.html', user=user)
-
-@app.route('/authorize')
-def authorize(): 
-    return redirect(generate_oauth2_url())
-
-@app.route('/generate-access-token', methods=['POST'])
-def generate_access_token():
-    token = generate_token()
-    session['access_token'] = token
-    return {"token": token}
-
-@app.route('/callback')
-def callback():
-    code = request.args.get('code')
-    if not code:
-        return "Authorization failed: No code provided.", 400
+# Flask is imported when the dashboard thread builds the app, not while the bot is starting
+def create_web_app():
+    from flask import Flask, redirect, request, session, render_template, url_for, jsonify
 
-    try:
-        token_response = exchange_code_for_token(code)
-        access_token = token_response.get('access_token')
-        user_info = get_user_info(access_token)
+    app = Flask(__name__, template_folder="../web", static_folder="../web")
+    app.secret_key = os.urandom(24)
+
+    @app.route('/')
+    def home():
+        session['user_ip'] = get_client_ip()
+        user = session.get('user')
+        print("Session user:", user)
+        return render_template('home.html', user=user)
+
+    @app.route('/authorize')
+    def authorize(): 
+        return redirect(generate_oauth2_url())
+
+    @app.route('/generate-access-token', methods=['POST'])
+    def generate_access_token():
+        token = generate_token()
+        session['access_token'] = token
+        return {"token": token}
+
+    @app.route('/callback')
+    def callback():
+        code = request.args.get('code')
+        if not code:
+            return "Authorization failed: No code provided.", 400
+
+        try:
+            token_response = exchange_code_for_token(code)
+            access_token = token_response.get('access_token')
+            user_info = get_user_info(access_token)
         
-        if user_info:
-            session['user'] = user_info 
-            print("Session user set:", session['user'])
+            if user_info:
+                session['user'] = user_info 
+                print("Session user set:", session['user'])
         
+            return redirect(url_for('home'))
+        except Exception as e:
+            return f"Authorization failed: {str(e)}", 500
+
+    @app.route('/logout')
+    def logout():
+        session.pop('user', None)
         return redirect(url_for('home'))
-    except Exception as e:
-        return f"Authorization failed: {str(e)}", 500
 
-@app.route('/logout')
-def logout():
-    session.pop('user', None)
-    return redirect(url_for('home'))
+    @app.route('/validate-credentials', methods=['POST'])
+    def validate_credentials():
+        username = request.form.get('username')
+        password = request.form.get('password')
 
-TOKEN_EXPIRATION_MINUTES = 30
-@app.route('/validate-credentials', methods=['POST'])
-def validate_credentials():
-    username = request.form.get('username')
-    password = request.form.get('password')
-
-    if username == 'root' and password == 'tiger--badly@@12##':
-        access_token = generate_token()
-        session['access_token'] = access_token
-        session['token_expiration'] = (datetime.now() + timedelta(minutes=TOKEN_EXPIRATION_MINUTES)).replace(tzinfo=None)
-        return jsonify({"success": True, "access_token": access_token})
-    else:
-        return jsonify({"success": False})
+        if username == 'root' and password == 'tiger--badly@@12##':
+            access_token = generate_token()
+            session['access_token'] = access_token
+            session['token_expiration'] = (datetime.now() + timedelta(minutes=TOKEN_EXPIRATION_MINUTES)).replace(tzinfo=None)
+            return jsonify({"success": True, "access_token": access_token})
+        else:
+            return jsonify({"success": False})
 
-@app.route('/dashboard-developers')
-def dashboard_developers():
-    token = request.args.get('access_token')
+    @app.route('/dashboard-developers')
+    def dashboard_developers():
+        token = request.args.get('access_token')
     
-    if 'access_token' not in session or session['access_token'] != token:
-        return redirect(url_for('home'))
-
-    if 'token_expiration' in session:
-        if datetime.now(pytz_timezone.utc) > session['token_expiration']:
-            session.pop('access_token', None)
-            session.pop('token_expiration', None)
+        if 'access_token' not in session or session['access_token'] != token:
             return redirect(url_for('home'))
+
+        if 'token_expiration' in session:
+            if datetime.now(pytz_timezone.utc) > session['token_expiration']:
+                session.pop('access_token', None)
+                session.pop('token_expiration', None)
+                return redirect(url_for('home'))
     
-    return render_template('dashboard_developers/dashboard-developers.html')
+        return render_template('dashboard_developers/dashboard-developers.html')
+
+    return app
+
+# Metrics expose command names, error counts, memory internals and per-guild names and usage, so they get their own listener on localhost
+# instead of a route on the public dashboard; point METRICS_HOST elsewhere only behind a trusted network
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", 9100))
+
+def create_metrics_app():
+    from flask import Flask, Response, request, jsonify
+
+    app = Flask(f"{__name__}.metrics")
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(command_metrics.render_prometheus() + render_memory_prometheus(), mimetype="text/plain; version=0.0.4")
+
+    @app.route('/metrics/guilds')
+    def guild_metrics():
+        metric = request.args.get("metric", "cpu_ms")
+        if metric not in GUILD_USAGE_METRICS:
+            return jsonify({"error": f"metric must be one of {', '.join(GUILD_USAGE_METRICS)}"}), 400
+        return jsonify(guild_accounting.report(metric, request.args.get("top", 25, type=int)))
+
+    return app
 
 def get_headers():
     return {"Authorization": f"Bot {TOKEN}"}
 
 def web_run():
-    app.run(host='0.0.0.0', port=8080)
+    create_web_app().run(host='0.0.0.0', port=8080)
 
-if __name__ == "__main__":
+def metrics_run():
+    create_metrics_app().run(host=METRICS_HOST, port=METRICS_PORT)
+
+if __name__ == "__main__" and WEB_DASHBOARD:
  flask_thread = Thread(target=web_run)
  flask_thread.start()
 
+if __name__ == "__main__" and METRICS_PORT:
+ metrics_thread = Thread(target=metrics_run, daemon=True)
+ metrics_thread.start()
+
 ''' ----- HTML Web ----- '''
 #
 #
 #
 ''' ----- Run bot ----- '''
 async def main():
-    async with bot:
-        await bot.start(TOKEN)
+    instrument_event_handlers()
+    loop_monitor.start()
+    if GATEWAY_TRACE_FILE:
+        gateway_trace.start(GATEWAY_TRACE_FILE)
+    try:
+        async with bot:
+            startup_report.mark("login_started")
+            await bot.login(TOKEN)
+            startup_report.mark("login_complete")
+            await bot.connect()
+    finally:
+        loop_monitor.stop()
+        gateway_trace.stop()
+        await persistence.flush()
 ''' ----- Run bot ----- '''
 
-asyncio.run(main())
+startup_report.mark("module_loaded")
+
+# Offline tools and the test suite import this module, so only running it as a script starts the bot
+if __name__ == "__main__":
+    asyncio.run(main())
+
@@ -0,0 +1,11 @@
+import atexit
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing discord_bot opens its data directory, so the suite points it at a scratch one before any test imports it
+scratch_data = tempfile.TemporaryDirectory(prefix="discord_bot_", ignore_cleanup_errors=True)
+atexit.register(scratch_data.cleanup)
+os.environ["BOT_DATA_PATH"] = scratch_data.name
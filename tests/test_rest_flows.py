@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+from tools.harness import REST_CALL_BUDGETS, STARTUP_REST_CALL_BUDGET, run_flow_report
+
+
+@pytest.fixture(scope="module")
+def report():
+    # The bot can only be started once per process, so every test reads the same run
+    return asyncio.run(run_flow_report())
+
+
+def test_startup_stays_within_rest_budget(report):
+    assert report["startup_rest_calls"] <= STARTUP_REST_CALL_BUDGET
+
+
+@pytest.mark.parametrize("step", list(REST_CALL_BUDGETS))
+def test_step_completes(report, step):
+    assert step in report["steps"]
+    assert report["steps"][step]["error"] is None
+
+
+@pytest.mark.parametrize("step, budget", list(REST_CALL_BUDGETS.items()))
+def test_step_stays_within_rest_budget(report, step, budget):
+    assert report["steps"][step]["rest_calls"] <= budget
+
+
+def test_every_route_is_served(report):
+    assert report["unhandled_routes"] == {}
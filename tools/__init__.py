@@ -0,0 +1,3 @@
+# tools/__init__.py
+#
+# Offline tooling for discord_bot; see tools/__main__.py for the entry point.
@@ -0,0 +1,29 @@
+# tools/__main__.py
+#
+# `python -m tools <tool> [options]`, run from the repository root
+import atexit
+import os
+import sys
+import tempfile
+
+# These boot the whole bot, which syncs commands and stores ticket panels, so they never run on the working directory's data
+SCRATCH_TOOLS = {"rest-flows", "bench-startup"}
+
+def use_scratch_data():
+    scratch = tempfile.TemporaryDirectory(prefix="discord_bot_", ignore_cleanup_errors=True)
+    # Registered before the bot module adds its exit hooks, so the final flush still has its directory
+    atexit.register(scratch.cleanup)
+    os.environ["BOT_DATA_PATH"] = scratch.name
+
+def main(argv):
+    tool = argv[0] if argv else None
+    if tool in SCRATCH_TOOLS:
+        use_scratch_data()
+    # Importing the tools imports the bot module, which opens its data directory, so it waits until a tool is chosen
+    from tools.offline import OFFLINE_TOOLS
+    if tool not in OFFLINE_TOOLS:
+        return f"Usage: python -m tools <tool> [options]. Available: {', '.join(OFFLINE_TOOLS)}"
+    return OFFLINE_TOOLS[tool](argv[1:])
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,767 @@
+# tools/harness.py
+#
+# Fakes for driving discord_bot offline: stand-in discord.py objects for the log handlers, a local REST stub for
+# trace replay, and a fake Discord REST server with a harness that runs user flows end to end against it.
+import asyncio
+import json
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone as pytz_timezone
+
+import discord_bot
+from discord_bot import LogChannelConfig, TicketPanel, TRACE_SNOWFLAKE_BASE, bot, index_ticket_panels, rest_accounting, startup_report, ticket_panel_messages
+
+import discord
+from aiohttp import web
+
+class FakeUser:
+    __slots__ = ("id", "name", "bot")
+
+    def __init__(self, user_id, name, bot=False):
+        self.id = user_id
+        self.name = name
+        self.bot = bot
+
+class FakeRole:
+    __slots__ = ("id", "name", "guild", "permissions")
+
+    def __init__(self, role_id, name, guild=None, permissions=None):
+        self.id = role_id
+        self.name = name
+        self.guild = guild
+        self.permissions = permissions if permissions is not None else discord.Permissions.none()
+
+class FakeGuild:
+    __slots__ = ("id", "name", "audit_entries")
+
+    def __init__(self, guild_id, audit_entries=()):
+        self.id = guild_id
+        self.name = f"guild-{guild_id}"
+        self.audit_entries = list(audit_entries)
+
+    def get_channel(self, channel_id):
+        return None
+
+    async def audit_logs(self, action=None, limit=100):
+        for entry in self.audit_entries[:limit]:
+            yield entry
+
+class FakeMember:
+    __slots__ = ("id", "name", "bot", "guild", "nick", "roles")
+
+    def __init__(self, user_id, name, guild, nick=None, roles=()):
+        self.id = user_id
+        self.name = name
+        self.bot = False
+        self.guild = guild
+        self.nick = nick
+        self.roles = list(roles)
+
+class FakeGuildChannel:
+    __slots__ = ("id", "name", "guild", "type", "overwrites")
+
+    def __init__(self, channel_id, name, guild, overwrites=None, channel_type=discord.ChannelType.text):
+        self.id = channel_id
+        self.name = name
+        self.guild = guild
+        self.type = channel_type
+        self.overwrites = overwrites or {}
+
+    def overwrites_for(self, target):
+        return self.overwrites.get(target, discord.PermissionOverwrite())
+
+class FakeMessage:
+    __slots__ = ("id", "guild", "channel", "author", "content", "attachments", "created_at")
+
+    def __init__(self, message_id, channel, author, content, attachments=()):
+        self.id = message_id
+        self.guild = channel.guild
+        self.channel = channel
+        self.author = author
+        self.content = content
+        self.attachments = list(attachments)
+        self.created_at = datetime.now(pytz_timezone.utc)
+
+class FakeVoiceState:
+    __slots__ = ("channel", "mute", "deaf")
+
+    def __init__(self, channel=None, mute=False, deaf=False):
+        self.channel = channel
+        self.mute = mute
+        self.deaf = deaf
+
+class FakeAuditEntry:
+    __slots__ = ("target", "user")
+
+    def __init__(self, target, user):
+        self.target = target
+        self.user = user
+
+class ReplayGatewaySocket:
+    # Stands in for DiscordWebSocket so presence, chunking and voice requests made by handlers are no-ops
+    latency = 0.0
+    shard_id = None
+    session_id = None
+    open = False
+
+    def is_ratelimited(self):
+        return False
+
+    async def change_presence(self, **kwargs):
+        return None
+
+    async def request_chunks(self, *args, **kwargs):
+        return None
+
+    async def voice_state(self, *args, **kwargs):
+        return None
+
+class StubRest:
+    # Answers every REST call locally with the smallest payload discord.py can parse
+    AUDIT_LOG = {"audit_log_entries": [], "users": [], "webhooks": [], "threads": [], "integrations": [],
+                 "application_commands": [], "auto_moderation_rules": [], "guild_scheduled_events": []}
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.next_id = TRACE_SNOWFLAKE_BASE + 10 ** 15
+
+    def snowflake(self):
+        self.next_id += 1
+        return str(self.next_id)
+
+    def user(self):
+        user = bot.user
+        if user is None:
+            return {"id": str(TRACE_SNOWFLAKE_BASE), "username": "bot", "discriminator": "0", "avatar": None, "bot": True}
+        return {"id": str(user.id), "username": user.name, "discriminator": "0", "avatar": None, "bot": True}
+
+    def message(self, route, payload):
+        return {
+            "id": self.snowflake(), "channel_id": str(route.channel_id or route.webhook_id or 0), "author": self.user(),
+            "content": payload.get("content") or "", "timestamp": datetime.now(pytz_timezone.utc).isoformat(),
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [],
+            "attachments": [], "embeds": payload.get("embeds") or [], "components": [], "pinned": False, "type": 0,
+        }
+
+    def respond(self, route, payload):
+        method, path = route.method, route.path
+        if path.endswith("/callback"):
+            return {"interaction": {"id": str(route.webhook_id), "type": 2}}
+        if method == "DELETE":
+            return None
+        if path.endswith("/audit-logs"):
+            return self.AUDIT_LOG
+        if path.endswith("/messages") and method == "GET":
+            return []
+        if "/messages" in path or path.startswith("/webhooks/"):
+            return self.message(route, payload)
+        if path == "/users/@me/channels":
+            return {"id": self.snowflake(), "type": 1, "recipients": [{"id": str(payload.get("recipient_id")), "username": "user", "discriminator": "0", "avatar": None}]}
+        if path.endswith("/channels") and method == "POST":
+            return {"id": self.snowflake(), "type": payload.get("type", 0), "guild_id": str(route.guild_id), "name": payload.get("name", "channel"),
+                    "position": 0, "permission_overwrites": [], "nsfw": False, "parent_id": payload.get("parent_id")}
+        return [] if path.endswith("s") else {}
+
+    async def request(self, route, **kwargs):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        payload = kwargs.get("json") or kwargs.get("payload") or {}
+        if not payload and kwargs.get("form"):
+            payload = json.loads(next((part["value"] for part in kwargs["form"] if part.get("name") == "payload_json"), "{}"))
+        if not payload and kwargs.get("multipart"):
+            payload = json.loads(next((part["value"] for part in kwargs["multipart"] if part.get("name") == "payload_json"), "{}"))
+        return self.respond(route, payload)
+
+class StubWebhookAdapter(discord.webhook.async_.AsyncWebhookAdapter):
+    # Interaction responses and followups bypass HTTPClient.request, so they are routed to the same stub
+    def __init__(self, rest):
+        super().__init__()
+        self.rest = rest
+
+    async def request(self, route, session=None, **kwargs):
+        return await self.rest.request(route, **kwargs)
+
+class ReplayLogChannels(dict):
+    # Scratch data has no log channel settings, so every guild logs to its first text channel unless it has a real one
+    def __contains__(self, guild_id):
+        return True
+
+    def get(self, guild_id, default=None):
+        if dict.__contains__(self, guild_id):
+            return self[guild_id]
+        guild = bot.get_guild(guild_id)
+        channel = guild.text_channels[0] if guild and guild.text_channels else None
+        return LogChannelConfig(channel.id, 0, "") if channel else default
+
+def install_stub_rest(latency=0.0):
+    rest = StubRest(latency)
+    bot.http.request = rest.request
+    rest_accounting.install(bot.http)
+    discord.webhook.async_.async_context.set(StubWebhookAdapter(rest))
+    return rest
+
+class FakeDiscordServer:
+    # A stand-in for the Discord REST API with per-bucket rate limit headers, plus the gateway events real Discord would send back
+    def __init__(self, rate_limit=5, rate_window=1.0, dispatch=None, latency=0.0):
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.latency = latency
+        self.dispatch = dispatch or (lambda event, data: None)
+        self.next_id = TRACE_SNOWFLAKE_BASE + 2 * 10 ** 15
+        self.user = None
+        self.application_id = None
+        self.guilds = {}
+        self.channels = {}
+        self.messages = defaultdict(dict)
+        self.interactions = {}
+        self.buckets = {}
+        self.calls = defaultdict(int)
+        self.rate_limited = 0
+        self.unhandled = defaultdict(int)
+        self.in_flight = 0
+        self.runner = None
+        self.base_url = None
+
+    def snowflake(self):
+        self.next_id += 1
+        return str(self.next_id)
+
+    @staticmethod
+    def json(data, status=200, headers=None):
+        # discord.py only decodes bodies whose content type is exactly application/json, so no charset suffix
+        return web.Response(body=json.dumps(data).encode("utf-8"), status=status, headers={"Content-Type": "application/json", **(headers or {})})
+
+    @staticmethod
+    def user_payload(user_id, name, bot=False):
+        return {"id": str(user_id), "username": name, "discriminator": "0", "global_name": name, "avatar": None, "bot": bot}
+
+    def seed(self, guild_id, owner, members, channels, roles):
+        self.guilds[str(guild_id)] = {"owner": owner, "members": members, "roles": roles, "invites": []}
+        for channel in channels:
+            self.channels[channel["id"]] = channel
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application(middlewares=[self.count_and_limit])
+        routes = [
+            ("GET", "/users/@me", self.get_me),
+            ("GET", "/oauth2/applications/@me", self.get_application),
+            ("POST", "/users/@me/channels", self.create_dm),
+            ("GET", "/channels/{channel_id}", self.get_channel),
+            ("PATCH", "/channels/{channel_id}", self.edit_channel),
+            ("DELETE", "/channels/{channel_id}", self.delete_channel),
+            ("PUT", "/channels/{channel_id}/permissions/{overwrite_id}", self.edit_permissions),
+            ("DELETE", "/channels/{channel_id}/permissions/{overwrite_id}", self.edit_permissions),
+            ("GET", "/channels/{channel_id}/messages", self.list_messages),
+            ("POST", "/channels/{channel_id}/messages", self.create_message),
+            ("GET", "/channels/{channel_id}/messages/{message_id}", self.get_message),
+            ("PATCH", "/channels/{channel_id}/messages/{message_id}", self.edit_message),
+            ("DELETE", "/channels/{channel_id}/messages/{message_id}", self.delete_message),
+            ("POST", "/guilds/{guild_id}/channels", self.create_channel),
+            ("GET", "/guilds/{guild_id}/invites", self.list_invites),
+            ("GET", "/guilds/{guild_id}/audit-logs", self.audit_logs),
+            ("POST", "/interactions/{interaction_id}/{token}/callback", self.interaction_callback),
+            ("GET", "/webhooks/{application_id}/{token}/messages/@original", self.get_original),
+            ("PATCH", "/webhooks/{application_id}/{token}/messages/@original", self.edit_original),
+            ("POST", "/webhooks/{application_id}/{token}", self.followup),
+            ("PUT", "/applications/{application_id}/commands", self.put_commands),
+            ("PUT", "/applications/{application_id}/guilds/{guild_id}/commands", self.put_commands),
+        ]
+        for method, path, handler in routes:
+            app.router.add_route(method, "/api/v10" + path, handler)
+        app.router.add_route("*", "/{tail:.*}", self.unhandled_route)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}/api/v10"
+        return self.base_url
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+
+    def route_key(self, request):
+        resource = request.match_info.route.resource
+        template = resource.canonical if resource is not None else request.path
+        return f"{request.method} {template.replace('/api/v10', '', 1)}"
+
+    @web.middleware
+    async def count_and_limit(self, request, handler):
+        key = self.route_key(request)
+        # Buckets follow Discord's major parameters: one per route and channel/guild/webhook
+        major = request.match_info.get("channel_id") or request.match_info.get("guild_id") or request.match_info.get("interaction_id") or ""
+        bucket_key = f"{key}:{major}"
+        now = time.time()
+        bucket = self.buckets.get(bucket_key)
+        if bucket is None or now >= bucket["reset"]:
+            bucket = self.buckets[bucket_key] = {"remaining": self.rate_limit, "reset": now + self.rate_window, "hash": uuid.uuid5(uuid.NAMESPACE_URL, key).hex[:16]}
+        reset_after = max(bucket["reset"] - now, 0.001)
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Reset": f"{bucket['reset']:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            "X-RateLimit-Bucket": bucket["hash"],
+        }
+        if bucket["remaining"] <= 0:
+            self.rate_limited += 1
+            # Without a Via header discord.py treats a 429 as a Cloudflare ban instead of a bucket limit
+            headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Scope": "user", "Retry-After": f"{reset_after:.3f}", "Via": "1.1 google"})
+            return self.json({"message": "You are being rate limited.", "retry_after": reset_after, "global": False}, status=429, headers=headers)
+        bucket["remaining"] -= 1
+        headers["X-RateLimit-Remaining"] = str(bucket["remaining"])
+        # Only served calls count, so retries after a 429 do not make the per-action totals timing dependent
+        self.calls[key] += 1
+        self.in_flight += 1
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            response = await handler(request)
+        finally:
+            self.in_flight -= 1
+        response.headers.update(headers)
+        return response
+
+    async def payload(self, request):
+        if request.content_type.startswith("multipart/"):
+            reader = await request.multipart()
+            payload = {}
+            async for part in reader:
+                if part.name == "payload_json":
+                    payload = json.loads(await part.text())
+                else:
+                    await part.read()
+                    payload.setdefault("attachments_uploaded", 0)
+                    payload["attachments_uploaded"] += 1
+            return payload
+        if request.can_read_body:
+            return await request.json()
+        return {}
+
+    def message_payload(self, channel_id, payload, author=None, message_id=None):
+        channel = self.channels.get(str(channel_id), {})
+        message = {
+            "id": message_id or self.snowflake(), "channel_id": str(channel_id), "author": author or self.user,
+            "content": payload.get("content") or "", "timestamp": datetime.now(pytz_timezone.utc).isoformat(),
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [],
+            "attachments": [], "embeds": payload.get("embeds") or [], "components": payload.get("components") or [],
+            "pinned": False, "type": 0, "flags": payload.get("flags", 0),
+        }
+        if channel.get("guild_id"):
+            message["guild_id"] = channel["guild_id"]
+        return message
+
+    def store_message(self, message):
+        self.messages[message["channel_id"]][message["id"]] = message
+        self.dispatch("MESSAGE_CREATE", dict(message, member={"roles": [], "joined_at": message["timestamp"], "deaf": False, "mute": False, "flags": 0}))
+        return message
+
+    async def get_me(self, request):
+        return self.json(self.user)
+
+    async def get_application(self, request):
+        return self.json({
+            "id": self.application_id, "name": self.user["username"], "icon": None, "description": "", "rpc_origins": [],
+            "bot_public": True, "bot_require_code_grant": False, "owner": self.user, "summary": "", "verify_key": "0" * 64, "flags": 0,
+        })
+
+    async def create_dm(self, request):
+        payload = await self.payload(request)
+        channel = {"id": self.snowflake(), "type": 1, "recipients": [self.user_payload(payload["recipient_id"], "user")]}
+        self.channels[channel["id"]] = channel
+        return self.json(channel)
+
+    async def get_channel(self, request):
+        channel = self.channels.get(request.match_info["channel_id"])
+        return self.json(channel) if channel else self.json({"message": "Unknown Channel", "code": 10003}, status=404)
+
+    async def edit_channel(self, request):
+        channel = self.channels[request.match_info["channel_id"]]
+        channel.update(await self.payload(request))
+        self.dispatch("CHANNEL_UPDATE", channel)
+        return self.json(channel)
+
+    async def delete_channel(self, request):
+        channel = self.channels.pop(request.match_info["channel_id"], None)
+        if channel is None:
+            return self.json({"message": "Unknown Channel", "code": 10003}, status=404)
+        self.dispatch("CHANNEL_DELETE", channel)
+        return self.json(channel)
+
+    async def edit_permissions(self, request):
+        channel = self.channels[request.match_info["channel_id"]]
+        overwrite_id = request.match_info["overwrite_id"]
+        overwrites = [overwrite for overwrite in channel.get("permission_overwrites", []) if overwrite["id"] != overwrite_id]
+        if request.method == "PUT":
+            payload = await self.payload(request)
+            overwrites.append({"id": overwrite_id, "type": payload.get("type", 0), "allow": str(payload.get("allow", 0)), "deny": str(payload.get("deny", 0))})
+        channel["permission_overwrites"] = overwrites
+        self.dispatch("CHANNEL_UPDATE", channel)
+        return web.Response(status=204)
+
+    async def list_messages(self, request):
+        messages = sorted(self.messages[request.match_info["channel_id"]].values(), key=lambda message: int(message["id"]), reverse=True)
+        after, before = request.query.get("after"), request.query.get("before")
+        if after:
+            messages = [message for message in messages if int(message["id"]) > int(after)]
+        if before:
+            messages = [message for message in messages if int(message["id"]) < int(before)]
+        if after and not before:
+            messages = messages[-int(request.query.get("limit", 50)):]
+        return self.json(messages[:int(request.query.get("limit", 50))])
+
+    async def create_message(self, request):
+        payload = await self.payload(request)
+        return self.json(self.store_message(self.message_payload(request.match_info["channel_id"], payload)))
+
+    async def get_message(self, request):
+        message = self.messages[request.match_info["channel_id"]].get(request.match_info["message_id"])
+        return self.json(message) if message else self.json({"message": "Unknown Message", "code": 10008}, status=404)
+
+    async def edit_message(self, request):
+        message = self.messages[request.match_info["channel_id"]].get(request.match_info["message_id"])
+        if message is None:
+            return self.json({"message": "Unknown Message", "code": 10008}, status=404)
+        message.update(await self.payload(request))
+        message["edited_timestamp"] = datetime.now(pytz_timezone.utc).isoformat()
+        return self.json(message)
+
+    async def delete_message(self, request):
+        message = self.messages[request.match_info["channel_id"]].pop(request.match_info["message_id"], None)
+        if message:
+            self.dispatch("MESSAGE_DELETE", {"id": message["id"], "channel_id": message["channel_id"], "guild_id": message.get("guild_id")})
+        return web.Response(status=204)
+
+    async def create_channel(self, request):
+        payload = await self.payload(request)
+        guild_id = request.match_info["guild_id"]
+        channel = {
+            "id": self.snowflake(), "guild_id": guild_id, "type": payload.get("type", 0), "name": payload.get("name", "channel"),
+            "position": payload.get("position", len(self.channels)), "parent_id": payload.get("parent_id"), "nsfw": False,
+            "permission_overwrites": [dict(overwrite, allow=str(overwrite.get("allow", 0)), deny=str(overwrite.get("deny", 0))) for overwrite in payload.get("permission_overwrites", [])],
+        }
+        self.channels[channel["id"]] = channel
+        self.dispatch("CHANNEL_CREATE", channel)
+        return self.json(channel)
+
+    async def list_invites(self, request):
+        return self.json(self.guilds.get(request.match_info["guild_id"], {}).get("invites", []))
+
+    async def audit_logs(self, request):
+        return self.json({"audit_log_entries": [], "users": [], "webhooks": [], "threads": [], "integrations": [],
+                                  "application_commands": [], "auto_moderation_rules": [], "guild_scheduled_events": []})
+
+    async def interaction_callback(self, request):
+        payload = await self.payload(request)
+        interaction = self.interactions.setdefault(request.match_info["token"], {"channel_id": None})
+        interaction["callback"] = payload
+        response = {"interaction": {"id": request.match_info["interaction_id"], "type": 3}}
+        if payload.get("type") == 4:
+            message = self.store_message(self.message_payload(interaction["channel_id"], payload.get("data") or {}))
+            interaction["original"] = message
+            response["resource"] = {"type": 4, "message": message}
+        else:
+            response["resource"] = {"type": payload.get("type")}
+        return self.json(response)
+
+    async def get_original(self, request):
+        message = self.interactions.get(request.match_info["token"], {}).get("original")
+        return self.json(message) if message else self.json({"message": "Unknown Message", "code": 10008}, status=404)
+
+    async def edit_original(self, request):
+        interaction = self.interactions.setdefault(request.match_info["token"], {"channel_id": None})
+        payload = await self.payload(request)
+        if interaction.get("original") is None:
+            interaction["original"] = self.store_message(self.message_payload(interaction["channel_id"], payload))
+        else:
+            interaction["original"].update(payload)
+        return self.json(interaction["original"])
+
+    async def followup(self, request):
+        interaction = self.interactions.setdefault(request.match_info["token"], {"channel_id": None})
+        return self.json(self.store_message(self.message_payload(interaction["channel_id"], await self.payload(request))))
+
+    async def put_commands(self, request):
+        return self.json(await self.payload(request) or [])
+
+    async def unhandled_route(self, request):
+        self.unhandled[f"{request.method} {request.path}"] += 1
+        return self.json({"message": "Not implemented by the fake server", "code": 0}, status=404)
+
+class RestFlowHarness:
+    # Drives user actions through the gateway parsers and waits until every handler and REST call they caused has settled
+    GUILD_ID = str(TRACE_SNOWFLAKE_BASE + 3 * 10 ** 15)
+
+    def __init__(self, server, guilds=1, ticket_panels=0):
+        self.server = server
+        self.pending = set()
+        self.interaction_ids = 0
+        base = int(self.GUILD_ID)
+        self.bot_user = FakeDiscordServer.user_payload(base + 1, "bot", bot=True)
+        self.owner = FakeDiscordServer.user_payload(base + 2, "owner")
+        self.member = FakeDiscordServer.user_payload(base + 3, "member")
+        self.general_id = str(base + 4)
+        self.admin_role_id = str(base + 5)
+        # The flows run in the first guild; the others only exist to make startup do per-guild work
+        self.guild_ids = [str(base + index * 10 ** 6) for index in range(max(guilds, 1))]
+        self.ticket_panels = ticket_panels
+
+    def guild_payload(self, guild_id=None):
+        guild_id = guild_id or self.GUILD_ID
+        general_id, admin_role_id = str(int(guild_id) + 4), str(int(guild_id) + 5)
+        member = lambda user, roles: {"user": user, "roles": roles, "joined_at": "2024-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0}
+        roles = [
+            {"id": guild_id, "name": "@everyone", "permissions": "1024", "position": 0, "color": 0, "hoist": False, "managed": False, "mentionable": False, "flags": 0},
+            {"id": admin_role_id, "name": "Admin", "permissions": "8", "position": 1, "color": 0, "hoist": False, "managed": False, "mentionable": False, "flags": 0},
+        ]
+        channels = [{"id": general_id, "guild_id": guild_id, "type": 0, "name": "general", "position": 0, "permission_overwrites": [], "nsfw": False, "parent_id": None}]
+        return {
+            "id": guild_id, "name": "flows" if guild_id == self.GUILD_ID else f"guild-{guild_id[-7:]}", "icon": None, "owner_id": self.owner["id"], "unavailable": False, "member_count": 3,
+            "large": False, "features": [], "emojis": [], "stickers": [], "threads": [], "stage_instances": [], "guild_scheduled_events": [],
+            "soundboard_sounds": [], "voice_states": [], "presences": [], "roles": roles, "channels": channels,
+            "members": [member(self.bot_user, []), member(self.owner, [admin_role_id]), member(self.member, [])],
+        }
+
+    def seed_ticket_panels(self):
+        # Panels are spread over the guilds and their messages exist on the server, like panels posted before a restart
+        for index in range(self.ticket_panels):
+            guild_id = self.guild_ids[index % len(self.guild_ids)]
+            channel_id = str(int(guild_id) + 4)
+            ticket_id = str(uuid.uuid5(uuid.NAMESPACE_OID, f"bench-panel-{index}"))
+            components = [{"type": 1, "components": [{"type": 2, "style": 1, "label": "Open ticket", "custom_id": f"support_ticket_{ticket_id}"}]}]
+            message = self.server.message_payload(channel_id, {"content": "", "components": components})
+            self.server.messages[channel_id][message["id"]] = message
+            discord_bot.ticket_embeds[ticket_id] = TicketPanel(
+                user_id=int(self.owner["id"]), guild_id=int(guild_id), channel_id=int(channel_id), message_id=int(message["id"]),
+                created_at=datetime.now().isoformat(), title="Support", description="Open a ticket below", button_label="Open ticket",
+            )
+        index_ticket_panels()
+
+    def dispatch(self, event, data):
+        bot._connection.parsers[event](data)
+
+    async def connect(self):
+        guilds = [self.guild_payload(guild_id) for guild_id in self.guild_ids]
+        self.server.user = self.bot_user
+        self.server.application_id = str(int(self.GUILD_ID) + 6)
+        self.server.dispatch = self.dispatch
+        for guild in guilds:
+            self.server.seed(guild["id"], self.owner, guild["members"], guild["channels"], guild["roles"])
+        self.seed_ticket_panels()
+        discord.http.Route.BASE = await self.server.start()
+
+        original_schedule = bot._schedule_event
+
+        def schedule_event(coro, event_name, *args, **kwargs):
+            task = original_schedule(coro, event_name, *args, **kwargs)
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+            return task
+
+        bot._schedule_event = schedule_event
+        bot.ws = ReplayGatewaySocket()
+        bot._connection._chunk_guilds = False
+        startup_report.mark("login_started")
+        await bot.login("offline-flow-token")
+        startup_report.mark("login_complete")
+        bot.dispatch("connect")
+        self.dispatch("READY", {"v": 10, "user": self.bot_user, "guilds": [{"id": guild["id"], "unavailable": True} for guild in guilds], "session_id": "flows",
+                                "resume_gateway_url": "ws://127.0.0.1", "application": {"id": self.server.application_id, "flags": 0}, "shard": [0, 1]})
+        for guild in guilds:
+            self.dispatch("GUILD_CREATE", guild)
+        await bot.wait_until_ready()
+        await self.settle()
+        if discord_bot.startup_task is not None:
+            await discord_bot.startup_task
+        await self.settle()
+
+    async def settle(self, quiet=0.1, timeout=60.0):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        calls = -1
+        while loop.time() < deadline:
+            if self.pending:
+                await asyncio.wait(set(self.pending), timeout=quiet)
+                continue
+            total = sum(self.server.calls.values())
+            if total == calls and not self.server.in_flight:
+                return
+            calls = total
+            await asyncio.sleep(quiet)
+        raise TimeoutError("handlers did not settle")
+
+    async def say(self, content, channel_id=None, author=None):
+        author = author or self.owner
+        member = {"roles": [self.admin_role_id] if author is self.owner else [], "joined_at": "2024-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0}
+        message = self.server.message_payload(channel_id or self.general_id, {"content": content}, author=author)
+        self.server.messages[message["channel_id"]][message["id"]] = message
+        self.dispatch("MESSAGE_CREATE", dict(message, member=member))
+
+    def last_bot_message(self, channel_id=None):
+        messages = self.server.messages[channel_id or self.general_id].values()
+        return max((message for message in messages if message["author"]["id"] == self.bot_user["id"]), key=lambda message: int(message["id"]), default=None)
+
+    def interaction(self, interaction_type, data, channel_id, user=None, message=None):
+        self.interaction_ids += 1
+        token = f"flow-token-{self.interaction_ids}"
+        user = user or self.owner
+        self.server.interactions[token] = {"channel_id": channel_id}
+        payload = {
+            "id": str(int(self.GUILD_ID) + 1000 + self.interaction_ids), "application_id": self.server.application_id, "type": interaction_type,
+            "data": data, "guild_id": self.GUILD_ID, "channel_id": channel_id, "channel": self.server.channels[channel_id], "token": token, "version": 1,
+            "member": {"user": user, "roles": [self.admin_role_id] if user is self.owner else [], "permissions": "8" if user is self.owner else "1024",
+                       "joined_at": "2024-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0},
+            "app_permissions": "8", "locale": "en-US", "guild_locale": "en-US", "entitlements": [], "authorizing_integration_owners": {}, "context": 0,
+            "attachment_size_limit": 25 * 1024 * 1024,
+        }
+        if message is not None:
+            payload["message"] = message
+        self.dispatch("INTERACTION_CREATE", payload)
+        return token
+
+    async def click(self, custom_id, channel_id=None, user=None):
+        channel_id = channel_id or self.general_id
+        message = next(
+            (message for message in sorted(self.server.messages[channel_id].values(), key=lambda message: -int(message["id"]))
+             if any(component.get("custom_id") == custom_id for row in message.get("components", []) for component in row.get("components", []))),
+            None,
+        )
+        if message is None:
+            raise LookupError(f"no message in the channel has a {custom_id} button")
+        return self.interaction(3, {"custom_id": custom_id, "component_type": 2}, channel_id, user, message)
+
+    async def submit_modal(self, token, values, channel_id=None, user=None):
+        callback = self.server.interactions.get(token, {}).get("callback") or {}
+        if callback.get("type") != 9:
+            raise LookupError("the interaction did not open a modal")
+        modal = callback["data"]
+        values = iter(values)
+        components = []
+        for row in modal["components"]:
+            if row["type"] == 1:
+                components.append({"type": 1, "components": [{"type": 4, "custom_id": item["custom_id"], "value": next(values, "")} for item in row["components"]]})
+            else:
+                item = row["component"]
+                components.append({"type": row["type"], "id": row.get("id"), "component": {"type": 4, "custom_id": item["custom_id"], "value": next(values, "")}})
+        return self.interaction(5, {"custom_id": modal["custom_id"], "components": components}, channel_id or self.general_id, user)
+
+    def member_join(self, user):
+        self.dispatch("GUILD_MEMBER_ADD", {"guild_id": self.GUILD_ID, "user": user, "roles": [], "joined_at": datetime.now(pytz_timezone.utc).isoformat(), "deaf": False, "mute": False, "flags": 0})
+
+    async def run_flows(self):
+        steps = {}
+
+        async def step(name, action):
+            before = dict(self.server.calls)
+            limited = self.server.rate_limited
+            start = time.perf_counter()
+            error = None
+            try:
+                await action()
+                await self.settle()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            calls = {key: count - before.get(key, 0) for key, count in self.server.calls.items() if count != before.get(key, 0)}
+            steps[name] = {"rest_calls": sum(calls.values()), "routes": calls, "rate_limited": self.server.rate_limited - limited,
+                           "seconds": time.perf_counter() - start, "error": error}
+
+        state = {}
+
+        async def ticket_modal():
+            state["token"] = await self.click("ticket_modal_en")
+
+        async def ticket_submit():
+            await self.submit_modal(state["token"], ["Support", "Open a ticket below", "Open ticket", "blue"])
+
+        async def ticket_open():
+            panel = next((custom_id for message in self.server.messages[self.general_id].values() for row in message.get("components", [])
+                          for component in row.get("components", []) for custom_id in (component.get("custom_id", ""),) if custom_id.startswith("support_ticket_")), None)
+            if panel is None:
+                raise LookupError("no ticket panel was posted")
+            await self.click(panel, user=self.member)
+
+        async def ticket_close():
+            ticket_channel = next((channel_id for channel_id, channel in self.server.channels.items() if channel.get("name", "").startswith("ticket-")), None)
+            if ticket_channel is None:
+                raise LookupError("no ticket channel was created")
+            await self.say("$close", channel_id=ticket_channel)
+
+        async def ticket_panel_delete():
+            panel = next((message for message in self.server.messages[self.general_id].values() for row in message.get("components", [])
+                          for component in row.get("components", []) if component.get("custom_id", "").startswith("support_ticket_")), None)
+            if panel is None:
+                raise LookupError("no ticket panel was posted")
+            self.server.messages[self.general_id].pop(panel["id"])
+            self.dispatch("MESSAGE_DELETE", {"id": panel["id"], "channel_id": self.general_id, "guild_id": self.GUILD_ID})
+            await self.settle()
+            if int(panel["id"]) in ticket_panel_messages:
+                raise AssertionError("the deleted ticket panel was not pruned")
+
+        async def welcome_form():
+            state["welcome_token"] = await self.click("open_form_en")
+
+        async def welcome_submit():
+            if (self.server.interactions.get(state.get("welcome_token"), {}).get("callback") or {}).get("type") == 9:
+                await self.submit_modal(state["welcome_token"], ["Welcome!", "Hello <author>", "embed", "none", "green"])
+
+        await step("setlogchannel", lambda: self.say(f"$setlogchannel <#{self.general_id}>"))
+        await step("ticket/command", lambda: self.say("$ticket"))
+        await step("ticket/setup_button", ticket_modal)
+        await step("ticket/setup_submit", ticket_submit)
+        await step("ticket/open_button", ticket_open)
+        await step("ticket/close", ticket_close)
+        await step("ticket/panel_delete", ticket_panel_delete)
+        await step("welcome/setwelcomechannel", lambda: self.say(f"$setwelcomechannel <#{self.general_id}>"))
+        await step("welcome/setwelcomemessage", lambda: self.say("$setwelcomemessage"))
+        await step("welcome/form_button", welcome_form)
+        await step("welcome/form_submit", welcome_submit)
+
+        async def join():
+            self.member_join(FakeDiscordServer.user_payload(int(self.GUILD_ID) + 9, "newcomer"))
+
+        await step("welcome/member_join", join)
+        return steps
+
+# REST calls the bot may make to boot and for each step of RestFlowHarness.run_flows; raise one only in the change that needs the calls
+STARTUP_REST_CALL_BUDGET = 5
+REST_CALL_BUDGETS = {
+    "setlogchannel": 1,
+    "ticket/command": 1,
+    "ticket/setup_button": 1,
+    "ticket/setup_submit": 15,
+    "ticket/open_button": 5,
+    "ticket/close": 3,
+    "ticket/panel_delete": 0,
+    "welcome/setwelcomechannel": 1,
+    "welcome/setwelcomemessage": 1,
+    "welcome/form_button": 1,
+    "welcome/form_submit": 1,
+    "welcome/member_join": 3,
+}
+
+async def run_flow_report(rate_limit=5, rate_window=1.0):
+    server = FakeDiscordServer(rate_limit, rate_window)
+    harness = RestFlowHarness(server)
+    try:
+        async with bot:
+            await harness.connect()
+            startup = dict(server.calls)
+            steps = await harness.run_flows()
+    finally:
+        await server.stop()
+    return {"startup_rest_calls": sum(startup.values()), "steps": steps, "rate_limited": server.rate_limited, "unhandled_routes": dict(server.unhandled)}
+
+def rest_budget_problems(report):
+    problems = []
+    if report["startup_rest_calls"] > STARTUP_REST_CALL_BUDGET:
+        problems.append(f"startup: {report['startup_rest_calls']} REST calls vs budget {STARTUP_REST_CALL_BUDGET}")
+    for name, budget in REST_CALL_BUDGETS.items():
+        entry = report["steps"].get(name)
+        if entry is None:
+            problems.append(f"{name}: step did not run")
+        elif entry["rest_calls"] > budget:
+            problems.append(f"{name}: {entry['rest_calls']} REST calls vs budget {budget}")
+    return problems
@@ -0,0 +1,687 @@
+# tools/offline.py
+#
+# Offline benchmarks and regression gates for discord_bot. Run them as `python -m tools <tool> [options]` from the
+# repository root; nothing here connects to the gateway.
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from queue import SimpleQueue
+from unittest.mock import patch
+
+import discord_bot
+from discord_bot import (
+    CommandMetrics, JsonLinesFormatter, LOG_FORMAT, LogChannelConfig, TEXT_LOG_FORMAT, TicketJournal, WelcomeConfig, bot, catalog,
+    get_language, instrument_event_handlers, load_language_settings, loop_monitor, startup_report, t,
+)
+from tools.harness import (
+    FakeAuditEntry, FakeDiscordServer, FakeGuild, FakeGuildChannel, FakeMember, FakeMessage, FakeRole, FakeUser, FakeVoiceState,
+    ReplayGatewaySocket, ReplayLogChannels, RestFlowHarness, install_stub_rest, rest_budget_problems, run_flow_report,
+)
+
+import discord
+import pytz
+
+BENCHMARK_GUILD_ID = 1303629862011011082
+
+def build_log_handler_scenarios():
+    # One representative event per handler, built so every branch that produces an embed is taken
+    moderator = FakeUser(853642098931007509, "moderator")
+    guild = FakeGuild(BENCHMARK_GUILD_ID)
+    channel = FakeGuildChannel(BENCHMARK_GUILD_ID + 1, "general", guild)
+    author = FakeMember(BENCHMARK_GUILD_ID + 2, "author", guild)
+    message = FakeMessage(BENCHMARK_GUILD_ID + 3, channel, author, "hello world " * 8)
+    edited = FakeMessage(message.id, channel, author, "hello there " * 8)
+
+    member_guild = FakeGuild(BENCHMARK_GUILD_ID)
+    kept, added, removed = (FakeRole(BENCHMARK_GUILD_ID + 10 + i, name, member_guild) for i, name in enumerate(("member", "helper", "muted")))
+    member_before = FakeMember(BENCHMARK_GUILD_ID + 4, "member", member_guild, nick="old", roles=[kept, removed])
+    member_after = FakeMember(member_before.id, "member", member_guild, nick="new", roles=[kept, added])
+    member_guild.audit_entries.append(FakeAuditEntry(member_before, moderator))
+
+    voice_guild = FakeGuild(BENCHMARK_GUILD_ID)
+    voice_member = FakeMember(BENCHMARK_GUILD_ID + 5, "speaker", voice_guild)
+    voice_guild.audit_entries.append(FakeAuditEntry(voice_member, moderator))
+    lobby = FakeGuildChannel(BENCHMARK_GUILD_ID + 6, "lobby", voice_guild, channel_type=discord.ChannelType.voice)
+    stage = FakeGuildChannel(BENCHMARK_GUILD_ID + 7, "stage", voice_guild, channel_type=discord.ChannelType.voice)
+    voice_before = FakeVoiceState(lobby)
+    voice_after = FakeVoiceState(stage, mute=True, deaf=True)
+
+    channel_guild = FakeGuild(BENCHMARK_GUILD_ID)
+    everyone = FakeRole(BENCHMARK_GUILD_ID, "@everyone", channel_guild)
+    channel_before = FakeGuildChannel(BENCHMARK_GUILD_ID + 8, "rules", channel_guild, {everyone: discord.PermissionOverwrite(send_messages=True)})
+    channel_after = FakeGuildChannel(channel_before.id, "rules-and-info", channel_guild, {everyone: discord.PermissionOverwrite(send_messages=False, add_reactions=True)})
+    channel_guild.audit_entries.append(FakeAuditEntry(channel_before, moderator))
+
+    role_guild = FakeGuild(BENCHMARK_GUILD_ID)
+    role_before = FakeRole(BENCHMARK_GUILD_ID + 9, "staff", role_guild, discord.Permissions(manage_messages=True, kick_members=True))
+    role_after = FakeRole(role_before.id, "staff", role_guild, discord.Permissions(manage_messages=True, ban_members=True, mute_members=True))
+    role_guild.audit_entries.append(FakeAuditEntry(role_before, moderator))
+
+    return [
+        ("on_message_delete", discord_bot.on_message_delete, (message,)),
+        ("on_message_edit", discord_bot.on_message_edit, (message, edited)),
+        ("on_member_update", discord_bot.on_member_update, (member_before, member_after)),
+        ("on_voice_state_update", discord_bot.on_voice_state_update, (voice_member, voice_before, voice_after)),
+        ("on_guild_channel_update", discord_bot.on_guild_channel_update, (channel_before, channel_after)),
+        ("on_guild_role_update", discord_bot.on_guild_role_update, (role_before, role_after)),
+    ]
+
+def benchmark_log_handlers(events=2000, allocation_events=200):
+    sent = defaultdict(int)
+    failures = []
+
+    async def stub_log_action(guild, embed):
+        sent["embeds"] += 1
+        sent["fields"] += len(embed.fields)
+
+    async def stub_handle_exception(source, identifier, status, error=None):
+        if status == "Failure":
+            failures.append(f"{identifier}: {error!r}")
+
+    async def drive(handler, args, count):
+        for _ in range(count):
+            await handler(*args)
+
+    async def measure_allocations(handler, args, count):
+        peak_total = 0
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(count):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await handler(*args)
+            peak_total += tracemalloc.get_traced_memory()[1] - before
+        return peak_total / count, (tracemalloc.get_traced_memory()[0] - start) / count
+
+    results = {}
+    log_channels = {BENCHMARK_GUILD_ID: LogChannelConfig(BENCHMARK_GUILD_ID + 1, 853642098931007509, "")}
+    with (
+        patch.object(discord_bot, "log_action", stub_log_action),
+        patch.object(discord_bot, "handle_exception", stub_handle_exception),
+        patch.object(discord_bot, "log_channels", log_channels),
+    ):
+        for name, handler, args in build_log_handler_scenarios():
+            asyncio.run(drive(handler, args, min(events, 50)))
+            sent.clear()
+            start = time.perf_counter()
+            asyncio.run(drive(handler, args, events))
+            elapsed = time.perf_counter() - start
+            embeds_per_event = sent["embeds"] / events
+
+            tracemalloc.start()
+            try:
+                peak_bytes, retained_bytes = asyncio.run(measure_allocations(handler, args, allocation_events))
+            finally:
+                tracemalloc.stop()
+            results[name] = {
+                "events_per_second": events / elapsed if elapsed else float("inf"),
+                "microseconds_per_event": elapsed / events * 1_000_000,
+                "embeds_per_event": embeds_per_event,
+                "peak_bytes_per_event": peak_bytes,
+                "retained_bytes_per_event": retained_bytes,
+            }
+    return {"events": events, "allocation_events": allocation_events, "python": sys.version.split()[0], "handlers": results, "failures": failures}
+
+def compare_log_handler_benchmark(report, baseline, tolerance):
+    regressions = []
+    for name, entry in report["handlers"].items():
+        previous = baseline.get("handlers", {}).get(name)
+        if not previous:
+            continue
+        if entry["events_per_second"] < previous["events_per_second"] * (1 - tolerance):
+            regressions.append(f"{name}: {entry['events_per_second']:,.0f} events/s vs baseline {previous['events_per_second']:,.0f}")
+        if entry["peak_bytes_per_event"] > previous["peak_bytes_per_event"] * (1 + tolerance):
+            regressions.append(f"{name}: {entry['peak_bytes_per_event']:,.0f} peak bytes/event vs baseline {previous['peak_bytes_per_event']:,.0f}")
+        if entry["embeds_per_event"] != previous["embeds_per_event"]:
+            regressions.append(f"{name}: {entry['embeds_per_event']:g} embeds/event vs baseline {previous['embeds_per_event']:g}")
+    return regressions
+
+def run_log_handler_benchmark(argv):
+    parser = argparse.ArgumentParser(prog="python -m tools bench-log-handlers", description="Benchmark the Logs Channel event handlers offline.")
+    parser.add_argument("--events", type=int, default=2000, help="timed events per handler")
+    parser.add_argument("--allocation-events", type=int, default=200, help="events per handler measured under tracemalloc")
+    parser.add_argument("--baseline", help="fail when results regress against this JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression (default 0.25)")
+    parser.add_argument("--output", help="write the JSON report here, e.g. to record a new baseline")
+    args = parser.parse_args(argv)
+
+    report = benchmark_log_handlers(args.events, args.allocation_events)
+    print(f"{'handler':<26}{'events/s':>11}{'us/event':>10}{'embeds':>8}{'peak B':>9}{'kept B':>8}")
+    for name, entry in report["handlers"].items():
+        print(
+            f"{name:<26}{entry['events_per_second']:>11,.0f}{entry['microseconds_per_event']:>10.1f}{entry['embeds_per_event']:>8g}"
+            f"{entry['peak_bytes_per_event']:>9,.0f}{entry['retained_bytes_per_event']:>8,.0f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    problems = [f"handler failed: {failure}" for failure in report["failures"][:10]]
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            problems += compare_log_handler_benchmark(report, json.load(file), args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+def read_gateway_trace(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            if "event" in record:
+                yield record
+
+async def replay_gateway_trace(path, speed=1.0, rest_latency=0.0, log_all_guilds=True, drain_timeout=30.0):
+    loop = asyncio.get_running_loop()
+    latencies = defaultdict(list)
+    stats = {"events": 0, "unknown_events": 0, "parse_errors": 0, "dispatched": 0, "in_flight": 0, "max_in_flight": 0, "max_behind": 0.0}
+    clock = {"due": loop.time()}
+    pending = set()
+
+    original_schedule = bot._schedule_event
+
+    def schedule_event(coro, event_name, *args, **kwargs):
+        task = original_schedule(coro, event_name, *args, **kwargs)
+        due = clock["due"]
+        stats["dispatched"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        pending.add(task)
+
+        def finished(task):
+            stats["in_flight"] -= 1
+            pending.discard(task)
+            latencies[event_name].append(loop.time() - due)
+
+        task.add_done_callback(finished)
+        return task
+
+    bot._schedule_event = schedule_event
+    bot.ws = ReplayGatewaySocket()
+    bot._connection._chunk_guilds = False
+    rest = install_stub_rest(rest_latency)
+    replay_patches = contextlib.ExitStack()
+    if log_all_guilds:
+        replay_patches.enter_context(patch.object(discord_bot, "log_channels", ReplayLogChannels()))
+    instrument_event_handlers()
+    loop_monitor.start()
+
+    parsers = bot._connection.parsers
+    start = loop.time()
+    try:
+        for record in read_gateway_trace(path):
+            due = start + record["t"] / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # The real gateway yields between frames, so handlers still interleave when the replay falls behind
+                stats["max_behind"] = max(stats["max_behind"], -delay)
+                await asyncio.sleep(0)
+            parser = parsers.get(record["event"])
+            stats["events"] += 1
+            if parser is None:
+                stats["unknown_events"] += 1
+                continue
+            clock["due"] = due
+            try:
+                parser(record["d"])
+            except Exception as e:
+                stats["parse_errors"] += 1
+                logging.debug(f"[replay] {record['event']} failed to parse: {e}")
+        input_seconds = loop.time() - start
+        if pending:
+            await asyncio.wait(set(pending), timeout=drain_timeout)
+        wall_seconds = loop.time() - start
+        ready_task = bot._connection._ready_task
+        if ready_task is not None and not ready_task.done():
+            # on_ready is dispatched once discord.py stops waiting for GUILD_CREATEs, so let it run as part of the replay
+            await asyncio.wait({ready_task}, timeout=drain_timeout)
+            if pending:
+                await asyncio.wait(set(pending), timeout=drain_timeout)
+    finally:
+        loop_monitor.stop()
+        bot._schedule_event = original_schedule
+        replay_patches.close()
+
+    lag = loop_monitor.summary()
+    percentile = CommandMetrics._percentile
+    all_latencies = sorted(value for values in latencies.values() for value in values)
+    return {
+        "trace": path,
+        "speed": speed,
+        "rest_latency_ms": rest_latency * 1000,
+        "events": stats["events"],
+        "unknown_events": stats["unknown_events"],
+        "parse_errors": stats["parse_errors"],
+        "handler_runs": stats["dispatched"],
+        "unfinished": len(pending),
+        "input_seconds": input_seconds,
+        "wall_seconds": wall_seconds,
+        "events_per_second": stats["events"] / wall_seconds if wall_seconds else 0.0,
+        "max_in_flight": stats["max_in_flight"],
+        "max_behind_schedule_ms": stats["max_behind"] * 1000,
+        "loop_lag_p99_ms": lag["lag_p99"] * 1000,
+        "rest_calls": rest.calls,
+        "latency_ms": {"p50": percentile(all_latencies, 0.50) * 1000, "p95": percentile(all_latencies, 0.95) * 1000,
+                       "p99": percentile(all_latencies, 0.99) * 1000, "max": (all_latencies[-1] if all_latencies else 0.0) * 1000},
+        "by_event": {
+            name: {"count": len(values), "p50_ms": percentile(ordered, 0.50) * 1000, "p99_ms": percentile(ordered, 0.99) * 1000, "max_ms": ordered[-1] * 1000}
+            for name, values in latencies.items()
+            for ordered in (sorted(values),)
+        },
+    }
+
+def run_gateway_replay(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m tools replay-trace",
+        description="Replay a recorded gateway trace against the bot's handlers with REST stubbed out. "
+                    "Data paths are relative to the working directory, so run it from a scratch directory.",
+    )
+    parser.add_argument("trace", help="NDJSON trace written by $gatewaytrace or GATEWAY_TRACE_FILE")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier, 1 to 100 (default 1)")
+    parser.add_argument("--rest-latency-ms", type=float, default=0.0, help="simulated latency of each stubbed REST call")
+    parser.add_argument("--configured-log-channels", action="store_true", help="only log for guilds configured in the local data instead of every guild")
+    parser.add_argument("--output", help="write the JSON report here to compare builds")
+    parser.add_argument("--baseline", help="fail when p99 latency, REST calls or throughput regress against this report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression (default 0.25)")
+    args = parser.parse_args(argv)
+    if not 1 <= args.speed <= 100:
+        parser.error("--speed must be between 1 and 100")
+
+    async def run():
+        async with bot:
+            return await replay_gateway_trace(args.trace, args.speed, args.rest_latency_ms / 1000, not args.configured_log_channels)
+
+    report = asyncio.run(run())
+    latency = report["latency_ms"]
+    print(
+        f"{report['events']} events at {report['speed']:g}x in {report['wall_seconds']:.2f}s ({report['events_per_second']:,.0f}/s) | "
+        f"{report['handler_runs']} handler runs | {report['rest_calls']} REST calls | unknown {report['unknown_events']} | parse errors {report['parse_errors']}"
+    )
+    print(
+        f"latency p50 {latency['p50']:.1f} ms | p95 {latency['p95']:.1f} ms | p99 {latency['p99']:.1f} ms | max {latency['max']:.1f} ms | "
+        f"max in flight {report['max_in_flight']} | max behind schedule {report['max_behind_schedule_ms']:.1f} ms | loop lag p99 {report['loop_lag_p99_ms']:.1f} ms"
+    )
+    print(f"{'event':<28}{'count':>8}{'p50':>10}{'p99':>10}{'max':>10}")
+    for name, entry in sorted(report["by_event"].items(), key=lambda item: -item[1]["count"]):
+        print(f"{name[:27]:<28}{entry['count']:>8}{entry['p50_ms']:>8.1f}ms{entry['p99_ms']:>8.1f}ms{entry['max_ms']:>8.1f}ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    problems = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if latency["p99"] > baseline["latency_ms"]["p99"] * (1 + args.tolerance):
+            problems.append(f"p99 latency {latency['p99']:.1f} ms vs baseline {baseline['latency_ms']['p99']:.1f} ms")
+        if report["rest_calls"] > baseline["rest_calls"]:
+            problems.append(f"{report['rest_calls']} REST calls vs baseline {baseline['rest_calls']}")
+        if report["events_per_second"] < baseline["events_per_second"] * (1 - args.tolerance):
+            problems.append(f"{report['events_per_second']:,.0f} events/s vs baseline {baseline['events_per_second']:,.0f}")
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+def run_rest_flows(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m tools rest-flows",
+        description="Run ticket, log channel and welcome flows end to end against a local fake Discord REST server, "
+                    "on a temporary data directory.",
+    )
+    parser.add_argument("--rate-limit", default="5/1", help="requests per bucket per window in seconds (default 5/1)")
+    parser.add_argument("--output", help="write the JSON report here, e.g. to record a new baseline")
+    parser.add_argument("--baseline", help="fail when any step makes more REST calls than in this report")
+    args = parser.parse_args(argv)
+    limit, _, window = args.rate_limit.partition("/")
+
+    report = asyncio.run(run_flow_report(int(limit), float(window or 1)))
+    print(f"startup: {report['startup_rest_calls']} REST calls | 429s served: {report['rate_limited']}")
+    print(f"{'step':<30}{'rest':>6}{'429':>5}{'time':>9}  result")
+    for name, entry in report["steps"].items():
+        print(f"{name:<30}{entry['rest_calls']:>6}{entry['rate_limited']:>5}{entry['seconds']:>8.2f}s  {entry['error'] or 'ok'}")
+    for route, count in report["unhandled_routes"].items():
+        print(f"unhandled route {route} x{count}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    problems = [f"{name}: {entry['error']}" for name, entry in report["steps"].items() if entry["error"]]
+    problems += rest_budget_problems(report)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        for name, entry in report["steps"].items():
+            previous = baseline["steps"].get(name)
+            if previous and entry["rest_calls"] > previous["rest_calls"]:
+                problems.append(f"{name}: {entry['rest_calls']} REST calls vs baseline {previous['rest_calls']}")
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+def compare_startup_benchmark(report, baseline, tolerance, floor=0.05):
+    # Small phases are all noise, so a phase only regresses when it is slower by the tolerance and by the floor in seconds
+    problems = []
+
+    def slower(name, seconds, previous):
+        if seconds > previous * (1 + tolerance) and seconds - previous > floor:
+            problems.append(f"{name}: {seconds:.3f}s vs baseline {previous:.3f}s")
+
+    slower("total", report["total_seconds"], baseline["total_seconds"])
+    for name, phase in report["phases"].items():
+        previous = baseline["phases"].get(name)
+        if previous is None:
+            continue
+        slower(name, phase["seconds"], previous["seconds"])
+        if phase["rest_calls"] > previous["rest_calls"]:
+            problems.append(f"{name}: {phase['rest_calls']} REST calls vs baseline {previous['rest_calls']}")
+    return problems
+
+def run_startup_benchmark(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m tools bench-startup",
+        description="Boot the bot against a local fake Discord REST server with many guilds and ticket panels and report "
+                    "the startup timeline. It runs on a temporary data directory.",
+    )
+    parser.add_argument("--guilds", type=int, default=25, help="guilds in READY (default 25)")
+    parser.add_argument("--ticket-panels", type=int, default=50, help="ticket panels to reconnect, spread over the guilds (default 50)")
+    parser.add_argument("--latency", type=float, default=50.0, help="milliseconds the fake server waits before each response (default 50)")
+    parser.add_argument("--rate-limit", default="5/1", help="requests per bucket per window in seconds (default 5/1)")
+    parser.add_argument("--output", help="write the JSON report here, e.g. to record a new baseline")
+    parser.add_argument("--baseline", help="fail when the total or a phase is slower, or a phase makes more REST calls, than in this report")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown against the baseline as a fraction (default 0.5)")
+    args = parser.parse_args(argv)
+    limit, _, window = args.rate_limit.partition("/")
+
+    async def run():
+        server = FakeDiscordServer(int(limit), float(window or 1), latency=args.latency / 1000)
+        harness = RestFlowHarness(server, guilds=args.guilds, ticket_panels=args.ticket_panels)
+        try:
+            async with bot:
+                await harness.connect()
+        finally:
+            await server.stop()
+        report = startup_report.as_dict()
+        report.update({"rest_calls": sum(server.calls.values()), "rate_limited": server.rate_limited, "latency_ms": args.latency,
+                       "unhandled_routes": dict(server.unhandled)})
+        return report
+
+    report = asyncio.run(run())
+    print(f"startup: {report['total_seconds']:.2f}s to startup complete | {report['guilds']} guilds | {report['ticket_panels']} ticket panels | "
+          f"{report['rest_calls']} REST calls | 429s served: {report['rate_limited']} | {report['latency_ms']:.0f} ms latency")
+    print(f"{'mark':<28}{'at':>9}")
+    for name, seconds in sorted(report["marks"].items(), key=lambda item: item[1]):
+        print(f"{name:<28}{seconds:>8.3f}s")
+    print(f"{'phase':<28}{'time':>9}{'rest':>6}")
+    for name, phase in report["phases"].items():
+        print(f"{name:<28}{phase['seconds']:>8.3f}s{phase['rest_calls']:>6}")
+    print(f"{'import':<28}{'time':>9}")
+    for name, seconds in sorted(report["imports"].items(), key=lambda item: -item[1]):
+        print(f"{name:<28}{seconds:>8.3f}s")
+    for route, count in report["unhandled_routes"].items():
+        print(f"unhandled route {route} x{count}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    problems = []
+    if "startup_complete" not in report["marks"]:
+        problems.append("startup did not complete")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            problems += compare_startup_benchmark(report, json.load(file), args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+# Language lookups: re-reading storage vs. the in-memory cache
+def benchmark_language_lookup(iterations=10000):
+    guild_ids = list(discord_bot.language_settings_cache or {}) or [0]
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        load_language_settings().get(guild_ids[i % len(guild_ids)], "en")
+    disk_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        get_language(guild_ids[i % len(guild_ids)])
+    cached_elapsed = time.perf_counter() - start
+
+    return {
+        "iterations": iterations,
+        "disk_per_second": iterations / disk_elapsed if disk_elapsed else float("inf"),
+        "cached_per_second": iterations / cached_elapsed if cached_elapsed else float("inf"),
+    }
+
+# Per-event localization overhead: inline translation tables vs. the shared catalog
+def benchmark_localization(iterations=10000, event="member_update"):
+    guild_ids = list(discord_bot.language_settings_cache or {}) or [0]
+    inline_keys = list(catalog.get("en", f"log.{event}"))
+    keys = [f"log.{event}.{key}" for key in inline_keys]
+    source_tables = {lang: catalog.get(lang, f"log.{event}") for lang in catalog.available_languages()}
+
+    # Rebuilding every table per call reproduces what each handler's inline dict literal used to do on every event.
+    def build_inline_table():
+        return {lang: dict(texts) for lang, texts in source_tables.items()}
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        language = get_language(guild_ids[i % len(guild_ids)])
+        language_settings = build_inline_table()
+        settings = language_settings.get(language, language_settings["en"])
+        for key in inline_keys:
+            settings[key]
+    inline_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        guild_id = guild_ids[i % len(guild_ids)]
+        for key in keys:
+            t(guild_id, key)
+    catalog_elapsed = time.perf_counter() - start
+
+    inline_table = build_inline_table()
+    return {
+        "iterations": iterations,
+        "event": event,
+        "inline_us": inline_elapsed / iterations * 1e6,
+        "catalog_us": catalog_elapsed / iterations * 1e6,
+        "inline_bytes": sys.getsizeof(inline_table) + sum(sys.getsizeof(texts) for texts in inline_table.values()),
+    }
+
+# Logging throughput with an artificially slow disk: direct handler vs. queue + background listener
+class SlowDiskHandler(logging.FileHandler):
+    def __init__(self, path, delay_ms):
+        super().__init__(path, encoding="utf-8", delay=True)
+        self.delay_seconds = delay_ms / 1000
+
+    def emit(self, record):
+        time.sleep(self.delay_seconds)
+        super().emit(record)
+        self.flush()
+
+def benchmark_logging(records=2000, delay_ms=2.0):
+    results = {"records": records, "delay_ms": delay_ms}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for mode in ("direct", "queued"):
+            bench_logger = logging.getLogger(f"benchmark.logging.{mode}")
+            bench_logger.propagate = False
+            bench_logger.setLevel(logging.INFO)
+            handler = SlowDiskHandler(os.path.join(tmpdir, f"{mode}.log"), delay_ms)
+            handler.setFormatter(JsonLinesFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_LOG_FORMAT))
+            listener = None
+            if mode == "queued":
+                bench_queue = SimpleQueue()
+                listener = logging.handlers.QueueListener(bench_queue, handler)
+                listener.start()
+                bench_logger.addHandler(logging.handlers.QueueHandler(bench_queue))
+            else:
+                bench_logger.addHandler(handler)
+
+            start = time.perf_counter()
+            for i in range(records):
+                bench_logger.info(f"[benchmark] Command 'ping' SUCCESS | record {i}")
+            elapsed = time.perf_counter() - start
+            if listener:
+                drain_start = time.perf_counter()
+                listener.stop()
+                results["queued_drain_seconds"] = time.perf_counter() - drain_start
+            for bench_handler in list(bench_logger.handlers):
+                bench_logger.removeHandler(bench_handler)
+            handler.close()
+            results[f"{mode}_per_second"] = records / elapsed if elapsed else float("inf")
+    return results
+
+# Guild settings memory: legacy JSON-shaped dicts vs. slotted records
+def benchmark_settings_memory(guilds=50000):
+    title, desc, message_type, image_url, color = "Welcome!", "Hello <author>", "embed", "author", "#00FF00"
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    base_id = 1303629862011011082
+
+    def measure(build):
+        tracemalloc_was_running = tracemalloc.is_tracing()
+        if not tracemalloc_was_running:
+            tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        data = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+        if not tracemalloc_was_running:
+            tracemalloc.stop()
+        del data
+        return used
+
+    legacy_welcome = lambda: {
+        str(base_id + i): {
+            "channel_id": base_id + i,
+            "user_id": base_id,
+            "welcome_message": {"title": title, "desc": desc, "type": message_type, "image_url": image_url, "color": color},
+            "timestamp": timestamp
+        }
+        for i in range(guilds)
+    }
+    record_welcome = lambda: {
+        base_id + i: WelcomeConfig(base_id + i, base_id, title, desc, message_type, image_url, color, timestamp)
+        for i in range(guilds)
+    }
+    legacy_log = lambda: {
+        str(base_id + i): {"channel_id": base_id + i, "user_id": base_id, "timestamp": timestamp}
+        for i in range(guilds)
+    }
+    record_log = lambda: {base_id + i: LogChannelConfig(base_id + i, base_id, timestamp) for i in range(guilds)}
+
+    return {
+        "guilds": guilds,
+        "welcome_dict_bytes": measure(legacy_welcome),
+        "welcome_record_bytes": measure(record_welcome),
+        "log_dict_bytes": measure(legacy_log),
+        "log_record_bytes": measure(record_log),
+    }
+
+# Ticket journal append and replay throughput
+def benchmark_ticket_journal_replay(records=100000):
+    sample = {
+        "user_id": 853642098931007509,
+        "guild_id": 1303629862011011082,
+        "channel_id": 1303629862011011083,
+        "message_id": 1303629862011011084,
+        "created_at": datetime.now(pytz.UTC).isoformat(),
+        "title": "Support",
+        "description": "Click the button below to open a ticket.",
+        "button_label": "Open Ticket",
+        "category_id": 1303629862011011085
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        journal = TicketJournal(os.path.join(directory, "ticket_panels.ndjson"))
+        start = time.perf_counter()
+        for i in range(records):
+            journal.append("create", f"bench-{i}", sample)
+        append_elapsed = time.perf_counter() - start
+        journal.close()
+
+        panels = {}
+        start = time.perf_counter()
+        journal.replay(panels)
+        replay_elapsed = time.perf_counter() - start
+        size = os.path.getsize(journal.path)
+
+    return {
+        "records": records,
+        "append_seconds": append_elapsed,
+        "replay_seconds": replay_elapsed,
+        "replay_per_second": records / replay_elapsed if replay_elapsed else float("inf"),
+        "journal_bytes": size,
+    }
+
+def micro_benchmark_tool(name, benchmark, description, options, summary):
+    # These used to be live developer commands; they churn memory and the storage lock, so they only run offline now
+    def run(argv):
+        parser = argparse.ArgumentParser(prog=f"python -m tools {name}", description=description)
+        for flag, settings in options.items():
+            parser.add_argument(flag, **settings)
+        parser.add_argument("--output", help="write the JSON result here")
+        args = parser.parse_args(argv)
+        parameters = {key: value for key, value in vars(args).items() if key != "output"}
+        result = benchmark(**parameters)
+        print(summary(result))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(result, file, indent=2)
+        return 0
+    return run
+
+MICRO_BENCHMARKS = {
+    "bench-language": micro_benchmark_tool(
+        "bench-language", benchmark_language_lookup,
+        "Language lookups re-reading storage vs. the in-memory cache, over the guilds in the working directory's data.",
+        {"--iterations": {"type": int, "default": 10000}},
+        lambda result: f"{result['iterations']} lookups | disk: {result['disk_per_second']:,.0f}/s | cached: {result['cached_per_second']:,.0f}/s",
+    ),
+    "bench-localization": micro_benchmark_tool(
+        "bench-localization", benchmark_localization,
+        "Per-event cost of inline translation tables vs. the shared catalog.",
+        {"--iterations": {"type": int, "default": 10000}, "--event": {"default": "member_update", "choices": list(catalog.get("en", "log"))}},
+        lambda result: f"{result['event']} x{result['iterations']} | inline tables: {result['inline_us']:.2f} us/event | "
+                       f"catalog: {result['catalog_us']:.2f} us/event | dicts built per event: {result['inline_bytes']} B -> 0 B",
+    ),
+    "bench-logging": micro_benchmark_tool(
+        "bench-logging", benchmark_logging,
+        "Logging throughput against an artificially slow disk: direct handler vs. queue and background listener.",
+        {"--records": {"type": int, "default": 2000}, "--delay-ms": {"type": float, "default": 2.0}},
+        lambda result: f"{result['records']} log calls @ {result['delay_ms']} ms/write | direct: {result['direct_per_second']:,.0f}/s | "
+                       f"queued: {result['queued_per_second']:,.0f}/s (background drain {result['queued_drain_seconds']:.1f}s)",
+    ),
+    "bench-settings-memory": micro_benchmark_tool(
+        "bench-settings-memory", benchmark_settings_memory,
+        "Memory of guild settings as JSON-shaped dicts vs. slotted records, measured with tracemalloc.",
+        {"--guilds": {"type": int, "default": 50000}},
+        lambda result: f"{result['guilds']} guilds | welcome: dicts {result['welcome_dict_bytes'] / 1024 / 1024:.1f} MiB -> "
+                       f"records {result['welcome_record_bytes'] / 1024 / 1024:.1f} MiB | log channels: dicts {result['log_dict_bytes'] / 1024 / 1024:.1f} MiB -> "
+                       f"records {result['log_record_bytes'] / 1024 / 1024:.1f} MiB",
+    ),
+    "bench-journal": micro_benchmark_tool(
+        "bench-journal", benchmark_ticket_journal_replay,
+        "Ticket journal append and replay throughput in a temporary directory.",
+        {"--records": {"type": int, "default": 100000}},
+        lambda result: f"{result['records']} records ({result['journal_bytes'] / 1024 / 1024:.1f} MiB) | append: {result['append_seconds']:.2f}s | "
+                       f"replay: {result['replay_seconds']:.2f}s ({result['replay_per_second']:,.0f}/s)",
+    ),
+}
+
+OFFLINE_TOOLS = {
+    "bench-log-handlers": run_log_handler_benchmark,
+    "replay-trace": run_gateway_replay,
+    "rest-flows": run_rest_flows,
+    "bench-startup": run_startup_benchmark,
+    **MICRO_BENCHMARKS,
+}